@@ -47,6 +47,7 @@ except ImportError:
     print('Failed to import graph-tool.  PlannerData will not be analyzed or plotted')
     graphtool = False
 
+import numpy as np
 try:
     from ompl import base as ob
     from ompl import geometric as og
@@ -68,15 +69,18 @@ def isStateValid(state):
     return True
 
 def useGraphTool(pd):
-    # Extract the graphml representation of the planner data
-    graphml = pd.printGraphML()
-    f = open("graph.graphml", 'w')
-    f.write(graphml)
-    f.close()
-
-    # Load the graphml data using graph-tool
-    graph = gt.load_graph("graph.graphml", fmt="xml")
-    edgeweights = graph.edge_properties["weight"]
+    # Extract the vertex states, the edges in compressed sparse row format and
+    # the start/goal masks of the planner data with a single call
+    _, (weights, indices, indptr), isStart, isGoal = pd.toArrays()
+
+    # Build the corresponding graph-tool graph
+    graph = gt.Graph(directed=True)
+    graph.add_vertex(len(isStart))
+    sources = np.repeat(np.arange(len(isStart)), np.diff(indptr))
+    graph.add_edge_list(np.column_stack((sources, indices)))
+    edgeweights = graph.new_edge_property("double")
+    edgeweights.a = weights
+    graph.edge_properties["weight"] = edgeweights
 
     # Write some interesting statistics
     avgdeg, stddevdeg = gt.vertex_average(graph, "total")
@@ -108,11 +112,11 @@ def useGraphTool(pd):
     for v in range(graph.num_vertices()):
 
         # Color and size vertices by type: start, goal, other
-        if pd.isStartVertex(v):
+        if isStart[v]:
             start = v
             colorprops[graph.vertex(v)] = "cyan"
             vertexsize[graph.vertex(v)] = 10
-        elif pd.isGoalVertex(v):
+        elif isGoal[v]:
             goal = v
             colorprops[graph.vertex(v)] = "green"
             vertexsize[graph.vertex(v)] = 10
@@ -49,7 +49,6 @@ except ImportError:
     from ompl import util as ou
     from ompl import base as ob
     from ompl import geometric as og
-from functools import partial
 
 class Plane2DEnvironment:
     def __init__(self, ppm_file):
@@ -62,12 +61,13 @@ class Plane2DEnvironment:
         self.maxHeight_ = self.ppm_.getHeight() - 1
         self.ss_ = og.SimpleSetup(space)
 
-        # set state validity checking for this space
-        self.ss_.setStateValidityChecker(ob.StateValidityCheckerFn(
-            partial(Plane2DEnvironment.isStateValid, self)))
+        # set state validity checking for this space; the light pixels of the
+        # image are free, and states and motions are checked without calling
+        # back into Python
+        si = self.ss_.getSpaceInformation()
+        self.ss_.setStateValidityChecker(ob.OccupancyGridValidityChecker(si, self.ppm_))
+        si.setMotionValidator(ob.OccupancyGridMotionValidator(si))
         space.setup()
-        self.ss_.getSpaceInformation().setStateValidityCheckingResolution( \
-            1.0 / space.getMaximumExtent())
         #      self.ss_.setPlanner(og.RRTConnect(self.ss_.getSpaceInformation()))
 
     def plan(self, start_row, start_col, goal_row, goal_col):
@@ -101,9 +101,10 @@ class Plane2DEnvironment:
             return
         p = self.ss_.getSolutionPath()
         p.interpolate()
-        for i in range(p.getStateCount()):
-            w = min(self.maxWidth_, int(p.getState(i)[0]))
-            h = min(self.maxHeight_, int(p.getState(i)[1]))
+        # convert all states to a numpy array at once
+        for x, y in p.toArray():
+            w = min(self.maxWidth_, int(x))
+            h = min(self.maxHeight_, int(y))
             c = self.ppm_.getPixel(h, w)
             c.red = 255
             c.green = 0
@@ -114,13 +115,6 @@ class Plane2DEnvironment:
             return
         self.ppm_.saveFile(filename)
 
-    def isStateValid(self, state):
-        w = min(int(state[0]), self.maxWidth_)
-        h = min(int(state[1]), self.maxHeight_)
-
-        c = self.ppm_.getPixel(h, w)
-        return c.red > 127 and c.green > 127 and c.blue > 127
-
 
 if __name__ == "__main__":
     fname = join(join(join(join(dirname(dirname(abspath(__file__))), \
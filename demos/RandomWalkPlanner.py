@@ -84,6 +84,9 @@ class RandomWalkPlanner(ob.Planner):
                 if dist < approxdif:
                     approxdif = dist
                     approxsol = len(self.states_)
+            else:
+                # recycle the rejected sample
+                si.freeState(rstate)
         solved = False
         approximate = False
         if not solution:
@@ -129,6 +132,8 @@ def plan():
     goal()[1] = 1.
     goal()[2] = 1.
     ss.setStartAndGoalStates(start, goal, .05)
+    # reuse the memory of freed states instead of allocating new states
+    ss.getSpaceInformation().setStatePoolCapacity(100)
     # set the planner
     planner = RandomWalkPlanner(ss.getSpaceInformation())
     ss.setPlanner(planner)
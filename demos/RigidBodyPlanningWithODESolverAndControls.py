@@ -38,6 +38,10 @@
 
 from math import sin, cos, tan
 from functools import partial
+try:
+    import numpy as np
+except ImportError:
+    np = None
 try:
     from ompl import base as ob
     from ompl import control as oc
@@ -58,6 +62,15 @@ def kinematicCarODE(q, u, qdot):
     qdot[1] = u[0] * sin(theta)
     qdot[2] = u[0] * tan(u[1]) / carLength
 
+def kinematicCarODEVectorized(q, u):
+    # the same ODE for ODENumPySolver; q and u contain one state and control
+    # per row
+    carLength = 0.2
+    qdot = np.empty_like(q)
+    qdot[:, 0] = u[:, 0] * np.cos(q[:, 2])
+    qdot[:, 1] = u[:, 0] * np.sin(q[:, 2])
+    qdot[:, 2] = u[:, 0] * np.tan(u[:, 1]) / carLength
+    return qdot
 
 def isStateValid(spaceInformation, state):
     # perform collision checking or check if other constraints are
@@ -87,9 +100,15 @@ def plan():
     ss = oc.SimpleSetup(cspace)
     validityChecker = ob.StateValidityCheckerFn(partial(isStateValid, ss.getSpaceInformation()))
     ss.setStateValidityChecker(validityChecker)
-    ode = oc.ODE(kinematicCarODE)
-    odeSolver = oc.ODEBasicSolver(ss.getSpaceInformation(), ode)
-    propagator = oc.ODESolver.getStatePropagator(odeSolver)
+    if np is not None:
+        # integrate all states that are propagated together with a single
+        # call to the vectorized ODE per integration step
+        odeSolver = oc.ODENumPySolver(ss.getSpaceInformation(), kinematicCarODEVectorized)
+        propagator = odeSolver.getStatePropagator()
+    else:
+        ode = oc.ODE(kinematicCarODE)
+        odeSolver = oc.ODEBasicSolver(ss.getSpaceInformation(), ode)
+        propagator = oc.ODESolver.getStatePropagator(odeSolver)
     ss.setStatePropagator(propagator)
 
     # create a start state
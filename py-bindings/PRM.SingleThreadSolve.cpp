@@ -1,148 +0,0 @@
-/*********************************************************************
-* Software License Agreement (BSD License)
-*
-*  Copyright (c) 2011, Rice University
-*  All rights reserved.
-*
-*  Redistribution and use in source and binary forms, with or without
-*  modification, are permitted provided that the following conditions
-*  are met:
-*
-*   * Redistributions of source code must retain the above copyright
-*     notice, this list of conditions and the following disclaimer.
-*   * Redistributions in binary form must reproduce the above
-*     copyright notice, this list of conditions and the following
-*     disclaimer in the documentation and/or other materials provided
-*     with the distribution.
-*   * Neither the name of the Rice University nor the names of its
-*     contributors may be used to endorse or promote products derived
-*     from this software without specific prior written permission.
-*
-*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
-*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
-*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
-*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
-*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
-*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
-*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
-*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
-*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
-*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
-*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
-*  POSSIBILITY OF SUCH DAMAGE.
-*********************************************************************/
-
-/* Author: Ioan Sucan, James D. Marble */
-
-ompl::base::PlannerStatus PRM_wrapper::default_solve(const ompl::base::PlannerTerminationCondition& ptc)
-{
-    using namespace ompl;
-
-    checkValidity();
-
-    static const unsigned int MAX_RANDOM_BOUNCE_STEPS   = 5;
-    auto *goal = dynamic_cast<base::GoalSampleableRegion*>(pdef_->getGoal().get());
-
-    if (!goal)
-    {
-        OMPL_ERROR("%s: Unknown type of goal", getName().c_str());
-        return base::PlannerStatus::UNRECOGNIZED_GOAL_TYPE;
-    }
-
-    // Add the valid start states as milestones
-    while (const base::State *st = pis_.nextStart())
-        startM_.push_back(addMilestone(si_->cloneState(st)));
-
-    if (startM_.empty())
-    {
-        OMPL_ERROR("%s: There are no valid initial states!", getName().c_str());
-        return base::PlannerStatus::INVALID_START;
-    }
-
-    if (!goal->couldSample())
-    {
-        OMPL_ERROR("%s: Insufficient states in sampleable goal region", getName().c_str());
-        return base::PlannerStatus::INVALID_GOAL;
-    }
-
-    // Ensure there is at least one valid goal state
-    if (goal->maxSampleCount() > goalM_.size() || goalM_.empty())
-    {
-        const base::State *st = goalM_.empty() ? pis_.nextGoal(ptc) : pis_.nextGoal();
-        if (st != nullptr)
-            goalM_.push_back(addMilestone(si_->cloneState(st)));
-
-        if (goalM_.empty())
-        {
-            OMPL_ERROR("%s: Unable to find any valid goal states", getName().c_str());
-            return base::PlannerStatus::INVALID_GOAL;
-        }
-    }
-
-    if (!sampler_)
-        sampler_ = si_->allocValidStateSampler();
-    if (!simpleSampler_)
-        simpleSampler_ = si_->allocStateSampler();
-
-    unsigned long int nrStartStates = boost::num_vertices(g_);
-    OMPL_INFORM("%s: Starting planning with %lu states already in datastructure", getName().c_str(), nrStartStates);
-
-    std::vector<base::State*> xstates(MAX_RANDOM_BOUNCE_STEPS);
-    si_->allocStates(xstates);
-    bool grow = true;
-
-    // Reset addedNewSolution_ member
-    addedNewSolution_ = false;
-    base::PathPtr sol;
-    sol.reset();
-
-    double roadmap_build_time = 0.05;
-    while (ptc == false && !addedNewSolution_)
-    {
-        // Check for any new goal states
-        if (goal->maxSampleCount() > goalM_.size())
-        {
-            const base::State *st = pis_.nextGoal();
-            if (st)
-                goalM_.push_back(addMilestone(si_->cloneState(st)));
-        }
-
-        // maintain a 2:1 ratio for growing/expansion of roadmap
-        // call growRoadmap() twice as long for every call of expandRoadmap()
-        if (grow)
-            ompl::geometric::PRM::growRoadmap(base::plannerOrTerminationCondition(ptc, base::timedPlannerTerminationCondition(2.0*roadmap_build_time)), xstates[0]);
-        else
-            ompl::geometric::PRM::expandRoadmap(base::plannerOrTerminationCondition(ptc, base::timedPlannerTerminationCondition(roadmap_build_time)), xstates);
-        grow = !grow;
-
-        // Check for a solution
-        addedNewSolution_ = maybeConstructSolution (startM_, goalM_, sol);
-    }
-
-    OMPL_INFORM("%s: Created %u states", getName().c_str(), boost::num_vertices(g_) - nrStartStates);
-
-    if (sol)
-    {
-        base::PlannerSolution psol(sol);
-        psol.setPlannerName(getName());
-        // if the solution was optimized, we mark it as such
-        psol.setOptimized(opt_, bestCost_, addedNewSolution());
-        pdef_->addSolutionPath(psol);
-    }
-    else
-    {
-        // Return an approximate solution.
-        ompl::base::Cost diff = ompl::geometric::PRM::constructApproximateSolution(startM_, goalM_, sol);
-        if (opt_->isFinite(diff))
-        {
-            OMPL_INFORM("Closest path is still start and goal");
-            return base::PlannerStatus::TIMEOUT;
-        }
-        OMPL_INFORM("Using approximate solution, heuristic cost-to-go is %f", diff.value());
-        pdef_->addSolutionPath(sol, true, diff.value(), getName());
-        return base::PlannerStatus::APPROXIMATE_SOLUTION;
-    }
-    si_->freeStates(xstates);
-
-    return sol ? base::PlannerStatus::EXACT_SOLUTION : base::PlannerStatus::TIMEOUT;
-}
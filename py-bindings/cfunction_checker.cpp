@@ -0,0 +1,94 @@
+/*********************************************************************
+* Software License Agreement (BSD License)
+*
+*  Copyright (c) 2026, Rice University
+*  All rights reserved.
+*
+*  Redistribution and use in source and binary forms, with or without
+*  modification, are permitted provided that the following conditions
+*  are met:
+*
+*   * Redistributions of source code must retain the above copyright
+*     notice, this list of conditions and the following disclaimer.
+*   * Redistributions in binary form must reproduce the above
+*     copyright notice, this list of conditions and the following
+*     disclaimer in the documentation and/or other materials provided
+*     with the distribution.
+*   * Neither the name of the Rice University nor the names of its
+*     contributors may be used to endorse or promote products derived
+*     from this software without specific prior written permission.
+*
+*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+*  POSSIBILITY OF SUCH DAMAGE.
+*********************************************************************/
+
+
+// State validity checkers implemented by a plain C function. This file is
+// included in the generated code for the ompl.base module (see
+// generate_bindings.py). The function is called directly from C++, without
+// acquiring the GIL, so it must not call into the Python interpreter (unless
+// it is a ctypes callback, which acquires the GIL by itself).
+
+#include "py_ndarray.hpp"
+
+namespace
+{
+    /** \brief Signature of C functions that can be used as state validity checkers.
+        The state is passed as a contiguous array of \e dim doubles (the values
+        returned by StateSpace::copyToReals). A nonzero return value means the
+        state is valid. */
+    using CStateValidityFn = int (*)(const double *state, unsigned int dim);
+
+    /** \brief State validity checker that calls a C function given by its address
+        (e.g., obtained from a ctypes or cffi function pointer). */
+    class CFunctionStateValidityChecker : public ompl::base::StateValidityChecker
+    {
+    public:
+        CFunctionStateValidityChecker(const ompl::base::SpaceInformationPtr &si, std::uintptr_t address)
+          : ompl::base::StateValidityChecker(si)
+          , fn_(reinterpret_cast<CStateValidityFn>(address))
+          , dim_(detail::stateDimension(si->getStateSpace()))
+          , realVector_(dynamic_cast<ompl::base::RealVectorStateSpace *>(si->getStateSpace().get()) != nullptr)
+        {
+            if (fn_ == nullptr)
+                throw ompl::Exception("CFunctionStateValidityChecker", "Function address must not be null");
+        }
+
+        bool isValid(const ompl::base::State *state) const override
+        {
+            // the values of a RealVectorStateSpace state are already contiguous
+            if (realVector_)
+                return fn_(state->as<ompl::base::RealVectorStateSpace::StateType>()->values, dim_) != 0;
+            thread_local std::vector<double> reals;
+            si_->getStateSpace()->copyToReals(reals, state);
+            if (reals.size() != dim_)
+                throw ompl::Exception("CFunctionStateValidityChecker", "Unexpected number of state values");
+            return fn_(reals.data(), dim_) != 0;
+        }
+
+    private:
+        CStateValidityFn fn_;
+        unsigned int dim_;
+        bool realVector_;
+    };
+
+    void exposeCFunctionStateValidityChecker()
+    {
+        bp::class_<CFunctionStateValidityChecker, bp::bases<ompl::base::StateValidityChecker>,
+                   std::shared_ptr<CFunctionStateValidityChecker>, boost::noncopyable>(
+            "CFunctionStateValidityChecker",
+            "State validity checker that calls the C function int isValid(const double *state, unsigned int dim)\n"
+            "at the given address without acquiring the GIL.",
+            bp::init<const ompl::base::SpaceInformationPtr &, std::uintptr_t>((bp::arg("si"), bp::arg("address"))));
+    }
+}
@@ -0,0 +1,111 @@
+/*********************************************************************
+* Software License Agreement (BSD License)
+*
+*  Copyright (c) 2026, Rice University
+*  All rights reserved.
+*
+*  Redistribution and use in source and binary forms, with or without
+*  modification, are permitted provided that the following conditions
+*  are met:
+*
+*   * Redistributions of source code must retain the above copyright
+*     notice, this list of conditions and the following disclaimer.
+*   * Redistributions in binary form must reproduce the above
+*     copyright notice, this list of conditions and the following
+*     disclaimer in the documentation and/or other materials provided
+*     with the distribution.
+*   * Neither the name of the Rice University nor the names of its
+*     contributors may be used to endorse or promote products derived
+*     from this software without specific prior written permission.
+*
+*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+*  POSSIBILITY OF SUCH DAMAGE.
+*********************************************************************/
+
+
+// State propagators implemented by a plain C function. This file is included
+// in the generated code for the ompl.control module (see generate_bindings.py).
+// The function is called directly from C++, without acquiring the GIL, so it
+// must not call into the Python interpreter (unless it is a ctypes callback,
+// which acquires the GIL by itself).
+
+#include "py_ndarray.hpp"
+
+namespace
+{
+    /** \brief Signature of C functions that can be used as state propagators.
+        States are passed as contiguous arrays of \e stateDim doubles (the values
+        returned by StateSpace::copyToReals), controls as contiguous arrays of
+        \e controlDim doubles. The function must write the state reached after
+        applying \e control for \e duration time units to \e result. */
+    using CStatePropagatorFn = void (*)(const double *state, unsigned int stateDim, const double *control,
+                                        unsigned int controlDim, double duration, double *result);
+
+    /** \brief State propagator that calls a C function given by its address
+        (e.g., obtained from a ctypes or cffi function pointer). */
+    class CFunctionStatePropagator : public ompl::control::StatePropagator
+    {
+    public:
+        CFunctionStatePropagator(const ompl::control::SpaceInformationPtr &si, std::uintptr_t address)
+          : ompl::control::StatePropagator(si)
+          , fn_(reinterpret_cast<CStatePropagatorFn>(address))
+          , stateDim_(detail::stateDimension(si->getStateSpace()))
+          , controlDim_(0)
+        {
+            if (fn_ == nullptr)
+                throw ompl::Exception("CFunctionStatePropagator", "Function address must not be null");
+            // only pass the control values that can be addressed directly
+            const ompl::control::ControlSpacePtr &controlSpace = si->getControlSpace();
+            ompl::control::Control *control = controlSpace->allocControl();
+            while (controlSpace->getValueAddressAtIndex(control, controlDim_) != nullptr)
+                ++controlDim_;
+            controlSpace->freeControl(control);
+        }
+
+        void propagate(const ompl::base::State *state, const ompl::control::Control *control, double duration,
+                       ompl::base::State *result) const override
+        {
+            thread_local std::vector<double> stateReals, controlReals, resultReals;
+            const ompl::base::StateSpacePtr &space = si_->getStateSpace();
+            const ompl::control::ControlSpacePtr &controlSpace = si_->getControlSpace();
+            space->copyToReals(stateReals, state);
+            if (stateReals.size() != stateDim_)
+                throw ompl::Exception("CFunctionStatePropagator", "Unexpected number of state values");
+            controlReals.resize(controlDim_);
+            for (unsigned int i = 0; i < controlDim_; ++i)
+                controlReals[i] =
+                    *controlSpace->getValueAddressAtIndex(const_cast<ompl::control::Control *>(control), i);
+            resultReals.resize(stateDim_);
+            fn_(stateReals.data(), stateDim_, controlReals.data(), controlDim_, duration, resultReals.data());
+            space->copyFromReals(result, resultReals);
+        }
+
+    private:
+        CStatePropagatorFn fn_;
+        unsigned int stateDim_;
+        unsigned int controlDim_;
+    };
+
+    void exposeCFunctionStatePropagator()
+    {
+        bp::class_<CFunctionStatePropagator, bp::bases<ompl::control::StatePropagator>,
+                   std::shared_ptr<CFunctionStatePropagator>, boost::noncopyable>(
+            "CFunctionStatePropagator",
+            "State propagator that calls the C function\n"
+            "void propagate(const double *state, unsigned int stateDim, const double *control,\n"
+            "               unsigned int controlDim, double duration, double *result)\n"
+            "at the given address without acquiring the GIL.",
+            bp::init<const ompl::control::SpaceInformationPtr &, std::uintptr_t>(
+                (bp::arg("si"), bp::arg("address"))));
+    }
+}
@@ -44,6 +44,26 @@ from pyplusplus.module_builder import call_policies
 from pyplusplus import function_transformers as FT
 from ompl.bindings_generator import code_generator_t, default_replacement
 
+def add_method_without_gil(cls, name, method, signature, args):
+    """Register an overload of a long-running method that releases the GIL while
+    it runs, so that other Python threads can run and so that threads started by
+    the method can call back into Python. This overload is registered last and is
+    therefore the one Boost.Python tries first."""
+    cls.add_registration_code('def("%s", &detail::WithoutGIL<(%s)(&%s)>::call, (%s))' %
+                              (name, signature, method, args))
+
+def add_solve_without_gil(cls, method='::ompl::base::Planner::solve', default_time=''):
+    """Register both solve() overloads of a planner or SimpleSetup class such that
+    the GIL is released while solving."""
+    scope = method[:method.rindex('::')]
+    add_method_without_gil(cls, 'solve', method,
+                           '::ompl::base::PlannerStatus(%s::*)(double)' % scope,
+                           'bp::arg("solveTime")' + default_time)
+    add_method_without_gil(cls, 'solve', method,
+                           '::ompl::base::PlannerStatus(%s::*)'
+                           '(::ompl::base::PlannerTerminationCondition const &)' % scope,
+                           'bp::arg("ptc")')
+
 class ompl_base_generator_t(code_generator_t):
     """Class for generating the ompl.base python module."""
 
@@ -221,9 +241,12 @@ class ompl_base_generator_t(code_generator_t):
         bstate.operator('=', arg_types=['::ompl::base::State const &']).exclude()
         # add array access to double components of state
         self.add_array_access(bstate, 'double')
+        self.add_state_serialization(bstate, 'ompl::base::StateSpace')
         # loop over all predefined state spaces
         spaces = [s.related_class.name.replace('StateSpace', '') \
             for s in self.ompl_ns.class_('StateSpace').recursive_derived]
+        # state types for which a python type is created
+        scopedStateTypes = ['ompl::base::StateSpace']
         for stype in spaces:
             try:
                 # create a python type for each of their corresponding state types
@@ -231,6 +254,7 @@ class ompl_base_generator_t(code_generator_t):
             except:
                 # ignore errors because of missing Boost.Numpy
                 continue
+            scopedStateTypes.append('ompl::base::%sStateSpace' % stype)
             state.rename(stype+'State')
             state.operator('=', arg_types=['::ompl::base::State const &']).exclude()
             # add a constructor that allows, e.g., an SE3State to be constructed from a State
@@ -251,6 +275,7 @@ class ompl_base_generator_t(code_generator_t):
                 '(( bp::arg("other") )))' % stype)
             # add array access to double components of state
             self.add_array_access(state, 'double')
+            self.add_state_serialization(state, 'ompl::base::%sStateSpace' % stype)
 
         # I don't know how to export a C-style array of an enum type
         for stype in ['Dubins', 'ReedsShepp']:
@@ -266,6 +291,17 @@ class ompl_base_generator_t(code_generator_t):
         self.ompl_ns.member_functions('getValueLocations').exclude()
         # don't export map<std::string, ValueLocation>
         self.ompl_ns.member_functions('getValueLocationsByName').exclude()
+        # batches of states are checked through BatchStateValidityChecker::validity
+        self.ompl_ns.member_functions('areValid').exclude()
+        # batches of state costs are computed through
+        # BatchStateCostIntegralObjective::stateCostValues
+        self.ompl_ns.member_functions('stateCosts').exclude()
+        # batches of states are projected through
+        # BatchProjectionEvaluator::projectValues
+        self.ompl_ns.member_functions('projectStates').exclude()
+        self.ompl_ns.class_('ProjectionEvaluator').member_function(
+            'computeCoordinates',
+            arg_types=['::std::vector<const ompl::base::State *> const &', None]).exclude()
         # exclude member function for which there are multiple signatures
         self.ompl_ns.class_('Goal').member_function(
             'isSatisfied',
@@ -305,6 +341,43 @@ class ompl_base_generator_t(code_generator_t):
         # problems with Boost.Python.
         # See https://github.com/boostorg/python/issues/60
         self.ompl_ns.class_('ProblemDefinition').add_declaration_code('#define nullptr NULL\n')
+        # Intermediate solutions are passed to a Python callback as a list of
+        # copies of the states, since the states are only valid during the call.
+        # The callback is called from the planner's thread.
+        self.ompl_ns.class_('ProblemDefinition').add_declaration_code("""
+        void ProblemDefinition_setIntermediateSolutionCallback(ompl::base::ProblemDefinition* pdef,
+            bp::object callback)
+        {
+            if (callback.is_none())
+            {
+                pdef->setIntermediateSolutionCallback(ompl::base::ReportIntermediateSolutionFn());
+                return;
+            }
+            std::shared_ptr<bp::object> fn = detail::holdPyobject(callback);
+            ompl::base::StateSpacePtr space = pdef->getSpaceInformation()->getStateSpace();
+            pdef->setIntermediateSolutionCallback(
+                [fn, space](const ompl::base::Planner *planner,
+                    const std::vector<const ompl::base::State *> &states, const ompl::base::Cost cost)
+                {
+                    detail::EnsureGIL gil;
+                    try
+                    {
+                        bp::list copies;
+                        for (const ompl::base::State *state : states)
+                            copies.append(ompl::base::ScopedState<>(space, state));
+                        (*fn)(bp::ptr(const_cast<ompl::base::Planner *>(planner)), copies, cost);
+                    }
+                    catch (const bp::error_already_set &)
+                    {
+                        // there is no Python caller to pass the exception to
+                        PyErr_Print();
+                    }
+                });
+        }
+        """)
+        self.ompl_ns.class_('ProblemDefinition').add_registration_code(
+            'def("setIntermediateSolutionCallback", &ProblemDefinition_setIntermediateSolutionCallback, '
+            '(bp::arg("callback")))')
         try:
             for cls in ['AtlasChart', 'AtlasStateSpace', 'ConstrainedStateSpace', \
                 'ProjectedStateSpace', 'TangentBundleStateSpace']:
@@ -323,6 +396,11 @@ class ompl_base_generator_t(code_generator_t):
                 EIGEN_ARRAY_CONVERTER(Eigen::VectorXd, 1)
             """)
             self.mb.add_registration_code('np::initialize();', tail=False)
+            # add asarray() methods that return numpy arrays of state values
+            self.mb.add_declaration_code(open(join(dirname(__file__), \
+                'numpy_state.cpp'), 'r').read())
+            self.mb.add_registration_code('addStateAsArray<%s>();' % ', '.join(scopedStateTypes))
+            self.mb.add_registration_code('addStateArenaAsArray();')
             self.add_array_access(self.ompl_ns.class_(
                 'ConstrainedStateSpace').class_('StateType'), 'double')
             # \todo: figure why commented-out code causes a problem.
@@ -333,10 +411,22 @@ class ompl_base_generator_t(code_generator_t):
                     cls.member_function(method, arg_types=[
                         '::Eigen::Ref<const Eigen::Matrix<double, -1, 1, 0>, 0, Eigen::InnerStride<1>> const &',
                         None]).add_transformation(FT.input(0))
+            # points are passed to Python-defined batch constraints as a
+            # matrix with one point per row
+            for method in ['functions', 'jacobians']:
+                self.ompl_ns.class_('BatchConstraint').member_function(method).add_transformation(FT.input(0))
             cls = self.ompl_ns.class_('Constraint')
             for method in ['distance', 'isSatisfied']:
                 cls.member_function(method, arg_types=[
                     '::Eigen::Ref<const Eigen::Matrix<double, -1, 1, 0>, 0, Eigen::InnerStride<1>> const &',]).add_transformation(FT.input(0))
+            # states are passed to Python-defined batch validity checkers as a
+            # matrix with one state per row
+            self.ompl_ns.class_('BatchStateValidityChecker').member_function('validity').add_transformation(
+                FT.input(0))
+            self.ompl_ns.class_('BatchStateCostIntegralObjective').member_function(
+                'stateCostValues').add_transformation(FT.input(0))
+            self.ompl_ns.class_('BatchProjectionEvaluator').member_function(
+                'projectValues').add_transformation(FT.input(0))
         except Exception as e:
             pass
 
@@ -354,6 +444,162 @@ class ompl_base_generator_t(code_generator_t):
         # Make PlannerData printable
         self.replace_member_function(plannerData.member_function('printGraphviz'))
         self.replace_member_function(plannerData.member_function('printGraphML'))
+        # add bulk conversion of the graph to and from numpy arrays
+        plannerData.add_declaration_code("""
+        #include "ompl/base/PlannerDataGraph.h"
+        #include "py_ndarray.hpp"
+        bp::object PlannerData_toArrays(ompl::base::PlannerData* pd)
+        {
+            const ompl::base::StateSpacePtr &space = pd->getSpaceInformation()->getStateSpace();
+            const ompl::base::PlannerData::Graph &graph = pd->toBoostGraph();
+            std::size_t n = pd->numVertices(), m = pd->numEdges(), dim = detail::stateDimension(space);
+            bp::object states = detail::emptyArray(bp::make_tuple(n, dim));
+            bp::object indptr = detail::emptyArray(bp::make_tuple(n + 1), "int64");
+            bp::object indices = detail::emptyArray(bp::make_tuple(m), "int64");
+            bp::object weights = detail::emptyArray(bp::make_tuple(m));
+            bp::object isStart = detail::emptyArray(bp::make_tuple(n), "bool");
+            bp::object isGoal = detail::emptyArray(bp::make_tuple(n), "bool");
+            detail::DoubleBuffer statesBuffer(states, true), weightsBuffer(weights, true);
+            detail::ArrayBuffer<std::int64_t> indptrBuffer(indptr, true), indicesBuffer(indices, true);
+            detail::ArrayBuffer<bool> isStartBuffer(isStart, true), isGoalBuffer(isGoal, true);
+            auto edgeWeights = boost::get(boost::edge_weight, graph);
+            std::vector<double> reals;
+            std::int64_t k = 0;
+            for (std::size_t i = 0; i < n; ++i)
+            {
+                space->copyToReals(reals, pd->getVertex(i).getState());
+                std::copy(reals.begin(), reals.end(), statesBuffer.data() + i * dim);
+                indptrBuffer.data()[i] = k;
+                for (auto edges = boost::out_edges(boost::vertex(i, graph), graph); edges.first != edges.second;
+                     ++edges.first, ++k)
+                {
+                    indicesBuffer.data()[k] = boost::target(*edges.first, graph);
+                    weightsBuffer.data()[k] = edgeWeights[*edges.first].value();
+                }
+                isStartBuffer.data()[i] = pd->isStartVertex(i);
+                isGoalBuffer.data()[i] = pd->isGoalVertex(i);
+            }
+            indptrBuffer.data()[n] = k;
+            return bp::make_tuple(states, bp::make_tuple(weights, indices, indptr), isStart, isGoal);
+        }
+        void PlannerData_fromArrays(ompl::base::PlannerData* pd, bp::object states, bp::object graph,
+            bp::object isStart, bp::object isGoal)
+        {
+            const ompl::base::SpaceInformationPtr &si = pd->getSpaceInformation();
+            std::size_t dim = detail::stateDimension(si->getStateSpace());
+            detail::DoubleBuffer statesBuffer(states);
+            if (statesBuffer.ndim() != 2 || statesBuffer.shape(1) != dim)
+                detail::raiseValueError("states should have shape (number of vertices, dimension)");
+            std::size_t n = statesBuffer.shape(0);
+            if (bp::len(graph) != 3)
+                detail::raiseValueError("graph should be a tuple (weights, indices, indptr)");
+            detail::DoubleBuffer weightsBuffer(graph[0]);
+            detail::ArrayBuffer<std::int64_t> indicesBuffer(graph[1]), indptrBuffer(graph[2]);
+            if (indptrBuffer.size() != n + 1 || indicesBuffer.size() != weightsBuffer.size() ||
+                indptrBuffer.data()[0] != 0 || indptrBuffer.data()[n] != (std::int64_t)indicesBuffer.size())
+                detail::raiseValueError("graph is not a valid CSR representation of an n x n matrix");
+            for (std::size_t i = 0; i < n; ++i)
+                if (indptrBuffer.data()[i] > indptrBuffer.data()[i + 1])
+                    detail::raiseValueError("graph is not a valid CSR representation of an n x n matrix");
+            for (std::size_t k = 0; k < indicesBuffer.size(); ++k)
+                if (indicesBuffer.data()[k] < 0 || indicesBuffer.data()[k] >= (std::int64_t)n)
+                    detail::raiseValueError("graph contains an edge to a nonexistent vertex");
+            std::unique_ptr<detail::ArrayBuffer<bool>> isStartBuffer, isGoalBuffer;
+            if (!isStart.is_none())
+                isStartBuffer = std::make_unique<detail::ArrayBuffer<bool>>(isStart);
+            if (!isGoal.is_none())
+                isGoalBuffer = std::make_unique<detail::ArrayBuffer<bool>>(isGoal);
+            if ((isStartBuffer && isStartBuffer->size() != n) || (isGoalBuffer && isGoalBuffer->size() != n))
+                detail::raiseValueError("start and goal masks should have one element per vertex");
+
+            pd->clear();
+            std::vector<ompl::base::State *> vertexStates(n);
+            std::vector<double> reals(dim);
+            for (std::size_t i = 0; i < n; ++i)
+            {
+                vertexStates[i] = si->allocState();
+                std::copy(statesBuffer.data() + i * dim, statesBuffer.data() + (i + 1) * dim, reals.begin());
+                si->getStateSpace()->copyFromReals(vertexStates[i], reals);
+                pd->addVertex(ompl::base::PlannerDataVertex(vertexStates[i]));
+                if (isStartBuffer && isStartBuffer->data()[i])
+                    pd->markStartState(vertexStates[i]);
+                if (isGoalBuffer && isGoalBuffer->data()[i])
+                    pd->markGoalState(vertexStates[i]);
+            }
+            for (std::size_t i = 0; i < n; ++i)
+                for (std::int64_t k = indptrBuffer.data()[i]; k < indptrBuffer.data()[i + 1]; ++k)
+                    pd->addEdge(i, indicesBuffer.data()[k], ompl::base::PlannerDataEdge(),
+                                ompl::base::Cost(weightsBuffer.data()[k]));
+            // let the PlannerData own copies of the states
+            pd->decoupleFromPlanner();
+            si->freeStates(vertexStates);
+        }
+        """)
+        plannerData.add_registration_code('def("toArrays", &PlannerData_toArrays)')
+        plannerData.add_registration_code('def("fromArrays", &PlannerData_fromArrays, '
+            '(bp::arg("states"), bp::arg("graph"), bp::arg("isStart")=bp::object(), '
+            'bp::arg("isGoal")=bp::object()))')
+        # add pickle support using the binary format of PlannerDataStorage
+        plannerData.add_declaration_code("""
+        #include <sstream>
+        #include "ompl/base/PlannerDataStorage.h"
+        #include "py_serialization.hpp"
+        bp::object PlannerData_serialize(ompl::base::PlannerData* pd)
+        {
+            detail::serializationLength(*pd->getSpaceInformation()->getStateSpace());
+            std::ostringstream out;
+            if (!ompl::base::PlannerDataStorage().store(*pd, out))
+                detail::raisePicklingError("failed to serialize PlannerData");
+            return detail::toBytes(out.str());
+        }
+        void PlannerData_deserialize(ompl::base::PlannerData* pd, bp::object data)
+        {
+            detail::ByteBuffer buffer(data);
+            std::istringstream in(std::string(buffer.data(), buffer.size()));
+            if (!ompl::base::PlannerDataStorage().load(in, *pd))
+                detail::raiseUnpicklingError("failed to deserialize PlannerData");
+        }
+        bp::tuple PlannerData_reduce(bp::object self)
+        {
+            ompl::base::PlannerData &pd = bp::extract<ompl::base::PlannerData &>(self);
+            return detail::reduce(self, bp::object(pd.getSpaceInformation()), PlannerData_serialize(&pd));
+        }
+        """)
+        plannerData.add_registration_code('def("serialize", &PlannerData_serialize)')
+        plannerData.add_registration_code('def("deserialize", &PlannerData_deserialize)')
+        plannerData.add_registration_code('def("__reduce__", &PlannerData_reduce)')
+        plannerData.add_registration_code('def("__setstate__", &PlannerData_deserialize)')
+        # occupancy grids are passed as NumPy arrays (indexed as [z, ]y, x, like
+        # images) or PPM images
+        occupancyGrid = self.ompl_ns.class_('OccupancyGridValidityChecker')
+        occupancyGrid.constructors().exclude()
+        occupancyGrid.member_function('checkSegment').add_transformation(FT.output(2))
+        occupancyGrid.add_declaration_code("""
+        #include "py_ndarray.hpp"
+        std::shared_ptr<ompl::base::OccupancyGridValidityChecker> OccupancyGridValidityChecker_init(
+            const ompl::base::SpaceInformationPtr &si, bp::object grid, double resolution, bp::object origin)
+        {
+            std::vector<double> corner;
+            if (!origin.is_none())
+                for (bp::ssize_t i = 0; i < bp::len(origin); ++i)
+                    corner.push_back(bp::extract<double>(origin[i]));
+            bp::extract<const ompl::PPM &> ppm(grid);
+            if (ppm.check())
+                return std::make_shared<ompl::base::OccupancyGridValidityChecker>(si, ppm(), resolution, corner);
+            detail::ArrayBuffer<bool> cells(grid);
+            if (cells.ndim() != 2 && cells.ndim() != 3)
+                detail::raiseValueError("occupancy grids must have two or three dimensions");
+            std::vector<unsigned int> gridSize(cells.ndim());
+            for (int i = 0; i < cells.ndim(); ++i)
+                gridSize[i] = cells.shape(cells.ndim() - 1 - i);
+            const auto *data = reinterpret_cast<const unsigned char *>(cells.data());
+            return std::make_shared<ompl::base::OccupancyGridValidityChecker>(
+                si, gridSize, std::vector<unsigned char>(data, data + cells.size()), resolution, corner);
+        }
+        """)
+        occupancyGrid.add_registration_code('def("__init__", bp::make_constructor('
+            '&OccupancyGridValidityChecker_init, bp::default_call_policies(), '
+            '(bp::arg("si"), bp::arg("grid"), bp::arg("resolution")=1., bp::arg("origin")=bp::object())))')
         # serialize passes archive by reference which causes problems
         self.ompl_ns.class_('PlannerDataVertex').member_functions('serialize').exclude()
         self.ompl_ns.class_('PlannerDataEdge').member_functions('serialize').exclude()
@@ -391,6 +637,10 @@ class ompl_base_generator_t(code_generator_t):
             'PlannerTerminationConditionFn', 'Planner termination condition function')
         self.add_function_wrapper('bool(const ompl::base::State*)', \
             'StateValidityCheckerFn', 'State validity checker function')
+        # state validity checkers implemented by C functions (e.g., from ctypes or cffi)
+        self.mb.add_declaration_code(open(join(dirname(__file__), \
+            'cfunction_checker.cpp'), 'r').read())
+        self.mb.add_registration_code('exposeCFunctionStateValidityChecker();')
         self.add_function_wrapper('ompl::base::StateSamplerPtr(const ompl::base::StateSpace*)', \
             'StateSamplerAllocator', 'State sampler allocator')
         self.add_function_wrapper(
@@ -405,6 +655,40 @@ class ompl_base_generator_t(code_generator_t):
         self.add_function_wrapper('std::string()', 'PlannerProgressProperty', \
             'Function that returns stringified value of a property while a planner is running')
 
+        # the states of a StateArena are owned by the arena
+        stateArena = self.ompl_ns.class_('StateArena')
+        for method in ['getState', 'allocState']:
+            stateArena.member_function(method).call_policies = \
+                call_policies.return_internal_reference()
+        stateArena.member_function('getValues').exclude()
+        stateArena.add_declaration_code("""
+        ompl::base::State *StateArena_getItem(ompl::base::StateArena* arena, long index)
+        {
+            if (index < 0)
+                index += arena->size();
+            if (index < 0 || index >= (long) arena->size())
+            {
+                PyErr_SetString(PyExc_IndexError, "StateArena index out of range");
+                bp::throw_error_already_set();
+            }
+            return arena->getState(index);
+        }
+        """)
+        stateArena.add_registration_code('def("__len__", &ompl::base::StateArena::size)')
+        stateArena.add_registration_code(
+            'def("__getitem__", &StateArena_getItem, bp::return_internal_reference<>())')
+        # SpaceInformation.allocStates(n) allocates n states at once
+        self.ompl_ns.class_('SpaceInformation').add_declaration_code("""
+        #include "ompl/base/StateArena.h"
+        ompl::base::StateArena* SpaceInformation_allocStates(ompl::base::SpaceInformation* si, std::size_t n)
+        {
+            return new ompl::base::StateArena(si->getStateSpace(), n);
+        }
+        """)
+        self.ompl_ns.class_('SpaceInformation').add_registration_code(
+            'def("allocStates", &SpaceInformation_allocStates, '
+            'bp::return_value_policy<bp::manage_new_object>(), (bp::arg("n")))')
+
         # rename SamplerSelectors
         self.ompl_ns.class_('SamplerSelector< ompl::base::StateSampler >').rename(
             'StateSamplerSelector')
@@ -503,6 +787,182 @@ class ompl_control_generator_t(code_generator_t):
         self.replace_member_functions(self.ompl_ns.member_functions('printControl'))
         # print paths as matrices
         self.replace_member_functions(self.ompl_ns.member_functions('printAsMatrix'))
+        # add bulk conversion of paths to and from numpy arrays
+        cls = self.ompl_ns.class_('PathControl')
+        cls.add_declaration_code("""
+        #include "py_ndarray.hpp"
+        unsigned int controlValueCount(const ompl::control::ControlSpacePtr &space, ompl::control::Control *control)
+        {
+            unsigned int count = 0;
+            while (space->getValueAddressAtIndex(control, count) != nullptr)
+                ++count;
+            return count;
+        }
+        bp::tuple PathControl_toArray(ompl::control::PathControl* path)
+        {
+            const auto *si = static_cast<const ompl::control::SpaceInformation *>(
+                path->getSpaceInformation().get());
+            const ompl::base::StateSpacePtr &space = si->getStateSpace();
+            const ompl::control::ControlSpacePtr &cspace = si->getControlSpace();
+            std::size_t n = path->getStateCount(), m = path->getControlCount();
+            std::size_t dim = detail::stateDimension(space);
+            std::size_t cdim = m > 0 ? controlValueCount(cspace, path->getControl(0)) : cspace->getDimension();
+            bp::object states = detail::emptyArray(bp::make_tuple(n, dim));
+            bp::object controls = detail::emptyArray(bp::make_tuple(m, cdim));
+            bp::object durations = detail::emptyArray(bp::make_tuple(m));
+            detail::DoubleBuffer sbuffer(states, true), cbuffer(controls, true), dbuffer(durations, true);
+            std::vector<double> reals;
+            for (std::size_t i = 0; i < n; ++i)
+            {
+                space->copyToReals(reals, path->getState(i));
+                std::copy(reals.begin(), reals.end(), sbuffer.data() + i * dim);
+            }
+            for (std::size_t i = 0; i < m; ++i)
+            {
+                for (std::size_t j = 0; j < cdim; ++j)
+                    cbuffer.data()[i * cdim + j] = *cspace->getValueAddressAtIndex(path->getControl(i), j);
+                dbuffer.data()[i] = path->getControlDuration(i);
+            }
+            return bp::make_tuple(states, controls, durations);
+        }
+        ompl::control::PathControl PathControl_fromArray(const ompl::control::SpaceInformationPtr &si,
+            bp::object stateArray, bp::object controlArray, bp::object durationArray)
+        {
+            const ompl::base::StateSpacePtr &space = si->getStateSpace();
+            const ompl::control::ControlSpacePtr &cspace = si->getControlSpace();
+            std::size_t dim = detail::stateDimension(space);
+            detail::DoubleBuffer sbuffer(stateArray), cbuffer(controlArray), dbuffer(durationArray);
+            std::size_t n = sbuffer.shape(0), m = n > 0 ? n - 1 : 0;
+            ompl::base::State *state = si->allocState();
+            ompl::control::Control *control = si->allocControl();
+            std::size_t cdim = controlValueCount(cspace, control);
+            if (sbuffer.ndim() != 2 || sbuffer.shape(1) != dim || cbuffer.ndim() != 2 ||
+                cbuffer.shape(0) != m || cbuffer.shape(1) != cdim || dbuffer.ndim() != 1 || dbuffer.shape(0) != m)
+            {
+                si->freeState(state);
+                si->freeControl(control);
+                detail::raiseValueError("arrays should have shapes (n, state dimension), "
+                    "(n-1, control dimension), and (n-1,)");
+            }
+            ompl::control::PathControl path(si);
+            std::vector<double> reals(dim);
+            for (std::size_t i = 0; i < n; ++i)
+            {
+                std::copy(sbuffer.data() + i * dim, sbuffer.data() + (i + 1) * dim, reals.begin());
+                space->copyFromReals(state, reals);
+                if (i < m)
+                {
+                    for (std::size_t j = 0; j < cdim; ++j)
+                        *cspace->getValueAddressAtIndex(control, j) = cbuffer.data()[i * cdim + j];
+                    path.append(state, control, dbuffer.data()[i]);
+                }
+                else
+                    path.append(state);
+            }
+            si->freeState(state);
+            si->freeControl(control);
+            return path;
+        }
+        """)
+        cls.add_registration_code('def("toArray", &PathControl_toArray)')
+        cls.add_registration_code('def("fromArray", &PathControl_fromArray, '
+            '(bp::arg("si"), bp::arg("states"), bp::arg("controls"), bp::arg("durations")))')
+        cls.add_registration_code('staticmethod("fromArray")')
+        # add pickle support; a path with n states is stored as the serialized
+        # states, followed by the n-1 serialized controls and their durations
+        cls.add_declaration_code("""
+        #include <cstring>
+        #include "py_serialization.hpp"
+        std::size_t controlSerializationLength(const ompl::control::ControlSpace &space)
+        {
+            std::size_t length = space.getSerializationLength();
+            if (length == 0)
+                detail::raisePicklingError("control space " + space.getName() + " does not support serialization");
+            return length;
+        }
+        bp::object PathControl_serialize(ompl::control::PathControl* path)
+        {
+            const auto *si = static_cast<const ompl::control::SpaceInformation *>(
+                path->getSpaceInformation().get());
+            std::size_t n = path->getStateCount(), m = path->getControlCount();
+            std::size_t slength = detail::serializationLength(*si->getStateSpace());
+            std::size_t clength = controlSerializationLength(*si->getControlSpace());
+            bp::object data = detail::emptyBytes(n * slength + m * (clength + sizeof(double)));
+            char *out = detail::bytesData(data);
+            for (std::size_t i = 0; i < n; ++i, out += slength)
+                si->getStateSpace()->serialize(out, path->getState(i));
+            for (std::size_t i = 0; i < m; ++i, out += clength)
+                si->getControlSpace()->serialize(out, path->getControl(i));
+            std::memcpy(out, path->getControlDurations().data(), m * sizeof(double));
+            return data;
+        }
+        void PathControl_deserialize(ompl::control::PathControl* path, bp::object data)
+        {
+            const auto *si = static_cast<const ompl::control::SpaceInformation *>(
+                path->getSpaceInformation().get());
+            std::size_t slength = detail::serializationLength(*si->getStateSpace());
+            std::size_t clength = controlSerializationLength(*si->getControlSpace());
+            detail::ByteBuffer buffer(data);
+            std::size_t n = (buffer.size() + clength + sizeof(double)) / (slength + clength + sizeof(double));
+            std::size_t m = n > 0 ? n - 1 : 0;
+            if (n * slength + m * (clength + sizeof(double)) != buffer.size())
+                detail::raiseUnpicklingError("serialized path does not match state and control space");
+            *path = ompl::control::PathControl(path->getSpaceInformation());
+            const char *in = buffer.data();
+            for (std::size_t i = 0; i < n; ++i, in += slength)
+            {
+                path->getStates().push_back(si->allocState());
+                si->getStateSpace()->deserialize(path->getStates().back(), in);
+            }
+            for (std::size_t i = 0; i < m; ++i, in += clength)
+            {
+                path->getControls().push_back(si->allocControl());
+                si->getControlSpace()->deserialize(path->getControls().back(), in);
+            }
+            path->getControlDurations().resize(m);
+            std::memcpy(path->getControlDurations().data(), in, m * sizeof(double));
+        }
+        bp::tuple PathControl_reduce(bp::object self)
+        {
+            ompl::control::PathControl &path = bp::extract<ompl::control::PathControl &>(self);
+            return detail::reduce(self, bp::object(path.getSpaceInformation()), PathControl_serialize(&path));
+        }
+        """)
+        cls.add_registration_code('def("serialize", &PathControl_serialize)')
+        cls.add_registration_code('def("deserialize", &PathControl_deserialize)')
+        cls.add_registration_code('def("__reduce__", &PathControl_reduce)')
+        cls.add_registration_code('def("__setstate__", &PathControl_deserialize)')
+        # add pickle support to PlannerData with controls
+        plannerData = self.ompl_ns.namespace('control').class_('PlannerData')
+        plannerData.add_declaration_code("""
+        #include <sstream>
+        #include "ompl/control/PlannerDataStorage.h"
+        #include "py_serialization.hpp"
+        bp::object ControlPlannerData_serialize(ompl::control::PlannerData* pd)
+        {
+            detail::serializationLength(*pd->getSpaceInformation()->getStateSpace());
+            std::ostringstream out;
+            if (!ompl::control::PlannerDataStorage().store(*pd, out))
+                detail::raisePicklingError("failed to serialize PlannerData");
+            return detail::toBytes(out.str());
+        }
+        void ControlPlannerData_deserialize(ompl::control::PlannerData* pd, bp::object data)
+        {
+            detail::ByteBuffer buffer(data);
+            std::istringstream in(std::string(buffer.data(), buffer.size()));
+            if (!ompl::control::PlannerDataStorage().load(in, *pd))
+                detail::raiseUnpicklingError("failed to deserialize PlannerData");
+        }
+        bp::tuple ControlPlannerData_reduce(bp::object self)
+        {
+            ompl::control::PlannerData &pd = bp::extract<ompl::control::PlannerData &>(self);
+            return detail::reduce(self, bp::object(pd.getSpaceInformation()), ControlPlannerData_serialize(&pd));
+        }
+        """)
+        plannerData.add_registration_code('def("serialize", &ControlPlannerData_serialize)')
+        plannerData.add_registration_code('def("deserialize", &ControlPlannerData_deserialize)')
+        plannerData.add_registration_code('def("__reduce__", &ControlPlannerData_reduce)')
+        plannerData.add_registration_code('def("__setstate__", &ControlPlannerData_deserialize)')
         # export ODESolver-derived classes that use Boost.OdeInt
         for odesolver in ['ODEBasicSolver', 'ODEErrorSolver', 'ODEAdaptiveSolver']:
             cls = self.ompl_ns.class_(lambda cls, slv=odesolver: cls.name.startswith(slv))
@@ -523,6 +983,16 @@ class ompl_control_generator_t(code_generator_t):
         # this method requires ompl::Grid::Coord (aka Eigen::VectorXi) to be exported
         self.ompl_ns.class_('KPIECE1').member_function('findNextMotion').exclude()
 
+        # batches of states are propagated through BatchStatePropagator::propagateValues
+        self.ompl_ns.member_functions('propagateStates').exclude()
+        self.ompl_ns.namespace('control').class_('SpaceInformation').member_function(
+            'propagateWhileValid',
+            arg_types=['::std::vector<const ompl::base::State *> const &', None, None, None, None]).exclude()
+        # states, controls and durations are passed to Python-defined batch
+        # state propagators as matrices with one propagation per row
+        self.ompl_ns.class_('BatchStatePropagator').member_function('propagateValues').add_transformation(
+            FT.input(0), FT.input(1), FT.input(2))
+
         # export pure virtual member functions, otherwise code doesn't compile
         syclop = self.ompl_ns.class_('Syclop')
         syclop.add_wrapper_code("""
@@ -551,6 +1021,10 @@ class ompl_control_generator_t(code_generator_t):
             'void(const ompl::base::State*, const ompl::control::Control*, const double, '
             'ompl::base::State*)',
             'StatePropagatorFn', 'State propagator function')
+        # state propagators implemented by C functions (e.g., from ctypes or cffi)
+        self.mb.add_declaration_code(open(join(dirname(__file__), \
+            'cfunction_propagator.cpp'), 'r').read())
+        self.mb.add_registration_code('exposeCFunctionStatePropagator();')
         self.add_function_wrapper('double(int, int)', 'EdgeCostFactorFn', \
             'Syclop edge cost factor function')
         self.add_function_wrapper('void(int, int, std::vector<int>&)', 'LeadComputeFn', \
@@ -564,6 +1038,8 @@ class ompl_control_generator_t(code_generator_t):
         self.ompl_ns.namespace('control').class_('SimpleSetup').add_registration_code(
             'def("getPlannerAllocator", &ompl::control::SimpleSetup::getPlannerAllocator, ' \
             'bp::return_value_policy< bp::copy_const_reference >())')
+        add_solve_without_gil(self.ompl_ns.namespace('control').class_('SimpleSetup'),
+                              '::ompl::control::SimpleSetup::solve', '=1.0')
 
         # Do this for all classes that exist with the same name in another namespace
         # (We also do it for all planners; see below)
@@ -587,9 +1063,7 @@ class ompl_control_generator_t(code_generator_t):
         for planner in planners:
             # many planners exist with the same name in another namespace
             planner.wrapper_alias = 'Control%s_wrapper' % planner.name
-            planner.add_registration_code(
-                'def("solve", (::ompl::base::PlannerStatus(::ompl::base::Planner::*)( double ))' \
-                '(&::ompl::base::Planner::solve), (bp::arg("solveTime")) )')
+            add_solve_without_gil(planner)
             planner.add_registration_code("""
             def("setProblemDefinition",&::ompl::base::Planner::setProblemDefinition,
                     &Control%s_wrapper::default_setProblemDefinition, (bp::arg("pdef")) )""" % \
@@ -634,6 +1108,86 @@ class ompl_geometric_generator_t(code_generator_t):
         # print debug info
         self.replace_member_functions(self.ompl_ns.member_functions('printDebug'))
         self.ompl_ns.member_functions('freeGridMotions').exclude()
+        # add bulk conversion of paths to and from numpy arrays
+        cls = self.ompl_ns.class_('PathGeometric')
+        cls.add_declaration_code("""
+        #include "py_ndarray.hpp"
+        bp::object PathGeometric_toArray(ompl::geometric::PathGeometric* path)
+        {
+            const ompl::base::StateSpacePtr &space = path->getSpaceInformation()->getStateSpace();
+            std::size_t n = path->getStateCount(), dim = detail::stateDimension(space);
+            bp::object result = detail::emptyArray(bp::make_tuple(n, dim));
+            detail::DoubleBuffer buffer(result, true);
+            std::vector<double> reals;
+            for (std::size_t i = 0; i < n; ++i)
+            {
+                space->copyToReals(reals, path->getState(i));
+                std::copy(reals.begin(), reals.end(), buffer.data() + i * dim);
+            }
+            return result;
+        }
+        ompl::geometric::PathGeometric PathGeometric_fromArray(
+            const ompl::base::SpaceInformationPtr &si, bp::object array)
+        {
+            const ompl::base::StateSpacePtr &space = si->getStateSpace();
+            std::size_t dim = detail::stateDimension(space);
+            detail::DoubleBuffer buffer(array);
+            if (buffer.ndim() != 2 || buffer.shape(1) != dim)
+                detail::raiseValueError("array should have shape (number of states, dimension)");
+            ompl::geometric::PathGeometric path(si);
+            ompl::base::State *state = si->allocState();
+            std::vector<double> reals(dim);
+            for (std::size_t i = 0; i < buffer.shape(0); ++i)
+            {
+                std::copy(buffer.data() + i * dim, buffer.data() + (i + 1) * dim, reals.begin());
+                space->copyFromReals(state, reals);
+                path.append(state);
+            }
+            si->freeState(state);
+            return path;
+        }
+        """)
+        cls.add_registration_code('def("toArray", &PathGeometric_toArray)')
+        cls.add_registration_code('def("fromArray", &PathGeometric_fromArray, '
+            '(bp::arg("si"), bp::arg("array")))')
+        cls.add_registration_code('staticmethod("fromArray")')
+        # add pickle support; a path is stored as its serialized states
+        cls.add_declaration_code("""
+        #include "py_serialization.hpp"
+        bp::object PathGeometric_serialize(ompl::geometric::PathGeometric* path)
+        {
+            const ompl::base::StateSpacePtr &space = path->getSpaceInformation()->getStateSpace();
+            std::size_t length = detail::serializationLength(*space);
+            bp::object data = detail::emptyBytes(path->getStateCount() * length);
+            for (std::size_t i = 0; i < path->getStateCount(); ++i)
+                space->serialize(detail::bytesData(data) + i * length, path->getState(i));
+            return data;
+        }
+        void PathGeometric_deserialize(ompl::geometric::PathGeometric* path, bp::object data)
+        {
+            const ompl::base::SpaceInformationPtr &si = path->getSpaceInformation();
+            std::size_t length = detail::serializationLength(*si->getStateSpace());
+            detail::ByteBuffer buffer(data);
+            if (buffer.size() % length != 0)
+                detail::raiseUnpicklingError("serialized path does not match state space " +
+                    si->getStateSpace()->getName());
+            path->clear();
+            for (std::size_t i = 0; i < buffer.size() / length; ++i)
+            {
+                path->getStates().push_back(si->allocState());
+                si->getStateSpace()->deserialize(path->getStates().back(), buffer.data() + i * length);
+            }
+        }
+        bp::tuple PathGeometric_reduce(bp::object self)
+        {
+            ompl::geometric::PathGeometric &path = bp::extract<ompl::geometric::PathGeometric &>(self);
+            return detail::reduce(self, bp::object(path.getSpaceInformation()), PathGeometric_serialize(&path));
+        }
+        """)
+        cls.add_registration_code('def("serialize", &PathGeometric_serialize)')
+        cls.add_registration_code('def("deserialize", &PathGeometric_deserialize)')
+        cls.add_registration_code('def("__reduce__", &PathGeometric_reduce)')
+        cls.add_registration_code('def("__setstate__", &PathGeometric_deserialize)')
         self.ompl_ns.class_('PRM').member_functions('maybeConstructSolution').exclude()
         self.ompl_ns.class_('PRM').member_functions('growRoadmap', \
             function=declarations.access_type_matcher_t('protected')).exclude()
@@ -662,6 +1216,8 @@ class ompl_geometric_generator_t(code_generator_t):
         self.ompl_ns.namespace('geometric').class_('SimpleSetup').add_registration_code( \
             'def("getPlannerAllocator", &ompl::geometric::SimpleSetup::getPlannerAllocator, ' \
             'bp::return_value_policy< bp::copy_const_reference >())')
+        add_solve_without_gil(self.ompl_ns.namespace('geometric').class_('SimpleSetup'),
+                              '::ompl::geometric::SimpleSetup::solve', '=1.0')
         self.std_ns.class_('vector< std::shared_ptr<ompl::geometric::BITstar::Vertex> >').exclude()
         self.std_ns.class_('vector< std::shared_ptr<ompl::geometric::aitstar::Vertex> >').exclude()
         self.std_ns.class_('vector< std::shared_ptr<ompl::geometric::eitstar::Vertex> >').exclude()
@@ -688,9 +1244,7 @@ class ompl_geometric_generator_t(code_generator_t):
         # solution.
         planners = [p.related_class for p in self.ompl_ns.class_('Planner').recursive_derived]
         for planner in planners:
-            planner.add_registration_code(
-                'def("solve", (::ompl::base::PlannerStatus(::ompl::base::Planner::*)( double ))' \
-                '(&::ompl::base::Planner::solve), (bp::arg("solveTime")) )')
+            add_solve_without_gil(planner)
             if planner.name != 'PRM' and planner.name != 'QRRT':
                 # PRM and QRRT override setProblemDefinition, so we don't need to add this code
                 planner.add_registration_code("""
@@ -701,71 +1255,8 @@ class ompl_geometric_generator_t(code_generator_t):
             def("checkValidity",&::ompl::base::Planner::checkValidity,
                 &%s::default_checkValidity )""" % planner.wrapper_alias)
 
-        # The OMPL implementation of PRM uses two threads: one for constructing
-        # the roadmap and another for checking for a solution. This causes
-        # problems when both threads try to access the python interpreter
-        # simultaneously. This is a known limitation of Boost.Python. We
-        # therefore use a single-threaded version of PRM in python.
-        PRM_cls = self.ompl_ns.class_('PRM')
-        PRM_cls.member_function('solve').exclude()
-        PRM_cls.add_wrapper_code("""
-            virtual ::ompl::base::PlannerStatus solve(
-                ::ompl::base::PlannerTerminationCondition const & ptc ) {
-                if( bp::override func_solve = this->get_override( "solve" ) )
-                    return func_solve( boost::ref(ptc) );
-                else{
-                    return default_solve( boost::ref(ptc) );
-                }
-            }
-
-            ::ompl::base::PlannerStatus default_solve(
-                ::ompl::base::PlannerTerminationCondition const & ptc );
-            """)
-        PRM_cls.add_declaration_code(open(join(dirname(__file__), \
-            'PRM.SingleThreadSolve.cpp'), 'r').read())
-        # This needs to be the last registration code added to the PRM_cls to the ugly hack below.
-        PRM_cls.add_registration_code("""def("solve",
-            (::ompl::base::PlannerStatus(::ompl::geometric::PRM::*)(
-                ::ompl::base::PlannerTerminationCondition const &))(&PRM_wrapper::solve),
-            (::ompl::base::PlannerStatus(PRM_wrapper::*)(
-                ::ompl::base::PlannerTerminationCondition const & ))(&PRM_wrapper::default_solve), bp::arg("ptc") );
-
-            // HACK ALERT: closing brace destroys bp::scope,
-            // so that PRMstar is not a nested class of PRM
-            }
-            {
-                // wrapper for PRMstar, derived from single-threaded PRM_wrapper
-                bp::class_<PRMstar_wrapper, bp::bases< PRM_wrapper >, boost::noncopyable >("PRMstar", bp::init< ompl::base::SpaceInformationPtr const & >( bp::arg("si") ) )
-            """)
-        # Add wrapper code for PRM*
-        PRM_cls.add_declaration_code("""
-        class PRMstar_wrapper : public PRM_wrapper
-        {
-        public:
-            PRMstar_wrapper(const ompl::base::SpaceInformationPtr &si) : PRM_wrapper(si, true)
-            {
-                setName("PRMstar");
-                params_.remove("max_nearest_neighbors");
-            }
-        };
-        """)
         # LazyPRM's Vertex type is void* so exclude addMilestone which has return type void*
         self.ompl_ns.class_('LazyPRM').member_function('addMilestone').exclude()
-        # avoid difficulties in exporting the return type std::vector<base::PlannerDataPtr>
-        # do this for all multithreaded planners
-        for planner in ['SPARS', 'SPARStwo']:
-            cls = self.ompl_ns.class_(planner)
-            cls.constructor(arg_types=["::ompl::base::SpaceInformationPtr const &"]).exclude()
-            cls.add_registration_code(
-                'def(bp::init<ompl::base::SpaceInformationPtr const &>(bp::arg("si")))')
-            cls.add_wrapper_code("""
-            {0}_wrapper(::ompl::base::SpaceInformationPtr const &si) : ompl::geometric::{0}(si),
-                bp::wrapper<ompl::geometric::{0}>()
-            {{
-                OMPL_WARN("%s: this planner uses multiple threads and might crash if your StateValidityChecker, OptimizationObjective, etc., are allocated within Python.", getName().c_str());
-            }}
-            """.format(planner))
-
         # exclude methods that use problematic types
         cls = self.ompl_ns.class_('SPARS')
         cls.member_function('addPathToSpanner').exclude()
@@ -893,6 +1384,95 @@ class ompl_tools_generator_t(code_generator_t):
             'def("addPlannerAllocator", &ompl::tools::Benchmark::addPlannerAllocator)')
         self.ompl_ns.class_('OptimizePlan').add_registration_code(
             'def("addPlannerAllocator", &ompl::tools::OptimizePlan::addPlannerAllocator)')
+        # release the GIL while planning in multiple threads
+        add_method_without_gil(self.ompl_ns.class_('OptimizePlan'), 'solve',
+            '::ompl::tools::OptimizePlan::solve',
+            '::ompl::base::PlannerStatus(::ompl::tools::OptimizePlan::*)(double, unsigned int, unsigned int)',
+            'bp::arg("solveTime"), bp::arg("maxSol")=10, bp::arg("nthreads")=1')
+        # release the GIL while benchmarking; if ompl.tools.Profiler is running,
+        # the calls into Python made during each run are recorded as run properties
+        benchmark_cls.member_functions(lambda method: method.name.startswith('get') and
+                                       method.name.endswith('Event')).exclude()
+        benchmark_cls.add_declaration_code('#include "ompl/util/String.h"')
+        benchmark_cls.add_declaration_code('#include <set>')
+        benchmark_cls.add_declaration_code("""
+void Benchmark_benchmark(ompl::tools::Benchmark &benchmark, const ompl::tools::Benchmark::Request &req)
+{
+    detail::CallbackStatistics &stats = detail::CallbackStatistics::instance();
+    if (!stats.enabled())
+    {
+        detail::ReleaseGIL releaseGIL;
+        benchmark.benchmark(req);
+        return;
+    }
+    ompl::tools::Benchmark::PreSetupEvent preRun = benchmark.getPreRunEvent();
+    ompl::tools::Benchmark::PostSetupEvent postRun = benchmark.getPostRunEvent();
+    benchmark.setPreRunEvent([&stats, preRun](const ompl::base::PlannerPtr &planner)
+        {
+            if (preRun)
+                preRun(planner);
+            detail::EnsureGIL ensureGIL;
+            stats.clear();
+        });
+    benchmark.setPostRunEvent([&stats, postRun](const ompl::base::PlannerPtr &planner,
+                                                ompl::tools::Benchmark::RunProperties &run)
+        {
+            {
+                detail::EnsureGIL ensureGIL;
+                for (const auto &entry : stats.get())
+                {
+                    run["python " + entry.first + " calls INTEGER"] = std::to_string(entry.second.calls);
+                    run["python " + entry.first + " time REAL"] = ompl::toString(entry.second.time);
+                }
+            }
+            if (postRun)
+                postRun(planner, run);
+        });
+    try
+    {
+        detail::ReleaseGIL releaseGIL;
+        benchmark.benchmark(req);
+    }
+    catch (...)
+    {
+        benchmark.setPreRunEvent(preRun);
+        benchmark.setPostRunEvent(postRun);
+        throw;
+    }
+    benchmark.setPreRunEvent(preRun);
+    benchmark.setPostRunEvent(postRun);
+
+    // a callback type is only recorded in the runs in which it was called,
+    // so add the missing ones with zero counts to give all runs the same
+    // properties (the recorded data belongs to this non-const benchmark)
+    auto &experiment = const_cast<ompl::tools::Benchmark::CompleteExperiment &>(
+        benchmark.getRecordedExperimentData());
+    for (auto &planner : experiment.planners)
+    {
+        std::set<std::string> names;
+        for (const auto &run : planner.runs)
+            for (const auto &property : run)
+                if (property.first.compare(0, 7, "python ") == 0)
+                    names.insert(property.first);
+        for (auto &run : planner.runs)
+            for (const auto &name : names)
+                run.emplace(name, "0");
+    }
+}
+""")
+        benchmark_cls.add_registration_code(
+            'def("benchmark", &Benchmark_benchmark, (bp::arg("req")))')
+        parallel_plan_cls = self.ompl_ns.class_('ParallelPlan')
+        for (termination, termination_arg) in [('double', 'solveTime'),
+                                               ('::ompl::base::PlannerTerminationCondition const &', 'ptc')]:
+            add_method_without_gil(parallel_plan_cls, 'solve', '::ompl::tools::ParallelPlan::solve',
+                '::ompl::base::PlannerStatus(::ompl::tools::ParallelPlan::*)(%s, bool)' % termination,
+                'bp::arg("%s"), bp::arg("hybridize")=true' % termination_arg)
+            add_method_without_gil(parallel_plan_cls, 'solve', '::ompl::tools::ParallelPlan::solve',
+                '::ompl::base::PlannerStatus(::ompl::tools::ParallelPlan::*)'
+                '(%s, std::size_t, std::size_t, bool)' % termination,
+                'bp::arg("%s"), bp::arg("minSolCount"), bp::arg("maxSolCount"), '
+                'bp::arg("hybridize")=true' % termination_arg)
         self.add_function_wrapper('void(const ompl::base::PlannerPtr)', \
             'PreSetupEvent', 'Pre-setup event')
         self.add_function_wrapper(
@@ -959,6 +1539,7 @@ class ompl_morse_generator_t(code_generator_t):
             'bp::arg("other") )))' % stype)
         # add array access to double components of state
         self.add_array_access(state, 'double')
+        self.add_state_serialization(state, 'ompl::base::%sStateSpace' % stype)
 
 
 if __name__ == '__main__':
@@ -36,6 +36,8 @@
 
 #include <Eigen/Eigen>
 #include <boost/python/numpy.hpp>
+#include <array>
+#include <utility>
 
 namespace bp = boost::python;
 namespace np = boost::python::numpy;
@@ -46,45 +48,110 @@ namespace np = boost::python::numpy;
     EigenFromPython<const Type, N>();                                                                                  \
     bp::to_python_converter<Eigen::Ref<const Type>, EigenToPython<const Type>>();
 
+/* NumPy arrays that were most recently created by EigenToPython. The same
+   Eigen objects are typically passed to Python many times in a row (e.g., the
+   point, function value and Jacobian in each iteration of
+   Constraint::project), so instead of allocating a new capsule and ndarray
+   for every call the array that wraps the same memory with the same shape and
+   strides is reused, unless Python code has since changed that array's shape,
+   strides, dtype or writeable flag. The arrays do not own their data either way. Converters
+   are only called with the GIL held, so no further locking is needed. */
+class EigenArrayCache
+{
+public:
+    static EigenArrayCache &instance()
+    {
+        // never destroyed, so that no Python objects are released after the
+        // interpreter has been finalized
+        static auto *cache = new EigenArrayCache;
+        return *cache;
+    }
+
+    template <typename T>
+    PyObject *get(const Eigen::Ref<T> &m, bool isVector)
+    {
+        Key key{const_cast<double *>(m.data()), m.rows(), m.cols(), m.rowStride(), m.colStride(), isVector};
+        std::size_t slot = next_;
+        for (std::size_t i = 0; i < entries_.size(); ++i)
+            if (entries_[i].second.ptr() != Py_None && entries_[i].first == key)
+            {
+                if (isUnchanged(entries_[i].second, key))
+                    return bp::incref(entries_[i].second.ptr());
+                // replace the modified array
+                slot = i;
+                break;
+            }
+
+        auto *map = new Eigen::Map<Eigen::MatrixXd, 0, Eigen::Stride<Eigen::Dynamic, Eigen::Dynamic>>(
+            key.data, key.rows, key.cols, Eigen::Stride<Eigen::Dynamic, Eigen::Dynamic>(key.colStride, key.rowStride));
+        bp::object capsule(bp::handle<>(PyCapsule_New(map, nullptr, [](PyObject *ptr) {
+            delete (Eigen::Map<Eigen::MatrixXd, 0, Eigen::Stride<Eigen::Dynamic, Eigen::Dynamic>> *)
+                PyCapsule_GetPointer(ptr, nullptr);
+        })));
+        bp::object array =
+            isVector ? np::from_data(key.data, np::dtype::get_builtin<double>(), bp::make_tuple(key.rows),
+                                     bp::make_tuple(key.rowStride * sizeof(double)), capsule) :
+                       np::from_data(key.data, np::dtype::get_builtin<double>(), bp::make_tuple(key.rows, key.cols),
+                                     bp::make_tuple(key.rowStride * sizeof(double), key.colStride * sizeof(double)),
+                                     capsule);
+        entries_[slot] = std::make_pair(key, array);
+        if (slot == next_)
+            next_ = (next_ + 1) % entries_.size();
+        return bp::incref(array.ptr());
+    }
+
+private:
+    struct Key
+    {
+        double *data;
+        Eigen::Index rows, cols, rowStride, colStride;
+        bool isVector;
+
+        bool operator==(const Key &other) const
+        {
+            return data == other.data && rows == other.rows && cols == other.cols && rowStride == other.rowStride &&
+                   colStride == other.colStride && isVector == other.isVector;
+        }
+    };
+
+    EigenArrayCache() = default;
+
+    /* Return whether a cached array still has the layout it was created with.
+       Python callbacks can change an array in place (e.g., by assigning to its
+       shape or flags), and such an array should not be passed again. */
+    static bool isUnchanged(const bp::object &object, const Key &key)
+    {
+        np::ndarray array = bp::extract<np::ndarray>(object);
+        const auto elementSize = static_cast<Py_intptr_t>(sizeof(double));
+        if (array.get_nd() != (key.isVector ? 1 : 2) || array.get_data() != reinterpret_cast<char *>(key.data) ||
+            !(array.get_flags() & np::ndarray::WRITEABLE) ||
+            !np::equivalent(array.get_dtype(), np::dtype::get_builtin<double>()) || array.shape(0) != key.rows ||
+            array.strides(0) != key.rowStride * elementSize)
+            return false;
+        return key.isVector || (array.shape(1) == key.cols && array.strides(1) == key.colStride * elementSize);
+    }
+
+    std::array<std::pair<Key, bp::object>, 16> entries_;
+    std::size_t next_{0};
+};
+
 template <typename T>
 struct EigenToPython
 {
     static PyObject *convert(const Eigen::Ref<T> &m)
     {
-        double *data = const_cast<double *>(m.data());
-        bp::object capsule(
-            bp::handle<>(PyCapsule_New(new Eigen::Map<T>(data, m.rows(), m.cols()), nullptr, [](PyObject *ptr) {
-                delete (Eigen::Map<T> *)PyCapsule_GetPointer(ptr, nullptr);
-            })));
-        return boost::python::incref(
-            np::from_data(data, np::dtype::get_builtin<double>(), bp::make_tuple(m.rows(), m.cols()),
-                          bp::make_tuple(m.rowStride() * sizeof(double), m.colStride() * sizeof(double)), capsule)
-                .ptr());
+        return EigenArrayCache::instance().get<T>(m, false);
     }
 };
 template <>
 PyObject *EigenToPython<Eigen::VectorXd>::convert(const Eigen::Ref<Eigen::VectorXd> &v)
 {
-    double *data = const_cast<double *>(v.data());
-    bp::object capsule(
-        bp::handle<>(PyCapsule_New(new Eigen::Map<Eigen::VectorXd>(data, v.rows()), nullptr, [](PyObject *ptr) {
-            delete (Eigen::Map<Eigen::VectorXd> *)PyCapsule_GetPointer(ptr, nullptr);
-        })));
-    return boost::python::incref(np::from_data(data, np::dtype::get_builtin<double>(), bp::make_tuple(v.rows()),
-                                               bp::make_tuple(v.innerStride() * sizeof(double)), capsule)
-                                     .ptr());
+    return EigenArrayCache::instance().get<Eigen::VectorXd>(v, true);
 }
 template <>
 PyObject *EigenToPython<const Eigen::VectorXd>::convert(const Eigen::Ref<const Eigen::VectorXd> &v)
 {
-    double *data = const_cast<double *>(v.data());
-    bp::object capsule(
-        bp::handle<>(PyCapsule_New(new Eigen::Map<Eigen::VectorXd>(data, v.rows()), nullptr, [](PyObject *ptr) {
-            delete (Eigen::Map<Eigen::VectorXd> *)PyCapsule_GetPointer(ptr, nullptr);
-        })));
-    return boost::python::incref(np::from_data(data, np::dtype::get_builtin<double>(), bp::make_tuple(v.rows()),
-                                               bp::make_tuple(v.innerStride() * sizeof(double)), capsule)
-                                     .ptr());
+    return EigenArrayCache::instance().get<const Eigen::VectorXd>(v, true);
 }
 
 template <typename T>
@@ -0,0 +1,121 @@
+/*********************************************************************
+* Software License Agreement (BSD License)
+*
+*  Copyright (c) 2026, Rice University
+*  All rights reserved.
+*
+*  Redistribution and use in source and binary forms, with or without
+*  modification, are permitted provided that the following conditions
+*  are met:
+*
+*   * Redistributions of source code must retain the above copyright
+*     notice, this list of conditions and the following disclaimer.
+*   * Redistributions in binary form must reproduce the above
+*     copyright notice, this list of conditions and the following
+*     disclaimer in the documentation and/or other materials provided
+*     with the distribution.
+*   * Neither the name of the Rice University nor the names of its
+*     contributors may be used to endorse or promote products derived
+*     from this software without specific prior written permission.
+*
+*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+*  POSSIBILITY OF SUCH DAMAGE.
+*********************************************************************/
+
+// NumPy access to the values of states. This file is included in the
+// generated code for the ompl.base module if Boost.Python's NumPy support is
+// available (see generate_bindings.py). It relies on np::initialize() having
+// been called.
+
+#include "py_ndarray.hpp"
+
+namespace
+{
+    // Return a writable view of the values of a RealVectorStateSpace::StateType.
+    // The state does not know its own dimension, so it has to be passed in.
+    bp::object realVectorStateAsArray(bp::object self, unsigned int dim)
+    {
+        auto &state = bp::extract<ompl::base::RealVectorStateSpace::StateType &>(self)();
+        return np::from_data(state.values, np::dtype::get_builtin<double>(), bp::make_tuple(dim),
+                             bp::make_tuple(sizeof(double)), self);
+    }
+
+    // Return a writable view of the values of a ScopedState if its space is a
+    // RealVectorStateSpace; otherwise, return a flattened copy of its values
+    // (as computed by StateSpace::copyToReals).
+    template <typename T>
+    bp::object scopedStateAsArray(bp::object self)
+    {
+        auto &state = bp::extract<ompl::base::ScopedState<T> &>(self)();
+        const ompl::base::StateSpacePtr &space = state.getSpace();
+        ompl::base::State *s = state.get();
+        if (auto *rvSpace = dynamic_cast<ompl::base::RealVectorStateSpace *>(space.get()))
+            return np::from_data(s->as<ompl::base::RealVectorStateSpace::StateType>()->values,
+                                 np::dtype::get_builtin<double>(), bp::make_tuple(rvSpace->getDimension()),
+                                 bp::make_tuple(sizeof(double)), self);
+
+        std::size_t dim = detail::stateDimension(space);
+        std::vector<double> reals;
+        space->copyToReals(reals, s);
+        np::ndarray result = np::empty(bp::make_tuple(dim), np::dtype::get_builtin<double>());
+        std::copy(reals.begin(), reals.end(), reinterpret_cast<double *>(result.get_data()));
+        return result;
+    }
+
+    // Return a writable view of the values of all states in a StateArena (one
+    // row per state) if its space is a RealVectorStateSpace; otherwise, return
+    // a copy of their values (as computed by StateSpace::copyToReals).
+    bp::object stateArenaAsArray(bp::object self)
+    {
+        auto &arena = bp::extract<ompl::base::StateArena &>(self)();
+        const ompl::base::StateSpacePtr &space = arena.getStateSpace();
+        std::size_t dim = detail::stateDimension(space);
+        if (double *values = arena.getValues())
+            return np::from_data(values, np::dtype::get_builtin<double>(), bp::make_tuple(arena.size(), dim),
+                                 bp::make_tuple(dim * sizeof(double), sizeof(double)), self);
+
+        std::vector<double> reals;
+        np::ndarray result = np::empty(bp::make_tuple(arena.size(), dim), np::dtype::get_builtin<double>());
+        auto *data = reinterpret_cast<double *>(result.get_data());
+        for (std::size_t i = 0; i < arena.size(); ++i)
+        {
+            space->copyToReals(reals, arena.getState(i));
+            std::copy(reals.begin(), reals.end(), data + i * dim);
+        }
+        return result;
+    }
+
+    // Add a method to the Python class that wraps the C++ type T
+    template <typename T>
+    void addMethod(const char *name, bp::object method)
+    {
+        PyTypeObject *type = bp::converter::registered<T>::converters.get_class_object();
+        bp::object(bp::handle<>(bp::borrowed(type))).attr(name) = method;
+    }
+
+    // Add asarray() to the Python types for RealVectorStateSpace::StateType and ScopedState<T>
+    template <typename... T>
+    void addStateAsArray()
+    {
+        addMethod<ompl::base::RealVectorStateSpace::StateType>(
+            "asarray", bp::make_function(&realVectorStateAsArray, bp::default_call_policies(),
+                                         (bp::arg("self"), bp::arg("dim"))));
+        (addMethod<ompl::base::ScopedState<T>>("asarray", bp::make_function(&scopedStateAsArray<T>)), ...);
+    }
+
+    // Add asarray() to the Python type for StateArena
+    void addStateArenaAsArray()
+    {
+        addMethod<ompl::base::StateArena>("asarray", bp::make_function(&stateArenaAsArray));
+    }
+}
@@ -1,8 +1,19 @@
+# names of the subpackages of ompl, which are only imported when first accessed
+SUBMODULES = ('util', 'base', 'geometric', 'control', 'tools', 'morse')
+
+# shared libraries that have already been loaded by dll_loader
+_loadedLibraries = {}
+
 def dll_loader(lib, path):
+    """Load the shared library lib with global symbol visibility. It is looked
+    up in path first, then by the dynamic linker's default search, and only as
+    a last resort with ctypes.util.find_library (which may spawn a compiler or
+    ldconfig). Every library is resolved only once per process."""
+    if lib in _loadedLibraries:
+        return _loadedLibraries[lib]
     from platform import system
     from os.path import isfile
     import ctypes
-    from ctypes.util import find_library
 
     sys = system()
     if sys == 'Windows':
@@ -12,27 +23,182 @@ def dll_loader(lib, path):
     else: # Linux, other UNIX systems
         ext = '.so'
     fname = path + '/lib' + lib + ext
-    if not isfile(fname):
-        fname = find_library(lib)
-    ctypes.CDLL(fname, ctypes.RTLD_GLOBAL)
+    if isfile(fname):
+        handle = ctypes.CDLL(fname, ctypes.RTLD_GLOBAL)
+    else:
+        try:
+            handle = ctypes.CDLL('lib' + lib + ext, ctypes.RTLD_GLOBAL)
+        except OSError:
+            from ctypes.util import find_library
+            handle = ctypes.CDLL(find_library(lib), ctypes.RTLD_GLOBAL)
+    _loadedLibraries[lib] = handle
+    return handle
+
+def lazyExtension(name, dependencies=(), initialize=None, attributes=None):
+    """Return the functions __getattr__ and __dir__ for the package name (see
+    PEP 562), such that its Boost.Python extension module name._<module> is
+    only imported when an attribute of the package is first accessed. The
+    packages in dependencies are loaded first, then all public names of the
+    extension module are added to the package and initialize() is called (if
+    given). Accessing __all__ also loads the extension, so that
+    "from package import *" keeps working. attributes optionally maps names of
+    pure Python classes or functions to the modules that define them; these
+    modules are imported when the name is first accessed, without loading
+    the extension."""
+    from importlib import import_module
+    import sys
+    attributes = {} if attributes is None else attributes
+
+    def load():
+        namespace = vars(sys.modules[name])
+        if '__all__' in namespace:
+            return
+        # placeholder that prevents recursive loading from initialize()
+        namespace['__all__'] = []
+        try:
+            for dependency in dependencies:
+                getattr(import_module(dependency), '__all__', None)
+            extension = import_module('%s._%s' % (name, name.split('.')[-1]))
+            namespace.update((attr, value) for attr, value in vars(extension).items()
+                             if not attr.startswith('_'))
+            if initialize is not None:
+                initialize()
+        except:
+            del namespace['__all__']
+            raise
+        namespace['__all__'] = sorted(set(attributes).union(
+            attr for attr, value in namespace.items()
+            if not attr.startswith('_') and value is not lazyExtension))
+
+    def __getattr__(attr):
+        # don't load the extension for special attributes that are looked up
+        # speculatively, e.g., by inspect or pickle
+        if attr.startswith('__') and attr != '__all__':
+            raise AttributeError('module %r has no attribute %r' % (name, attr))
+        if attr in attributes:
+            value = getattr(import_module(attributes[attr]), attr)
+            vars(sys.modules[name])[attr] = value
+            return value
+        load()
+        try:
+            return vars(sys.modules[name])[attr]
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' % (name, attr)) from None
+
+    def __dir__():
+        load()
+        return sorted(set(vars(sys.modules[name])).union(attributes))
+
+    return __getattr__, __dir__
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        from importlib import import_module
+        return import_module('ompl.' + name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+def __dir__():
+    return sorted(list(globals()) + list(SUBMODULES))
 
 class PlanningAlgorithms(object):
+    """Parameter information for the planners in an OMPL Python module.
+
+    Computing this information requires creating an instance of every planner,
+    so the result is cached on disk (see plannerCacheDir()) and loaded lazily.
+    The cache is invalidated whenever the compiled module changes."""
     UNKNOWN = 0
     BOOL = 1
     ENUM = 2
     INT = 3
     DOUBLE = 4
+    CACHE_FORMAT = 2
 
     def __init__(self, module):
+        self.module = module
+        # planner name -> parameter map, or None if the planner parameters
+        # cannot be determined
+        self.plannerMap = None
+        self.complete = False
+
+    def cacheFile(self):
+        """Return the path of the file that caches the parameter information, or
+        None if the module is not backed by a compiled extension module."""
+        from hashlib import sha1
+        from os import stat
+        from os.path import join
+        name = self.module.__name__
+        extension = getattr(self.module, '_' + name.split('.')[-1], None)
+        try:
+            info = stat(extension.__file__)
+        except (AttributeError, TypeError, OSError):
+            return None
+        key = sha1(('%d:%s:%d:%d' % (self.CACHE_FORMAT, extension.__file__, info.st_size,
+                                     info.st_mtime_ns)).encode()).hexdigest()[:16]
+        return join(plannerCacheDir(), 'planners-%s-%s.json' % (name, key))
+
+    def loadCache(self):
+        if self.plannerMap is not None:
+            return
+        import json
         self.plannerMap = {}
-        for obj in dir(module):
-            obj2 = '%s.%s' % (module.__name__, obj)
-            self.addPlanner(obj2)
+        fname = self.cacheFile()
+        if fname is None:
+            return
+        try:
+            with open(fname) as f:
+                cache = json.load(f)
+            self.plannerMap = {planner: None if params is None else
+                               {pname: tuple(p) for pname, p in params.items()}
+                               for planner, params in cache['planners'].items()}
+            self.complete = cache['complete']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
 
-    def addPlanner(self, planner):
+    def saveCache(self):
+        import json
+        from os import makedirs, replace
+        from os.path import dirname
+        from tempfile import NamedTemporaryFile
+        fname = self.cacheFile()
+        if fname is None:
+            return
+        try:
+            makedirs(dirname(fname), exist_ok=True)
+            # write to a temporary file first, so that concurrent readers never
+            # see a partially written cache
+            with NamedTemporaryFile('w', dir=dirname(fname), suffix='.tmp', delete=False) as f:
+                json.dump({'planners': self.plannerMap, 'complete': self.complete}, f)
+            replace(f.name, fname)
+        except OSError:
+            pass
+
+    def isPlanner(self, planner):
+        """Return whether planner, given by its fully qualified name, is a
+        planner class. This does not create an instance of the planner."""
         from inspect import isclass
         import ompl
-        if eval('isclass(%s) and issubclass(%s,ompl.base.Planner)' % (planner, planner)):
+        obj = getattr(self.module, planner.split('.')[-1], None)
+        return isclass(obj) and issubclass(obj, ompl.base.Planner)
+
+    def addPlanner(self, planner):
+        """Determine the parameters of a planner, given by its fully qualified
+        name (e.g., 'ompl.geometric.RRT'), and add them to the planner map.
+        Names that do not refer to a planner class are not added."""
+        import ompl
+        self.loadCache()
+        if not self.isPlanner(planner):
+            return
+        self.plannerMap[planner] = None
+        logLevel = ompl.util.getLogLevel()
+        ompl.util.setLogLevel(ompl.util.LogLevel.LOG_ERROR)
+        try:
+            self.plannerMap[planner] = self.computeParams(planner)
+        finally:
+            ompl.util.setLogLevel(logLevel)
+
+    def computeParams(self, planner):
+        import ompl
+        if self.isPlanner(planner):
             try:
                 # Get a parameter dictionary by creating a bogus planner instance.
                 # Note that ompl.control.SpaceInformation is derived from
@@ -55,7 +221,7 @@ class PlanningAlgorithms(object):
                     params = plannerObject.params()
                 except:
                     # skip other planners that don't have a basic constructor
-                    return
+                    return None
             pnames = ompl.util.vectorString()
             params.getParamNames(pnames)
             paramMap = {}
@@ -91,17 +257,48 @@ class PlanningAlgorithms(object):
                 name = p.getName()
                 displayName = name.replace('_', ' ').capitalize()
                 paramMap[p.getName()] = (displayName, rangeType, rangeSuggestion, defaultValue)
-            self.plannerMap[planner] = paramMap
+            return paramMap
+        return None
+
+    def getPlannerParams(self, planner):
+        """Return the parameter map of a single planner, given by its fully
+        qualified name, or None if it is not a planner with a basic constructor.
+        Only this planner is instantiated if its parameters are not cached."""
+        self.loadCache()
+        if planner not in self.plannerMap:
+            self.addPlanner(planner)
+            if planner not in self.plannerMap:
+                return None
+            self.saveCache()
+        return self.plannerMap[planner]
 
     def getPlanners(self):
-        return self.plannerMap
+        """Return a dictionary with the parameter maps of all planners in the module."""
+        self.loadCache()
+        if not self.complete:
+            for obj in dir(self.module):
+                planner = '%s.%s' % (self.module.__name__, obj)
+                if planner not in self.plannerMap:
+                    self.addPlanner(planner)
+            self.complete = True
+            self.saveCache()
+        return {planner: params for planner, params in self.plannerMap.items()
+                if params is not None}
+
+def plannerCacheDir():
+    """Return the directory used to cache planner parameter information. It can
+    be set with the environment variable OMPL_CACHE_DIR."""
+    from os import environ
+    from os.path import expanduser, join
+    if 'OMPL_CACHE_DIR' in environ:
+        return environ['OMPL_CACHE_DIR']
+    return join(environ.get('XDG_CACHE_HOME', expanduser(join('~', '.cache'))), 'ompl')
 
 def initializePlannerLists():
-    import ompl.geometric, ompl.control, ompl.util
-    logLevel = ompl.util.getLogLevel()
-    ompl.util.setLogLevel(ompl.util.LogLevel.LOG_ERROR)
+    # the planner parameters are only determined (or loaded from the cache)
+    # when they are first requested
+    import ompl.geometric, ompl.control
     if ompl.geometric.planners is None:
         ompl.geometric.planners = ompl.PlanningAlgorithms(ompl.geometric)
     if ompl.control.planners is None:
         ompl.control.planners = ompl.PlanningAlgorithms(ompl.control)
-    ompl.util.setLogLevel(logLevel)
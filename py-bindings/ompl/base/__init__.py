@@ -1,2 +1,117 @@
-from ompl import util
-from ompl.base._base import *
+from ompl import util, lazyExtension
+
+def cFunctionAddress(fn):
+    """Return the address of a C function given as a ctypes or cffi function
+    pointer, or None if fn is neither."""
+    import ctypes
+    if isinstance(fn, ctypes._CFuncPtr):
+        return ctypes.cast(fn, ctypes.c_void_p).value
+    if type(fn).__module__ == '_cffi_backend':
+        import cffi
+        ffi = cffi.FFI()
+        if ffi.typeof(fn).kind in ('function', 'pointer'):
+            return int(ffi.cast('uintptr_t', fn))
+    return None
+
+def cFunctionObject(cls, si, fn):
+    """Return cls(si, address), where address is the address of the C function
+    pointer fn. fn is kept alive as long as the returned object."""
+    obj = cls(si, cFunctionAddress(fn))
+    obj.cfunction = fn
+    return obj
+
+def acceptCFunction(setter, setCFunction):
+    """Return a version of the method setter that calls setCFunction(self, fn)
+    instead if fn is a C function pointer."""
+    def setFunction(self, fn):
+        if cFunctionAddress(fn) is not None:
+            setCFunction(self, fn)
+        else:
+            setter(self, fn)
+    setFunction.__doc__ = setter.__doc__
+    return setFunction
+
+def _reduceStateSpace(space):
+    """Return the arguments for pickling one of the predefined state spaces.
+    States, paths and planner data are pickled together with the state space
+    they belong to."""
+    cls = type(space)
+    if cls is RealVectorStateSpace:
+        args = (space.getDimension(),)
+    elif cls is DiscreteStateSpace:
+        args = (space.getLowerBound(), space.getUpperBound())
+    elif cls in (SO2StateSpace, SO3StateSpace, SE2StateSpace, SE3StateSpace, TimeStateSpace,
+                 CompoundStateSpace):
+        args = ()
+    else:
+        from pickle import PicklingError
+        raise PicklingError('cannot pickle state space of type %s; only the predefined '
+                            'state spaces can be pickled' % cls.__name__)
+    settings = {'name': space.getName(),
+                'longestValidSegmentFraction': space.getLongestValidSegmentFraction()}
+    if cls in (RealVectorStateSpace, SE2StateSpace, SE3StateSpace):
+        bounds = space.getBounds()
+        settings['bounds'] = (list(bounds.low), list(bounds.high))
+    if cls is RealVectorStateSpace:
+        settings['dimensionNames'] = [space.getDimensionName(i) for i in range(args[0])]
+    elif cls is TimeStateSpace and space.isBounded():
+        settings['bounds'] = (space.getMinTimeBound(), space.getMaxTimeBound())
+    elif cls is CompoundStateSpace:
+        settings['subspaces'] = [(space.getSubspace(i), space.getSubspaceWeight(i))
+                                 for i in range(space.getSubspaceCount())]
+        settings['locked'] = space.isLocked()
+    return (cls, args, settings)
+
+def _setStateSpaceState(space, settings):
+    for subspace, weight in settings.get('subspaces', []):
+        space.addSubspace(subspace, weight)
+    if settings.get('locked'):
+        space.lock()
+    if 'bounds' in settings:
+        if isinstance(space, TimeStateSpace):
+            space.setBounds(*settings['bounds'])
+        else:
+            low, high = settings['bounds']
+            bounds = RealVectorBounds(len(low))
+            for i, (l, h) in enumerate(zip(low, high)):
+                bounds.setLow(i, l)
+                bounds.setHigh(i, h)
+            space.setBounds(bounds)
+    for i, name in enumerate(settings.get('dimensionNames', [])):
+        if name:
+            space.setDimensionName(i, name)
+    space.setName(settings['name'])
+    if space.getLongestValidSegmentFraction() != settings['longestValidSegmentFraction']:
+        space.setLongestValidSegmentFraction(settings['longestValidSegmentFraction'])
+
+def _reduceSpaceInformation(si):
+    """Return the arguments for pickling a SpaceInformation object. Only the
+    state space is stored; the state validity checker and motion validator are
+    not."""
+    if type(si) is not SpaceInformation:
+        from pickle import PicklingError
+        raise PicklingError('cannot pickle space information of type %s' % type(si).__name__)
+    return (SpaceInformation, (si.getStateSpace(),))
+
+def _initialize():
+    # A state validity checker can also be a ctypes or cffi pointer to a C function
+    #     int isValid(const double *state, unsigned int dim)
+    # It is then called directly from C++ without acquiring the GIL.
+    setStateValidityChecker = SpaceInformation.setStateValidityChecker
+    SpaceInformation.setStateValidityChecker = acceptCFunction(setStateValidityChecker,
+        lambda si, fn: setStateValidityChecker(
+            si, cFunctionObject(CFunctionStateValidityChecker, si, fn)))
+
+    # ScopedState, PlannerData and the path classes implement __reduce__ by
+    # passing their serialized states to the constructor of their state space
+    # or space information, which therefore need to be picklable as well
+    # (Boost.Python defines __reduce__ for every class, so it has to be
+    # replaced in all derived classes)
+    for cls in list(globals().values()):
+        if isinstance(cls, type) and issubclass(cls, StateSpace):
+            cls.__reduce__ = _reduceStateSpace
+            cls.__setstate__ = _setStateSpaceState
+    SpaceInformation.__reduce__ = _reduceSpaceInformation
+
+# the extension module ompl.base._base is imported when first needed
+__getattr__, __dir__ = lazyExtension(__name__, ['ompl.util'], _initialize)
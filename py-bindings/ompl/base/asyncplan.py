@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+######################################################################
+# Software License Agreement (BSD License)
+#
+#  Copyright (c) 2026, Rice University
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions
+#  are met:
+#
+#   * Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above
+#     copyright notice, this list of conditions and the following
+#     disclaimer in the documentation and/or other materials provided
+#     with the distribution.
+#   * Neither the name of the Rice University nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+#  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+#  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+#  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+#  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+#  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+######################################################################
+
+import asyncio
+import threading
+
+def _runInThread(fn, *args):
+    """Call fn(*args) in a new thread and return an asyncio future for its
+    result. The methods of OMPL that take a long time release the GIL, so the
+    event loop keeps running in the meantime."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def setResult(result):
+        if not future.done():
+            future.set_result(result)
+
+    def setException(exception):
+        if not future.done():
+            future.set_exception(exception)
+
+    def run():
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            loop.call_soon_threadsafe(setException, e)
+        else:
+            loop.call_soon_threadsafe(setResult, result)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+async def _waitForSolve(future, ptc):
+    """Wait for a solve() call running in another thread. If the waiting task
+    is cancelled, the planner is stopped through its termination condition and
+    the cancellation is propagated once the planner has returned."""
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        ptc.terminate()
+        await asyncio.wait([future])
+        raise
+
+async def solveAsync(self, solveTime):
+    """Coroutine that solves the planning problem for at most solveTime
+    seconds in a separate thread and returns the planner status. Cancelling
+    the task that awaits it terminates the planner."""
+    from ompl import base as ob
+    ptc = ob.timedPlannerTerminationCondition(solveTime)
+    return await _waitForSolve(_runInThread(self.solve, ptc), ptc)
+
+async def intermediateSolutions(self, solveTime):
+    """Asynchronous generator that solves the planning problem for at most
+    solveTime seconds in a separate thread and yields a tuple (states, cost)
+    whenever the planner reports an improved solution, where states is a list
+    of copies of the solution states. Only planners that report intermediate
+    solutions (e.g., the asymptotically optimal planners) produce any. The
+    planner is terminated if the generator is closed early or the consuming
+    task is cancelled. Use getLastPlannerStatus() and getSolutionPath()
+    afterwards to obtain the final result."""
+    from ompl import base as ob
+    loop = asyncio.get_running_loop()
+    solutions = asyncio.Queue()
+    finished = object()
+    pdef = self.getProblemDefinition()
+    pdef.setIntermediateSolutionCallback(
+        lambda planner, states, cost: loop.call_soon_threadsafe(solutions.put_nowait, (states, cost)))
+    ptc = ob.timedPlannerTerminationCondition(solveTime)
+    future = _runInThread(self.solve, ptc)
+    future.add_done_callback(lambda _: solutions.put_nowait(finished))
+    try:
+        while True:
+            solution = await solutions.get()
+            if solution is finished:
+                break
+            yield solution
+        # raise the planner's exception, if any
+        future.result()
+    finally:
+        if not future.done():
+            ptc.terminate()
+            await asyncio.wait([future])
+        pdef.setIntermediateSolutionCallback(None)
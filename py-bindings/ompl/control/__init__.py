@@ -1,10 +1,91 @@
-from ompl import base
-from ompl.control._control import *
+from ompl import base, lazyExtension
 
 # call ompl.initializePlannerLists() to properly initialize this variable
 # with a dictionary of dictionaries, containing planners and associated
 # parameter info
 planners = None
 
-# type alias for std::function<void(const State*, const Control*, const double, State*)>
-PostPropagationEvent = StatePropagatorFn
+def _reduceControlSpace(space):
+    """Return the arguments for pickling one of the predefined control spaces."""
+    cls = type(space)
+    if cls is RealVectorControlSpace:
+        args = (space.getStateSpace(), space.getDimension())
+    elif cls is DiscreteControlSpace:
+        args = (space.getStateSpace(), space.getLowerBound(), space.getUpperBound())
+    elif cls is CompoundControlSpace:
+        args = (space.getStateSpace(),)
+    else:
+        from pickle import PicklingError
+        raise PicklingError('cannot pickle control space of type %s; only the predefined '
+                            'control spaces can be pickled' % cls.__name__)
+    settings = {'name': space.getName()}
+    if cls is RealVectorControlSpace:
+        bounds = space.getBounds()
+        settings['bounds'] = (list(bounds.low), list(bounds.high))
+    elif cls is CompoundControlSpace:
+        settings['subspaces'] = [space.getSubspace(i) for i in range(space.getSubspaceCount())]
+    return (cls, args, settings)
+
+def _setControlSpaceState(space, settings):
+    for subspace in settings.get('subspaces', []):
+        space.addSubspace(subspace)
+    if 'bounds' in settings:
+        low, high = settings['bounds']
+        bounds = base.RealVectorBounds(len(low))
+        for i, (l, h) in enumerate(zip(low, high)):
+            bounds.setLow(i, l)
+            bounds.setHigh(i, h)
+        space.setBounds(bounds)
+    space.setName(settings['name'])
+
+def _reduceSpaceInformation(si):
+    """Return the arguments for pickling a SpaceInformation object. Only the
+    state and control spaces and the propagation settings are stored; the
+    state validity checker and state propagator are not."""
+    if type(si) is not SpaceInformation:
+        from pickle import PicklingError
+        raise PicklingError('cannot pickle space information of type %s' % type(si).__name__)
+    return (SpaceInformation, (si.getStateSpace(), si.getControlSpace()),
+            (si.getPropagationStepSize(), si.getMinControlDuration(), si.getMaxControlDuration()))
+
+def _setSpaceInformationState(si, settings):
+    stepSize, minSteps, maxSteps = settings
+    si.setPropagationStepSize(stepSize)
+    si.setMinMaxControlDuration(minSteps, maxSteps)
+
+def _initialize():
+    global PostPropagationEvent
+    # type alias for std::function<void(const State*, const Control*, const double, State*)>
+    PostPropagationEvent = StatePropagatorFn
+
+    # A state propagator can also be a ctypes or cffi pointer to a C function
+    #     void propagate(const double *state, unsigned int stateDim, const double *control,
+    #                    unsigned int controlDim, double duration, double *result)
+    # It is then called directly from C++ without acquiring the GIL.
+    setStatePropagator = SpaceInformation.setStatePropagator
+    SpaceInformation.setStatePropagator = base.acceptCFunction(setStatePropagator,
+        lambda si, fn: setStatePropagator(si, base.cFunctionObject(CFunctionStatePropagator, si, fn)))
+    SimpleSetup.setStateValidityChecker = base.acceptCFunction(SimpleSetup.setStateValidityChecker,
+        lambda ss, fn: ss.getSpaceInformation().setStateValidityChecker(fn))
+    SimpleSetup.setStatePropagator = base.acceptCFunction(SimpleSetup.setStatePropagator,
+        lambda ss, fn: ss.getSpaceInformation().setStatePropagator(fn))
+
+    # see ompl.base for how states, paths and planner data are pickled
+    for cls in list(globals().values()):
+        if isinstance(cls, type) and issubclass(cls, ControlSpace):
+            cls.__reduce__ = _reduceControlSpace
+            cls.__setstate__ = _setControlSpaceState
+    SpaceInformation.__reduce__ = _reduceSpaceInformation
+    SpaceInformation.__setstate__ = _setSpaceInformationState
+
+    # awaitable versions of solve() for use with asyncio
+    from ompl.base.asyncplan import solveAsync, intermediateSolutions
+    SimpleSetup.solveAsync = solveAsync
+    SimpleSetup.intermediateSolutions = intermediateSolutions
+
+# the extension module ompl.control._control (and with it all planner classes)
+# is imported when first needed; it depends on ompl.geometric. Likewise,
+# ompl.control.odesolver (which imports NumPy) is imported when
+# ODENumPySolver is first used.
+__getattr__, __dir__ = lazyExtension(__name__, ['ompl.geometric'], _initialize,
+                                     attributes={'ODENumPySolver': 'ompl.control.odesolver'})
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+
+######################################################################
+# Software License Agreement (BSD License)
+#
+#  Copyright (c) 2026, Rice University
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions
+#  are met:
+#
+#   * Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above
+#     copyright notice, this list of conditions and the following
+#     disclaimer in the documentation and/or other materials provided
+#     with the distribution.
+#   * Neither the name of the Rice University nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+#  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+#  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+#  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+#  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+#  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+######################################################################
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Butcher tableau of the Dormand-Prince 5(4) method
+_C = (0., 1. / 5., 3. / 10., 4. / 5., 8. / 9., 1.)
+_A = ((),
+      (1. / 5.,),
+      (3. / 40., 9. / 40.),
+      (44. / 45., -56. / 15., 32. / 9.),
+      (19372. / 6561., -25360. / 2187., 64448. / 6561., -212. / 729.),
+      (9017. / 3168., -355. / 33., 46732. / 5247., 49. / 176., -5103. / 18656.))
+_B = (35. / 384., 0., 500. / 1113., 125. / 192., -2187. / 6784., 11. / 84.)
+# difference between the 5th and 4th order solutions (the last stage is the
+# derivative at the end of the step)
+_E = (-71. / 57600., 0., 71. / 16695., -71. / 1920., 17253. / 339200., -22. / 525., 1. / 40.)
+# coefficients of the 4th order continuous extension, such that a state within
+# a step is y0 + h * sum_i K_i * sum_j _P[i][j] * x**(j + 1), 0 <= x <= 1
+_P = ((1., -8048581381. / 2820520608., 8663915743. / 2820520608., -12715105075. / 11282082432.),
+      (0., 0., 0., 0.),
+      (0., 131558114200. / 32700410799., -68118460800. / 10900136933., 87487479700. / 32700410799.),
+      (0., -1754552775. / 470086768., 14199869525. / 1410260304., -10690763975. / 1880347072.),
+      (0., 127303824393. / 49829197408., -318862633887. / 49829197408., 701980252875. / 199316789632.),
+      (0., -282668133. / 205662961., 2019193451. / 616988883., -1453857185. / 822651844.),
+      (0., 40617522. / 29380423., -110615467. / 29380423., 69997945. / 29380423.))
+
+class ODEDenseOutput(object):
+    """Continuous approximation of the trajectories computed by
+    ODENumPySolver.solve(). Calling it with times t (a scalar or an array with
+    one time per trajectory, between 0 and the duration of the trajectory)
+    returns an array with the state of each trajectory at its time t."""
+
+    def __init__(self, durations, rows, starts, steps, values, coefficients):
+        self.durations = durations
+        order = np.lexsort((starts, rows))
+        # trajectories are integrated over normalized time in [0, 1]; adding
+        # twice the trajectory index gives keys that are sorted by trajectory
+        # first and by time second
+        self._keys = 2. * rows[order] + starts[order]
+        self._starts = starts[order]
+        self._steps = steps[order]
+        self._values = values[order]
+        self._coefficients = coefficients[order]
+
+    def __call__(self, t):
+        t = np.broadcast_to(np.asarray(t, dtype=float), self.durations.shape)
+        s = np.divide(t, self.durations, out=np.zeros_like(t), where=self.durations != 0.)
+        s = np.clip(s, 0., 1.)
+        index = np.searchsorted(self._keys, 2. * np.arange(len(s)) + s, side='right') - 1
+        x = (s - self._starts[index]) / self._steps[index]
+        powers = x[:, None] ** np.arange(1, 5)
+        return self._values[index] + self._steps[index, None] * np.einsum(
+            'ndk,nk->nd', self._coefficients[index], powers)
+
+class ODENumPySolver(object):
+    """Solver for ordinary differential equations q' = f(q, u) that integrates
+    many trajectories at once. The right-hand side is a vectorized function
+    ode(q, u) that receives an N x d array of states and an N x m array of
+    controls and returns the N x d array of their derivatives. Integration uses
+    the Dormand-Prince 5(4) method with an adaptive step size per trajectory
+    that keeps the estimated error below atol + rtol * |q|; intStep is the size
+    of the first step. States and controls are the values returned by
+    ompl.base.StateSpace.copyToReals() and stored in a control, respectively.
+
+    Unlike ODEBasicSolver and friends, the right-hand side is not called once
+    per integration step for every propagated state, but once per integration
+    step for all states that ompl.control.BatchStatePropagator propagates
+    together (see getStatePropagator()):
+
+        def kinematicCarODE(q, u):
+            qdot = np.empty_like(q)
+            qdot[:, 0] = u[:, 0] * np.cos(q[:, 2])
+            qdot[:, 1] = u[:, 0] * np.sin(q[:, 2])
+            qdot[:, 2] = u[:, 0] * np.tan(u[:, 1]) / carLength
+            return qdot
+
+        solver = oc.ODENumPySolver(ss.getSpaceInformation(), kinematicCarODE)
+        ss.setStatePropagator(solver.getStatePropagator())
+    """
+
+    def __init__(self, si, ode, intStep=1e-2, atol=1e-6, rtol=1e-6):
+        if np is None:
+            raise ImportError('ODENumPySolver requires NumPy')
+        self.si = si
+        self.ode = ode
+        self.intStep = intStep
+        self.atol = atol
+        self.rtol = rtol
+
+    def getSpaceInformation(self):
+        """Return the space information this solver was created for"""
+        return self.si
+
+    def setODE(self, ode):
+        """Set the right-hand side of the ODE to solve"""
+        self.ode = ode
+
+    def getIntegrationStepSize(self):
+        """Return the size of the first integration step"""
+        return self.intStep
+
+    def setIntegrationStepSize(self, intStep):
+        """Set the size of the first integration step"""
+        self.intStep = intStep
+
+    def solve(self, states, controls, durations, dense=False):
+        """Integrate the ODE from the rows of states, applying the controls in
+        the corresponding rows of controls for the given durations (which may
+        be negative). Return the array of reached states or, if dense is True,
+        a tuple of that array and an ODEDenseOutput for the trajectories."""
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        controls = np.atleast_2d(np.asarray(controls, dtype=float))
+        durations = np.broadcast_to(np.asarray(durations, dtype=float), (len(states),)).copy()
+        n, d = states.shape
+        q = states.copy()
+        # time is normalized to [0, 1] for every trajectory, so the derivative
+        # with respect to normalized time is the duration times the derivative
+        s = np.zeros(n)
+        scale = np.abs(durations)
+        h = np.minimum(1., np.divide(self.intStep, scale, out=np.ones(n), where=scale > 0.))
+        active = np.flatnonzero(durations != 0.)
+        derivative = np.zeros_like(q)
+        if active.size > 0:
+            derivative[active] = durations[active, None] * self.ode(q[active], controls[active])
+        stored = []
+
+        K = np.empty((7, n, d))
+        while active.size > 0:
+            m = active.size
+            hh = np.minimum(h[active], 1. - s[active])
+            y = q[active]
+            u = controls[active]
+            T = durations[active, None]
+            K[0, :m] = derivative[active]
+            for i in range(1, 6):
+                dy = np.tensordot(_A[i], K[:i, :m], axes=1)
+                K[i, :m] = T * self.ode(y + hh[:, None] * dy, u)
+            ynew = y + hh[:, None] * np.tensordot(_B, K[:6, :m], axes=1)
+            K[6, :m] = T * self.ode(ynew, u)
+
+            error = hh[:, None] * np.tensordot(_E, K[:, :m], axes=1)
+            tolerance = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(ynew))
+            errorNorm = np.sqrt(np.mean((error / tolerance) ** 2, axis=1))
+            # a NaN error would never be accepted nor shrink the step size
+            if not (np.isfinite(errorNorm).all() and np.isfinite(ynew).all()):
+                raise RuntimeError('ODENumPySolver: the ODE evaluated to a non-finite value')
+            accepted = errorNorm <= 1.
+            with np.errstate(divide='ignore'):
+                factor = np.clip(.9 * errorNorm ** -.2, .2, 10.)
+            h[active] = hh * np.where(accepted, factor, np.minimum(factor, 1.))
+            if not np.all(h[active] >= 1e-12):
+                raise RuntimeError('ODENumPySolver: step size became too small')
+
+            rows = active[accepted]
+            if dense and rows.size > 0:
+                stored.append((rows, s[rows], hh[accepted], y[accepted],
+                               np.einsum('snd,sk->ndk', K[:, :m][:, accepted], _P)))
+            q[rows] = ynew[accepted]
+            derivative[rows] = K[6, :m][accepted]
+            s[rows] += hh[accepted]
+            active = active[~accepted | (s[active] < 1. - 1e-12)]
+
+        if not dense:
+            return q
+        # trajectories with zero duration are constant
+        rows = np.flatnonzero(durations == 0.)
+        stored.append((rows, np.zeros(rows.size), np.ones(rows.size), states[rows],
+                       np.zeros((rows.size, d, 4))))
+        return q, ODEDenseOutput(durations, *(np.concatenate(arrays) for arrays in zip(*stored)))
+
+    def getStatePropagator(self, postEvent=None):
+        """Return an ompl.control.BatchStatePropagator that solves the ODE for
+        all states it propagates at once. The optional function
+        postEvent(states, controls, durations, results) is called after
+        integration to modify the rows of results in place, e.g., to normalize
+        angles."""
+        from ompl import control
+
+        solver = self
+
+        class ODENumPySolverStatePropagator(control.BatchStatePropagator):
+            def propagateValues(self, states, controls, durations, results):
+                results[:, :] = solver.solve(states, controls, durations)
+                if postEvent is not None:
+                    postEvent(states, controls, durations, results)
+
+        return ODENumPySolverStatePropagator(self.si)
+
+    def interpolate(self, path, postEvent=None):
+        """Return the ompl.control.PathControl path with intermediate states
+        added in the same way as by PathControl.interpolate(), i.e., every
+        control is split into controls applied for the propagation step size.
+        The intermediate states of all controls are evaluated from a single
+        integration using the dense output of solve(). postEvent is applied to
+        the intermediate states as in getStatePropagator()."""
+        from ompl import control
+
+        states, controls, durations = path.toArray()
+        stepSize = self.si.getPropagationStepSize()
+        steps = np.floor(.5 + durations / stepSize).astype(int)
+        split = np.flatnonzero(steps > 1)
+        if split.size == 0:
+            return control.PathControl.fromArray(self.si, states, controls, durations)
+        _, trajectories = self.solve(states[split], controls[split], durations[split], dense=True)
+
+        # times at which intermediate states are needed, for each split control
+        maxSteps = steps[split].max()
+        times = np.arange(1, maxSteps) * stepSize
+        intermediate = [trajectories(t) for t in times]
+        if postEvent is not None:
+            for t, values in zip(times, intermediate):
+                postEvent(states[split], controls[split], np.full(split.size, t), values)
+
+        newStates, newControls, newDurations = [], [], []
+        splitIndex = {index: k for k, index in enumerate(split)}
+        for i in range(len(controls)):
+            newStates.append(states[i])
+            newControls.append(controls[i])
+            if steps[i] <= 1:
+                newDurations.append(durations[i])
+                continue
+            k = splitIndex[i]
+            newDurations.append(stepSize)
+            for j in range(1, steps[i]):
+                newStates.append(intermediate[j - 1][k])
+                newControls.append(controls[i])
+                newDurations.append(stepSize)
+        newStates.append(states[-1])
+        return control.PathControl.fromArray(self.si, np.array(newStates), np.array(newControls),
+                                             np.array(newDurations))
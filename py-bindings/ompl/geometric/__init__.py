@@ -1,4 +1,15 @@
-from ompl import base
-from ompl.geometric._geometric import *
+from ompl import base, lazyExtension
 
 planners = None
+
+def _initialize():
+    SimpleSetup.setStateValidityChecker = base.acceptCFunction(SimpleSetup.setStateValidityChecker,
+        lambda ss, fn: ss.getSpaceInformation().setStateValidityChecker(fn))
+    # awaitable versions of solve() for use with asyncio
+    from ompl.base.asyncplan import solveAsync, intermediateSolutions
+    SimpleSetup.solveAsync = solveAsync
+    SimpleSetup.intermediateSolutions = intermediateSolutions
+
+# the extension module ompl.geometric._geometric (and with it all planner
+# classes) is imported when first needed
+__getattr__, __dir__ = lazyExtension(__name__, ['ompl.base'], _initialize)
@@ -1,2 +1,8 @@
-from ompl import control
-from ompl.tools._tools import *
+from ompl import control, lazyExtension
+from ompl.tools.profiler import Profiler
+
+# the extension module ompl.tools._tools is imported when first needed, and
+# ompl.tools.multiplan (which imports multiprocessing) when ProcessParallelPlan
+# is first used
+__getattr__, __dir__ = lazyExtension(__name__, ['ompl.control'],
+                                     attributes={'ProcessParallelPlan': 'ompl.tools.multiplan'})
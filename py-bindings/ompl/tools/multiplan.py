@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+
+######################################################################
+# Software License Agreement (BSD License)
+#
+#  Copyright (c) 2026, Rice University
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions
+#  are met:
+#
+#   * Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above
+#     copyright notice, this list of conditions and the following
+#     disclaimer in the documentation and/or other materials provided
+#     with the distribution.
+#   * Neither the name of the Rice University nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+#  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+#  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+#  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+#  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+#  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+######################################################################
+
+import multiprocessing
+from functools import cmp_to_key
+from random import SystemRandom
+from time import perf_counter
+from ompl import base as ob
+from ompl import util as ou
+
+def _solve(problemFactory, plannerAllocator, seed, solveTime):
+    """Solve one instance of a planning problem in a worker process. The
+    solution path is returned in serialized form, so that it can be
+    deserialized into the space information of the parent process."""
+    ou.RNG.setSeed(seed)
+    ss = problemFactory()
+    if plannerAllocator is not None:
+        ss.setPlanner(plannerAllocator(ss.getSpaceInformation()))
+    start = perf_counter()
+    ss.solve(solveTime)
+    result = {'planner': ss.getPlanner().getName(), 'seed': seed, 'time': perf_counter() - start,
+              'exact': False, 'difference': None, 'path': None}
+    if ss.haveSolutionPath():
+        result['exact'] = ss.haveExactSolutionPath()
+        result['difference'] = ss.getProblemDefinition().getSolutionDifference()
+        result['path'] = ss.getSolutionPath().serialize()
+    return result
+
+def _solveTask(task):
+    return task[0], _solve(*task[1:])
+
+class ProcessParallelPlan(object):
+    """Solve a motion planning problem with several planners, or several
+    instances of a planner with different seeds, in separate processes.
+
+    Unlike ompl.tools.ParallelPlan, which runs planners in threads of the same
+    process, this gives a real speedup if the state validity checker or state
+    propagator is written in Python, since each process has its own global
+    interpreter lock.
+
+    The problem is described by problemFactory, a picklable callable (e.g., a
+    function defined at the top level of a module) without arguments that
+    returns a fully configured ompl.geometric.SimpleSetup or
+    ompl.control.SimpleSetup object. It is called once in each worker
+    process and once in the parent process. The solutions found by the
+    workers are added to the problem definition of the parent's SimpleSetup
+    object (see getSimpleSetup()).
+
+    Example:
+
+        def makeProblem():
+            ss = og.SimpleSetup(space)
+            ss.setStateValidityChecker(ob.StateValidityCheckerFn(isStateValid))
+            ss.setStartAndGoalStates(start, goal)
+            return ss
+
+        pp = ProcessParallelPlan(makeProblem)
+        pp.addPlanner(og.RRTConnect)
+        pp.addPlanner(og.RRTConnect)
+        pp.addPlanner(og.KPIECE1)
+        if pp.solve(10.):
+            print(pp.getSimpleSetup().getSolutionPath())
+    """
+
+    def __init__(self, problemFactory, processes=None, context='spawn'):
+        """Create a driver for the problem returned by problemFactory. At most
+        processes planners run at the same time (by default, one per CPU).
+        context is the multiprocessing start method or context to use; the
+        default, 'spawn', makes sure that every worker starts with a fresh
+        random number generator."""
+        self.problemFactory = problemFactory
+        self.processes = processes
+        if context is None or isinstance(context, str):
+            context = multiprocessing.get_context(context)
+        self.context = context
+        self.planners = []
+        self.results = []
+        self.simpleSetup = None
+
+    def addPlanner(self, plannerAllocator=None, seed=None):
+        """Add a planner that is run in its own process. plannerAllocator is a
+        picklable callable that returns a planner for a given space
+        information object, e.g., a planner class such as
+        ompl.geometric.RRTConnect. If it is None, the planner configured by the
+        problem factory (or the default planner) is used. If seed is None, a
+        random seed is chosen, so that planners of the same type explore the
+        space differently."""
+        if seed is None:
+            seed = SystemRandom().randint(1, 2**31 - 1)
+        self.planners.append((plannerAllocator, seed))
+
+    def clearPlanners(self):
+        self.planners = []
+
+    def getSimpleSetup(self):
+        """Return the SimpleSetup object of the parent process, created by the
+        problem factory. Solutions are added to its problem definition."""
+        if self.simpleSetup is None:
+            self.simpleSetup = self.problemFactory()
+        return self.simpleSetup
+
+    def getResults(self):
+        """Return a list with the results of the planners that finished during
+        the last call to solve(). Each result is a dictionary with the keys
+        'planner', 'seed', 'time' (in seconds), 'exact', 'difference' (the
+        distance to the goal), 'path' (the solution path, deserialized in the
+        space information of getSimpleSetup(), or None) and 'cost'."""
+        return self.results
+
+    def solve(self, solveTime, best=False, hybridize=False):
+        """Run all planners for at most solveTime seconds. If best is False,
+        the first exact solution is returned and the remaining planners are
+        terminated. Otherwise, all planners run until they finish and the
+        solution with the best cost is returned. If hybridize is True (only
+        for geometric planning), all planners run until they finish as well,
+        and their solutions are combined with ompl.geometric.PathHybridization.
+        Returns an ompl.base.PlannerStatus."""
+        ss = self.getSimpleSetup()
+        si = ss.getSpaceInformation()
+        if not si.isSetup():
+            si.setup()
+        pdef = ss.getProblemDefinition()
+        pdef.clearSolutionPaths()
+        self.results = []
+        tasks = [(i, self.problemFactory, allocator, seed, solveTime)
+                 for i, (allocator, seed) in enumerate(self.planners)]
+        results = [None] * len(tasks)
+        # one process per task, so that a seed is set before any random
+        # number generator is created
+        with self.context.Pool(self.processes, maxtasksperchild=1) as pool:
+            for i, result in pool.imap_unordered(_solveTask, tasks):
+                result['path'] = self.deserializePath(result['path'])
+                result['cost'] = None if result['path'] is None else self.cost(result['path'])
+                results[i] = result
+                if result['exact'] and not best and not hybridize:
+                    # the remaining planners are terminated on exit
+                    break
+        self.results = [result for result in results if result is not None]
+
+        solutions = [result for result in self.results if result['path'] is not None]
+        if hybridize and not self.isControlProblem():
+            exactPaths = [result['path'] for result in solutions if result['exact']]
+            hybrid = self.hybridize(exactPaths) if len(exactPaths) > 1 else None
+            if hybrid is not None:
+                solutions.append(hybrid)
+        if not solutions:
+            return ob.PlannerStatus(ob.PlannerStatus.TIMEOUT)
+        solution = min(solutions, key=cmp_to_key(self.compareSolutions))
+        pdef.addSolutionPath(solution['path'], not solution['exact'], solution['difference'],
+                             solution['planner'])
+        return ob.PlannerStatus(ob.PlannerStatus.EXACT_SOLUTION if solution['exact']
+                                else ob.PlannerStatus.APPROXIMATE_SOLUTION)
+
+    def isControlProblem(self):
+        return hasattr(self.getSimpleSetup(), 'getControlSpace')
+
+    def deserializePath(self, data):
+        """Return the path serialized by a worker as a path in the space
+        information of the parent process."""
+        if data is None:
+            return None
+        si = self.getSimpleSetup().getSpaceInformation()
+        if self.isControlProblem():
+            from ompl import control as oc
+            path = oc.PathControl(si)
+        else:
+            from ompl import geometric as og
+            path = og.PathGeometric(si)
+        path.deserialize(data)
+        return path
+
+    def cost(self, path):
+        """Return the cost of a path according to the optimization objective of
+        the problem definition, or its length if there is none."""
+        pdef = self.getSimpleSetup().getProblemDefinition()
+        if pdef.hasOptimizationObjective() and not self.isControlProblem():
+            return path.cost(pdef.getOptimizationObjective())
+        return ob.Cost(path.length())
+
+    def compareSolutions(self, a, b):
+        """Order solutions: exact solutions first, then approximate solutions
+        by their distance to the goal, then by cost."""
+        if a['exact'] != b['exact']:
+            return -1 if a['exact'] else 1
+        if not a['exact'] and a['difference'] != b['difference']:
+            return -1 if a['difference'] < b['difference'] else 1
+        pdef = self.getSimpleSetup().getProblemDefinition()
+        if pdef.hasOptimizationObjective() and not self.isControlProblem():
+            objective = pdef.getOptimizationObjective()
+            if objective.isCostBetterThan(a['cost'], b['cost']):
+                return -1
+            return 1 if objective.isCostBetterThan(b['cost'], a['cost']) else 0
+        return (a['cost'].value() > b['cost'].value()) - (a['cost'].value() < b['cost'].value())
+
+    def hybridize(self, paths):
+        """Combine exact solution paths with ompl.geometric.PathHybridization
+        and return the result in the same form as the results of the workers,
+        or None if no hybrid path was found."""
+        from ompl import geometric as og
+        start = perf_counter()
+        hybridization = og.PathHybridization(self.getSimpleSetup().getSpaceInformation())
+        for path in paths:
+            hybridization.recordPath(path, False)
+        hybridization.computeHybridPath()
+        path = hybridization.getHybridPath()
+        if path is None:
+            return None
+        return {'planner': hybridization.getName(), 'seed': None, 'time': perf_counter() - start,
+                'exact': True, 'difference': 0., 'path': path, 'cost': self.cost(path)}
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+######################################################################
+# Software License Agreement (BSD License)
+#
+#  Copyright (c) 2026, Rice University
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions
+#  are met:
+#
+#   * Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above
+#     copyright notice, this list of conditions and the following
+#     disclaimer in the documentation and/or other materials provided
+#     with the distribution.
+#   * Neither the name of the Rice University nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+#  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+#  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+#  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+#  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+#  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+######################################################################
+
+from ompl.util import _util
+
+class Profiler(object):
+    """Count the calls from C++ into Python and the wall time spent in them,
+    aggregated per type of callback. Counted are calls of Python functions
+    passed as callbacks (e.g., ompl.base.StateValidityCheckerFn, where the
+    type of callback is named after the function wrapper) and of Python
+    overrides of commonly overridden virtual methods (e.g.,
+    StateValidityChecker::isValid, StatePropagator::propagate,
+    OptimizationObjective::stateCost, ProjectionEvaluator::project,
+    StateSampler::sampleUniform).
+
+    This mirrors the interface of ompl::tools::Profiler, which is not available
+    in Python. Counting is disabled by default, since it adds a little overhead
+    to every call into Python. While the profiler is running, each run of
+    ompl.tools.Benchmark starts with cleared statistics and records them as
+    run properties "python <callback> calls" and "python <callback> time".
+
+        Profiler.Start()
+        ss.solve(10.)
+        Profiler.Stop()
+        print(Profiler.Status())
+
+    or
+
+        with Profiler.ScopedStart():
+            ss.solve(10.)
+    """
+
+    @staticmethod
+    def Start():
+        """Start counting calls into Python"""
+        _util._setCallbackStatisticsEnabled(True)
+
+    @staticmethod
+    def Stop():
+        """Stop counting calls into Python; the statistics are kept"""
+        _util._setCallbackStatisticsEnabled(False)
+
+    @staticmethod
+    def Clear():
+        """Clear the statistics"""
+        _util._clearCallbackStatistics()
+
+    @staticmethod
+    def Running():
+        """Check if calls into Python are being counted"""
+        return _util._isCallbackStatisticsEnabled()
+
+    @staticmethod
+    def getCallbackStatistics():
+        """Return a dictionary that maps each type of callback to a tuple of the
+        number of calls and the cumulative wall time of the calls in seconds"""
+        return _util._getCallbackStatistics()
+
+    @staticmethod
+    def Status():
+        """Return a printable summary of the statistics, sorted by time"""
+        stats = sorted(Profiler.getCallbackStatistics().items(), key=lambda item: -item[1][1])
+        lines = ['Calls into Python:']
+        for name, (calls, time) in stats:
+            lines.append('* %s: %d calls, %g seconds (%g seconds per call)' %
+                         (name, calls, time, time / calls))
+        return '\n'.join(lines)
+
+    class ScopedStart(object):
+        """Context manager that runs the profiler in its scope; if the profiler
+        was already running, it keeps running"""
+
+        def __enter__(self):
+            self.wasRunning = Profiler.Running()
+            Profiler.Start()
+            return Profiler
+
+        def __exit__(self, *args):
+            if not self.wasRunning:
+                Profiler.Stop()
+            return False
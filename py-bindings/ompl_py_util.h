@@ -39,6 +39,7 @@
 
 #include <vector>
 #include <map>
+#include "py_std_function.hpp"
 
 namespace ompl
 {
@@ -0,0 +1,174 @@
+/*********************************************************************
+* Software License Agreement (BSD License)
+*
+*  Copyright (c) 2026, Rice University
+*  All rights reserved.
+*
+*  Redistribution and use in source and binary forms, with or without
+*  modification, are permitted provided that the following conditions
+*  are met:
+*
+*   * Redistributions of source code must retain the above copyright
+*     notice, this list of conditions and the following disclaimer.
+*   * Redistributions in binary form must reproduce the above
+*     copyright notice, this list of conditions and the following
+*     disclaimer in the documentation and/or other materials provided
+*     with the distribution.
+*   * Neither the name of the Rice University nor the names of its
+*     contributors may be used to endorse or promote products derived
+*     from this software without specific prior written permission.
+*
+*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+*  POSSIBILITY OF SUCH DAMAGE.
+*********************************************************************/
+
+/******************************************************************************
+ * Helper functions for exchanging arrays with NumPy through the
+ * Python buffer protocol. Unlike the Eigen converters in numpy_eigen.cpp,
+ * these do not require Boost.Python's NumPy library, so they can be used in
+ * any of the OMPL Python modules. NumPy is only imported when an array needs
+ * to be created or converted.
+ ******************************************************************************/
+
+#ifndef PY_BINDINGS_PY_NDARRAY_
+#define PY_BINDINGS_PY_NDARRAY_
+
+#include <boost/python.hpp>
+#include "ompl/base/StateSpace.h"
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace detail
+{
+    /** \brief NumPy dtype and buffer format characters of the element types
+        supported by ArrayBuffer. */
+    template <typename T>
+    struct ArrayType;
+
+    template <>
+    struct ArrayType<double>
+    {
+        static constexpr const char *dtype = "float64";
+        static bool isFormat(const char *format)
+        {
+            return std::strcmp(format, "d") == 0;
+        }
+    };
+
+    template <>
+    struct ArrayType<std::int64_t>
+    {
+        static constexpr const char *dtype = "int64";
+        static bool isFormat(const char *format)
+        {
+            return std::strcmp(format, "l") == 0 || std::strcmp(format, "q") == 0;
+        }
+    };
+
+    template <>
+    struct ArrayType<bool>
+    {
+        static constexpr const char *dtype = "bool";
+        static bool isFormat(const char *format)
+        {
+            return std::strcmp(format, "?") == 0;
+        }
+    };
+
+    /** \brief Access to the data of a C-contiguous array of type T. If the
+        Python object does not expose such a buffer, it is first converted with
+        numpy.ascontiguousarray (in which case writes do not propagate to the
+        original object). */
+    template <typename T>
+    class ArrayBuffer
+    {
+    public:
+        ArrayBuffer(boost::python::object obj, bool writable = false)
+        {
+            int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0);
+            if (PyObject_GetBuffer(obj.ptr(), &view_, flags) == 0)
+            {
+                if (view_.itemsize == sizeof(T) && view_.format != nullptr &&
+                    ArrayType<T>::isFormat(view_.format))
+                    return;
+                PyBuffer_Release(&view_);
+            }
+            else
+                PyErr_Clear();
+            obj_ = boost::python::import("numpy").attr("ascontiguousarray")(obj, ArrayType<T>::dtype);
+            if (PyObject_GetBuffer(obj_.ptr(), &view_, flags) != 0)
+                boost::python::throw_error_already_set();
+        }
+
+        ArrayBuffer(const ArrayBuffer &) = delete;
+        ArrayBuffer &operator=(const ArrayBuffer &) = delete;
+
+        ~ArrayBuffer()
+        {
+            PyBuffer_Release(&view_);
+        }
+
+        T *data() const
+        {
+            return static_cast<T *>(view_.buf);
+        }
+
+        int ndim() const
+        {
+            return view_.ndim;
+        }
+
+        std::size_t shape(int i) const
+        {
+            return i < view_.ndim ? view_.shape[i] : 1;
+        }
+
+        std::size_t size() const
+        {
+            return view_.len / sizeof(T);
+        }
+
+    private:
+        Py_buffer view_;
+        boost::python::object obj_;
+    };
+
+    using DoubleBuffer = ArrayBuffer<double>;
+
+    /** \brief Create an uninitialized NumPy array of the given shape (of doubles by default) */
+    inline boost::python::object emptyArray(const boost::python::tuple &shape, const char *dtype = "float64")
+    {
+        return boost::python::import("numpy").attr("empty")(shape, dtype);
+    }
+
+    /** \brief Number of values that StateSpace::copyToReals() stores for a
+        state of \e space. The value locations are only computed by
+        StateSpace::setup(), so compute them here if the space has not been
+        set up yet. */
+    inline std::size_t stateDimension(const ompl::base::StateSpacePtr &space)
+    {
+        if (space->getValueLocations().empty())
+            space->computeLocations();
+        return space->getValueLocations().size();
+    }
+
+    /** \brief Raise a Python ValueError */
+    inline void raiseValueError(const char *message)
+    {
+        PyErr_SetString(PyExc_ValueError, message);
+        boost::python::throw_error_already_set();
+    }
+}  // namespace detail
+
+#endif  // PY_BINDINGS_PY_NDARRAY_
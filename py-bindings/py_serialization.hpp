@@ -0,0 +1,167 @@
+/*********************************************************************
+* Software License Agreement (BSD License)
+*
+*  Copyright (c) 2026, Rice University
+*  All rights reserved.
+*
+*  Redistribution and use in source and binary forms, with or without
+*  modification, are permitted provided that the following conditions
+*  are met:
+*
+*   * Redistributions of source code must retain the above copyright
+*     notice, this list of conditions and the following disclaimer.
+*   * Redistributions in binary form must reproduce the above
+*     copyright notice, this list of conditions and the following
+*     disclaimer in the documentation and/or other materials provided
+*     with the distribution.
+*   * Neither the name of the Rice University nor the names of its
+*     contributors may be used to endorse or promote products derived
+*     from this software without specific prior written permission.
+*
+*  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+*  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+*  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+*  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+*  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+*  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+*  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+*  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+*  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+*  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+*  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+*  POSSIBILITY OF SUCH DAMAGE.
+*********************************************************************/
+
+
+/******************************************************************************
+ * Helper functions for pickling OMPL objects. States, controls and planner
+ * data are stored in the binary formats of StateSpace::serialize,
+ * ControlSpace::serialize and PlannerDataStorage. The state space or space
+ * information an object belongs to is passed to the constructor when the
+ * object is unpickled, so it needs to be picklable as well.
+ ******************************************************************************/
+
+#ifndef PY_BINDINGS_PY_SERIALIZATION_
+#define PY_BINDINGS_PY_SERIALIZATION_
+
+#include <boost/python.hpp>
+#include <cstddef>
+#include <string>
+#include "ompl/base/ScopedState.h"
+
+namespace detail
+{
+    /** \brief Read-only access to the contents of a bytes-like object */
+    class ByteBuffer
+    {
+    public:
+        ByteBuffer(boost::python::object obj)
+        {
+            if (PyObject_GetBuffer(obj.ptr(), &view_, PyBUF_SIMPLE) != 0)
+                boost::python::throw_error_already_set();
+        }
+
+        ByteBuffer(const ByteBuffer &) = delete;
+        ByteBuffer &operator=(const ByteBuffer &) = delete;
+
+        ~ByteBuffer()
+        {
+            PyBuffer_Release(&view_);
+        }
+
+        const char *data() const
+        {
+            return static_cast<const char *>(view_.buf);
+        }
+
+        std::size_t size() const
+        {
+            return view_.len;
+        }
+
+    private:
+        Py_buffer view_;
+    };
+
+    /** \brief Create an uninitialized bytes object of the given size. The
+        contents can be written through bytesData() until the object is
+        shared with Python code. */
+    inline boost::python::object emptyBytes(std::size_t size)
+    {
+        return boost::python::object(boost::python::handle<>(PyBytes_FromStringAndSize(nullptr, size)));
+    }
+
+    inline char *bytesData(const boost::python::object &bytes)
+    {
+        return PyBytes_AS_STRING(bytes.ptr());
+    }
+
+    inline boost::python::object toBytes(const std::string &data)
+    {
+        return boost::python::object(
+            boost::python::handle<>(PyBytes_FromStringAndSize(data.data(), data.size())));
+    }
+
+    /** \brief Raise a Python PicklingError */
+    inline void raisePicklingError(const std::string &message)
+    {
+        boost::python::object error = boost::python::import("pickle").attr("PicklingError");
+        PyErr_SetString(error.ptr(), message.c_str());
+        boost::python::throw_error_already_set();
+    }
+
+    /** \brief Raise a Python UnpicklingError */
+    inline void raiseUnpicklingError(const std::string &message)
+    {
+        boost::python::object error = boost::python::import("pickle").attr("UnpicklingError");
+        PyErr_SetString(error.ptr(), message.c_str());
+        boost::python::throw_error_already_set();
+    }
+
+    /** \brief Return the length of the serialization of a state of a space,
+        and raise a PicklingError if the space does not support serialization */
+    inline std::size_t serializationLength(const ompl::base::StateSpace &space)
+    {
+        std::size_t length = space.getSerializationLength();
+        if (length == 0)
+            raisePicklingError("state space " + space.getName() + " does not support serialization");
+        return length;
+    }
+
+    /** \brief The return value of __reduce__ for objects that are constructed
+        from a single argument (a state space or space information) and
+        restored by passing the serialized data to __setstate__ */
+    inline boost::python::tuple reduce(const boost::python::object &self, const boost::python::object &arg,
+                                       const boost::python::object &data)
+    {
+        return boost::python::make_tuple(self.attr("__class__"), boost::python::make_tuple(arg), data);
+    }
+
+    template <typename T>
+    boost::python::object ScopedState_serialize(const ompl::base::ScopedState<T> &state)
+    {
+        const ompl::base::StateSpace &space = *state.getSpace();
+        boost::python::object data = emptyBytes(serializationLength(space));
+        space.serialize(bytesData(data), state.get());
+        return data;
+    }
+
+    template <typename T>
+    void ScopedState_deserialize(ompl::base::ScopedState<T> &state, boost::python::object data)
+    {
+        const ompl::base::StateSpace &space = *state.getSpace();
+        ByteBuffer buffer(data);
+        if (buffer.size() != serializationLength(space))
+            raiseUnpicklingError("serialized state does not match state space " + space.getName());
+        space.deserialize(state.get(), buffer.data());
+    }
+
+    template <typename T>
+    boost::python::tuple ScopedState_reduce(boost::python::object self)
+    {
+        const ompl::base::ScopedState<T> &state = boost::python::extract<const ompl::base::ScopedState<T> &>(self);
+        return reduce(self, boost::python::object(state.getSpace()), ScopedState_serialize(state));
+    }
+}  // namespace detail
+
+#endif
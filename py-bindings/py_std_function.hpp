@@ -89,8 +89,15 @@
 #ifndef PY_BINDINGS_PY_STD_FUNCTION_
 #define PY_BINDINGS_PY_STD_FUNCTION_
 
+#include <atomic>
+#include <chrono>
 #include <functional>
+#include <map>
+#include <memory>
+#include <string>
+#include <utility>
 #include <type_traits>
+#include <unordered_map>
 
 #include <boost/python.hpp>
 
@@ -114,37 +121,273 @@ namespace detail
         }
     };
 
+    /** \brief RAII helper that makes sure the calling thread holds the GIL
+        for as long as the object exists. Can be nested. */
+    class EnsureGIL
+    {
+    public:
+        EnsureGIL() : state_(PyGILState_Ensure())
+        {
+        }
+        ~EnsureGIL()
+        {
+            PyGILState_Release(state_);
+        }
+        EnsureGIL(const EnsureGIL &) = delete;
+        EnsureGIL &operator=(const EnsureGIL &) = delete;
+
+    private:
+        PyGILState_STATE state_;
+    };
+
+    /** \brief RAII helper that releases the GIL held by the calling thread
+        for as long as the object exists. */
+    class ReleaseGIL
+    {
+    public:
+        ReleaseGIL() : state_(PyEval_SaveThread())
+        {
+        }
+        ~ReleaseGIL()
+        {
+            PyEval_RestoreThread(state_);
+        }
+        ReleaseGIL(const ReleaseGIL &) = delete;
+        ReleaseGIL &operator=(const ReleaseGIL &) = delete;
+
+    private:
+        PyThreadState *state_;
+    };
+
+    /** \brief Wrapper around a (non-const) member function that releases the GIL
+        while the member function executes. Used to expose long-running C++ calls
+        (such as Planner::solve()) so that other Python threads can run and so that
+        C++ threads spawned by the call can acquire the GIL to call back into Python. */
+    template <auto Method>
+    struct WithoutGIL;
+
+    template <typename C, typename R, typename... Args, R (C::*Method)(Args...)>
+    struct WithoutGIL<Method>
+    {
+        static R call(C &self, Args... args)
+        {
+            ReleaseGIL nogil;
+            return (self.*Method)(std::forward<Args>(args)...);
+        }
+    };
+
+    /** \brief Keep a reference to a Python object such that copies can be made and
+        destroyed from threads that do not hold the GIL. The reference count of the
+        Python object itself is only decremented with the GIL held. */
+    inline std::shared_ptr<boost::python::object> holdPyobject(const boost::python::object &o)
+    {
+        return std::shared_ptr<boost::python::object>(new boost::python::object(o),
+            [](boost::python::object *p)
+            {
+                EnsureGIL gil;
+                delete p;
+            });
+    }
+
+    /** \brief Number of calls from C++ into Python and the cumulative wall
+        time spent in them, aggregated per type of callback. Counting is
+        disabled by default. A single instance is shared by all OMPL extension
+        modules (see exposeCallbackStatistics()); it is only accessed with the
+        GIL held. */
+    class CallbackStatistics
+    {
+    public:
+        /** \brief Statistics of one type of callback */
+        struct Entry
+        {
+            unsigned long calls{0};
+            double time{0.};
+        };
+
+        /** \brief Get the instance used by this extension module */
+        static CallbackStatistics &instance()
+        {
+            return *instancePtr();
+        }
+
+        /** \brief Set the instance used by this extension module */
+        static void setInstance(CallbackStatistics *stats)
+        {
+            instancePtr() = stats;
+        }
+
+        bool enabled() const
+        {
+            return enabled_.load(std::memory_order_relaxed);
+        }
+
+        void setEnabled(bool enabled)
+        {
+            enabled_ = enabled;
+        }
+
+        void clear()
+        {
+            entries_.clear();
+        }
+
+        /** \brief Count a call of the callback type \e name that took \e time seconds */
+        void add(const char *name, double time)
+        {
+            Entry &entry = entries_[name];
+            ++entry.calls;
+            entry.time += time;
+        }
+
+        /** \brief Get the statistics per callback type */
+        std::map<std::string, Entry> get() const
+        {
+            // callback types are identified by string literals, which may
+            // have different addresses in different translation units
+            std::map<std::string, Entry> result;
+            for (const auto &entry : entries_)
+            {
+                Entry &total = result[entry.first];
+                total.calls += entry.second.calls;
+                total.time += entry.second.time;
+            }
+            return result;
+        }
+
+    private:
+        static CallbackStatistics *&instancePtr()
+        {
+            // used until exposeCallbackStatistics() is called
+            static CallbackStatistics local;
+            static CallbackStatistics *stats = &local;
+            return stats;
+        }
+
+        std::atomic<bool> enabled_{false};
+        std::unordered_map<const char *, Entry> entries_;
+    };
+
+    /** \brief RAII helper that counts a callback of type \e name and the time
+        until the object is destroyed, if counting is enabled. Must be created
+        with the GIL held. */
+    class CallbackTimer
+    {
+    public:
+        explicit CallbackTimer(const char *name) : CallbackTimer(name, [] { return true; })
+        {
+        }
+
+        /** \brief The call is only counted if \e isPythonCall() returns true
+            (which is only evaluated if counting is enabled). */
+        template <typename F>
+        CallbackTimer(const char *name, F &&isPythonCall)
+          : name_(CallbackStatistics::instance().enabled() && isPythonCall() ? name : nullptr)
+        {
+            if (name_ != nullptr)
+                start_ = std::chrono::steady_clock::now();
+        }
+
+        ~CallbackTimer()
+        {
+            if (name_ != nullptr)
+                CallbackStatistics::instance().add(
+                    name_, std::chrono::duration<double>(std::chrono::steady_clock::now() - start_).count());
+        }
+
+        CallbackTimer(const CallbackTimer &) = delete;
+        CallbackTimer &operator=(const CallbackTimer &) = delete;
+
+    private:
+        const char *name_;
+        std::chrono::steady_clock::time_point start_;
+    };
+
+    /** \brief Make the callback statistics available in this extension
+        module. The owner (the ompl.util module, which is always loaded first)
+        creates the instance and exposes functions to access it; all other
+        modules use the owner's instance. */
+    inline void exposeCallbackStatistics(bool owner)
+    {
+        namespace bp = boost::python;
+        static const char *capsuleName = "ompl.util._util._callbackStatistics";
+        if (!owner)
+        {
+            void *stats = PyCapsule_Import(capsuleName, 0);
+            if (stats == nullptr)
+                bp::throw_error_already_set();
+            CallbackStatistics::setInstance(static_cast<CallbackStatistics *>(stats));
+            return;
+        }
+
+        // never destroyed, since other modules may use it until the end
+        CallbackStatistics::setInstance(new CallbackStatistics());
+        bp::scope().attr("_callbackStatistics") =
+            bp::object(bp::handle<>(PyCapsule_New(&CallbackStatistics::instance(), capsuleName, nullptr)));
+        bp::def("_getCallbackStatistics", +[]() {
+            bp::dict result;
+            for (const auto &entry : CallbackStatistics::instance().get())
+                result[entry.first] = bp::make_tuple(entry.second.calls, entry.second.time);
+            return result;
+        });
+        bp::def("_setCallbackStatisticsEnabled", +[](bool enabled) {
+            CallbackStatistics::instance().setEnabled(enabled);
+        });
+        bp::def("_isCallbackStatisticsEnabled", +[]() { return CallbackStatistics::instance().enabled(); });
+        bp::def("_clearCallbackStatistics", +[]() { CallbackStatistics::instance().clear(); });
+    }
+
+    /** \brief The name under which calls of Python callables that are
+        implicitly converted to std::function<FT> are counted (see
+        CallbackStatistics). Such a conversion does not know which function
+        type registered with signature FT it is used for, so if there are
+        several, their calls are counted under the generic name "function". */
+    template <typename FT>
+    struct CallbackName
+    {
+        static const char *name;
+
+        static void add(const char *registeredName)
+        {
+            name = name == nullptr ? registeredName : "function";
+        }
+    };
+    template <typename FT>
+    const char *CallbackName<FT>::name = nullptr;
+
     template <typename FT>
     struct PyobjectInvoker;
 
     template <typename R, typename...Args>
     struct PyobjectInvoker<R(Args...)>
     {
-        PyobjectInvoker(boost::python::object o) : callable(o)
+        PyobjectInvoker(boost::python::object o, const char *name = CallbackName<R(Args...)>::name)
+          : callable(holdPyobject(o)), name(name)
         {
         }
         R operator()(Args... args)
         {
-            PyGILState_STATE gstate = PyGILState_Ensure();
-            R result = boost::python::extract<R>(callable(WrapType<Args>::wrap(args)...));
-            PyGILState_Release(gstate);
-            return result;
+            EnsureGIL gil;
+            CallbackTimer timer(name);
+            return boost::python::extract<R>((*callable)(WrapType<Args>::wrap(args)...));
         }
-        boost::python::object callable;
+        std::shared_ptr<boost::python::object> callable;
+        const char *name;
     };
     template <typename...Args>
     struct PyobjectInvoker<void(Args...)>
     {
-        PyobjectInvoker(boost::python::object o) : callable(o)
+        PyobjectInvoker(boost::python::object o, const char *name = CallbackName<void(Args...)>::name)
+          : callable(holdPyobject(o)), name(name)
         {
         }
         void operator()(Args... args)
         {
-            PyGILState_STATE gstate = PyGILState_Ensure();
-            callable(WrapType<Args>::wrap(args)...);
-            PyGILState_Release(gstate);
+            EnsureGIL gil;
+            CallbackTimer timer(name);
+            (*callable)(WrapType<Args>::wrap(args)...);
         }
-        boost::python::object callable;
+        std::shared_ptr<boost::python::object> callable;
+        const char *name;
     };
 }  // namespace detail
 
@@ -160,10 +403,12 @@ void def_function(const char *func_name, const char *func_doc)
 
 #define PYREGISTER_FUNCTION(FT, func_name, func_doc)               \
     BOOST_STATIC_ASSERT(std::is_function<FT>::value);              \
+    detail::CallbackName<FT>::add(BOOST_PP_STRINGIZE(func_name));  \
     boost::python::def(BOOST_PP_STRINGIZE(func_name),              \
         +[](boost::python::object o) -> std::function<FT>          \
         {                                                          \
-            return detail::PyobjectInvoker<FT>(o);                 \
+            return detail::PyobjectInvoker<FT>(o,                  \
+                BOOST_PP_STRINGIZE(func_name));                    \
         }, func_doc);                                              \
     def_function<FT>(BOOST_PP_STRINGIZE(func_name##_t), func_doc); \
     boost::python::implicitly_convertible<                         \
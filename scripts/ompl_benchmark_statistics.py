@@ -37,12 +37,18 @@
 # Author: Mark Moll, Ioan Sucan, Luis G. Torres
 
 import os
+import hashlib
+import multiprocessing
 import sqlite3
 import sys
 import argparse
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 # Pathlib is part of the standard library in Python 3, but for Python2 you
 # may have to `apt install python-pathlib2` or `pip install pathlib2`
 from pathlib import Path
+from time import perf_counter
 from warnings import warn
 plottingEnabled = True
 try:
@@ -112,14 +118,128 @@ def readRequiredMultilineValue(filevar):
     return value
 
 
-def readBenchmarkLog(dbname, filenames, moveitformat):
-    """Parse benchmark log files and store the parsed data in a sqlite3 database."""
-
-    conn = sqlite3.connect(dbname)
+# Values in log files that are stored as NULL in the database
+MISSING_VALUES = frozenset(['', 'nan', 'inf'])
+
+# Maximum number of progress rows that are parsed before they are inserted
+PROGRESS_BUFFER_SIZE = 100000
+
+def tableColumns(c, table):
+    """Return the set of column names of a table."""
+    c.execute('PRAGMA table_info(%s)' % table)
+    return set(col[1] for col in c.fetchall())
+
+def addColumn(c, columns, table, name, typename):
+    """Add a column to a table unless it is already in columns[table], the
+    cached set of column names of the table."""
+    if name not in columns[table]:
+        c.execute('ALTER TABLE %s ADD %s %s' % (table, name, typename))
+        columns[table].add(name)
+
+def createIndexes(c):
+    """Create the index used by exportColumnar() to select the runs of a
+    planner configuration together with their progress data, which is then
+    looked up by run id through the primary key (runid, time) of the progress
+    table. The plotting queries read whole tables and use no index."""
+    c.execute('CREATE INDEX IF NOT EXISTS runs_plannerid_experimentid ON runs(plannerid, experimentid)')
+
+def logFileStat(filename):
+    """Return the absolute path, size and modification time (in ns) of a log file."""
+    path = Path(filename).resolve()
+    stat = path.stat()
+    return str(path), stat.st_size, stat.st_mtime_ns
+
+def logFileHash(filename):
+    """Return the SHA-256 hex digest of the contents of a log file."""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as logfile:
+        for chunk in iter(lambda: logfile.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def removeLogFile(c, path):
+    """Remove the manifest entry of the log file path and the experiment that was
+    read from it, unless another log file in the manifest refers to the same
+    experiment. Return whether an experiment was removed."""
+    c.execute("""DELETE FROM experiments WHERE id IN
+        (SELECT experimentid FROM logfiles WHERE path=?) AND id NOT IN
+        (SELECT experimentid FROM logfiles WHERE path<>? AND experimentid IS NOT NULL)""", \
+        (path, path))
+    removed = c.rowcount > 0
+    c.execute('DELETE FROM logfiles WHERE path=?', (path,))
+    return removed
+
+def addLogFile(c, path, size, mtime, digest, experimentId):
+    """Add the manifest entry of the log file path, from which the experiment
+    with id experimentId was read."""
+    c.execute('INSERT INTO logfiles (experimentid, path, size, mtime, hash) VALUES (?,?,?,?,?)', \
+        (experimentId, path, size, mtime, digest))
+
+def selectNewLogFiles(c, filenames):
+    """Return the log files whose contents are not yet in the database, using
+    the logfiles table as a manifest with one entry per path. A file with the
+    same size and modification time as the entry for its path is skipped
+    without reading it. A file with the same contents as a file that was
+    ingested before is not parsed either; its entry refers to the experiment
+    of that file instead. Return a list with (filename, path, size, mtime,
+    hash) for each file that needs to be parsed, and a dictionary that maps
+    the hash of each of these files to a list with (filename, path, size,
+    mtime) for the other files in filenames with the same contents."""
+    c.execute('SELECT path, size, mtime, hash, experimentid FROM logfiles')
+    ingested = {}
+    experiments = {}
+    for path, size, mtime, digest, experimentId in c.fetchall():
+        ingested[path] = (size, mtime, digest)
+        experiments[digest] = experimentId
+    newFiles = []
+    copies = {}
+    for filename in filenames:
+        path, size, mtime = logFileStat(filename)
+        entry = ingested.get(path)
+        if entry is not None and entry[:2] == (size, mtime):
+            print('Skipping %s (already in database)' % filename)
+            continue
+        digest = logFileHash(filename)
+        if entry is not None and entry[2] == digest:
+            # only the modification time has changed
+            c.execute('UPDATE logfiles SET size=?, mtime=? WHERE path=?', (size, mtime, path))
+            print('Skipping %s (already in database)' % filename)
+            continue
+        if digest in experiments:
+            print('Skipping %s (same contents as a log file already in database)' % filename)
+            if removeLogFile(c, path):
+                experiments.pop(entry[2], None)
+            addLogFile(c, path, size, mtime, digest, experiments[digest])
+            ingested[path] = (size, mtime, digest)
+            continue
+        if digest in copies:
+            print('Skipping %s (same contents as %s)' % (filename, copies[digest][0]))
+            copies[digest][1].append((filename, path, size, mtime))
+            continue
+        copies[digest] = (filename, [])
+        newFiles.append((filename, path, size, mtime, digest))
+    return newFiles, dict((digest, files) for digest, (_, files) in copies.items())
+
+def readBenchmarkLog(dbname, filenames, moveitformat, jobs=1):
+    """Parse benchmark log files and store the parsed data in a sqlite3 database.
+    The data of each log file is inserted in a single transaction. Log files that
+    are already in the database (or have the same contents as such files) are
+    skipped; if a log file has changed since it was ingested, its old experiment
+    is replaced. If jobs > 1, the log files are
+    parsed by a pool of that many processes (see parseBenchmarkLogs())."""
+
+    # transactions are started and committed explicitly
+    conn = sqlite3.connect(dbname, isolation_level=None)
     if sys.version_info[0] < 3:
         conn.text_factory = lambda x: unicode(x, 'utf-8', 'ignore')
     c = conn.cursor()
     c.execute('PRAGMA FOREIGN_KEYS = ON')
+    # the database can be recreated from the log files, so durability is
+    # traded for speed while loading data
+    c.execute('PRAGMA journal_mode = MEMORY')
+    c.execute('PRAGMA synchronous = OFF')
+    c.execute('PRAGMA temp_store = MEMORY')
+    c.execute('PRAGMA cache_size = -65536')
 
     # create all tables if they don't already exist
     c.executescript("""CREATE TABLE IF NOT EXISTS experiments
@@ -139,11 +259,93 @@ def readBenchmarkLog(dbname, filenames, moveitformat):
         FOREIGN KEY (plannerid) REFERENCES plannerConfigs(id) ON DELETE CASCADE);
         CREATE TABLE IF NOT EXISTS progress
         (runid INTEGER, time REAL, PRIMARY KEY (runid, time),
-        FOREIGN KEY (runid) REFERENCES runs(id) ON DELETE CASCADE)""")
-
-    for filename in filenames:
-        print('Processing ' + filename)
-        logfile = open(filename, 'r')
+        FOREIGN KEY (runid) REFERENCES runs(id) ON DELETE CASCADE);
+        CREATE TABLE IF NOT EXISTS logfiles
+        (id INTEGER PRIMARY KEY AUTOINCREMENT, experimentid INTEGER,
+        path TEXT NOT NULL UNIQUE, size INTEGER, mtime INTEGER, hash VARCHAR(64) NOT NULL,
+        FOREIGN KEY (experimentid) REFERENCES experiments(id) ON DELETE CASCADE)""")
+    columns = dict((table, tableColumns(c, table)) for table in ['experiments', 'runs', 'progress'])
+
+    c.execute('BEGIN')
+    newFiles, copies = selectNewLogFiles(c, filenames)
+    c.execute('COMMIT')
+    newFilenames = [newFile[0] for newFile in newFiles]
+
+    logs = parseBenchmarkLogs(newFilenames, moveitformat, jobs)
+    totalRows = 0
+    totalStartTime = perf_counter()
+    try:
+        for (filename, path, size, mtime, digest), log in zip(newFiles, logs):
+            print('Processing ' + filename)
+            startTime = perf_counter()
+            c.execute('BEGIN')
+            try:
+                # a changed log file replaces the data it was ingested with before
+                if removeLogFile(c, path):
+                    print('Replacing data previously read from ' + filename)
+                experimentId, numRows = writeBenchmarkLog(c, columns, log)
+                addLogFile(c, path, size, mtime, digest, experimentId)
+                for _, copyPath, copySize, copyMtime in copies[digest]:
+                    removeLogFile(c, copyPath)
+                    addLogFile(c, copyPath, copySize, copyMtime, digest, experimentId)
+                c.execute('COMMIT')
+            except:
+                c.execute('ROLLBACK')
+                raise
+            elapsed = perf_counter() - startTime
+            print('Inserted %d rows in %.2f seconds (%.0f rows/s)' % \
+                (numRows, elapsed, numRows / elapsed if elapsed > 0 else 0))
+            totalRows += numRows
+    finally:
+        logs.close()
+    if len(newFiles) > 1:
+        elapsed = perf_counter() - totalStartTime
+        print('Inserted %d rows from %d files in %.2f seconds (%.0f rows/s)' % \
+            (totalRows, len(newFiles), elapsed, totalRows / elapsed if elapsed > 0 else 0))
+    # indexes are created after loading the data, which is faster than
+    # updating them for every inserted row
+    createIndexes(c)
+    c.close()
+    conn.close()
+
+def parseBenchmarkLogs(filenames, moveitformat, jobs):
+    """Generate the parsed data of each log file, in the order of the files,
+    so the database does not depend on the number of jobs. With jobs = 1, a
+    file is parsed while its data is written, so only PROGRESS_BUFFER_SIZE
+    progress rows are in memory at a time. With jobs > 1, the files are
+    parsed by a pool of processes, which need to send all parsed data of a
+    file at once; at most jobs files are parsed ahead of the one that is
+    being written, to bound the memory this takes."""
+    if jobs <= 1 or len(filenames) <= 1:
+        for filename in filenames:
+            yield parseBenchmarkLog(filename, moveitformat)
+        return
+    pool = multiprocessing.Pool(jobs)
+    try:
+        pending = deque()
+        for filename in filenames:
+            pending.append(pool.apply_async(readParsedBenchmarkLog, (filename, moveitformat)))
+            if len(pending) > jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+def readParsedBenchmarkLog(filename, moveitformat):
+    """Parse a single benchmark log file in a worker process and return the
+    list of all its parsed data."""
+    return list(parseBenchmarkLog(filename, moveitformat))
+
+def parseBenchmarkLog(filename, moveitformat):
+    """Parse a single benchmark log file. Generate pairs (kind, data) in the
+    order in which writeBenchmarkLog() inserts them: first ('experiment', data)
+    with the experiment data, then for each planner ('planner', data) with the
+    planner configuration and its runs, followed by ('progress', samples)
+    with at most PROGRESS_BUFFER_SIZE progress samples at a time. Runs are
+    referred to by their index in the planner's list of runs; database ids are
+    assigned by writeBenchmarkLog()."""
+    with open(filename, 'r') as logfile:
         start_pos = logfile.tell()
         libname = readOptionalLogValue(logfile, 0, {1 : "version"})
         if libname is None:
@@ -165,14 +367,6 @@ def readBenchmarkLog(dbname, filenames, moveitformat):
             nameAndType = entry[0].split(' ')
             expprops[''.join(nameAndType[:-1]).replace('-', '_')] = (entry[1], nameAndType[-1])
 
-        # adding columns to experiments table
-        c.execute('PRAGMA table_info(experiments)')
-        columnNames = [col[1] for col in c.fetchall()]
-        for name in sorted(expprops.keys()):
-            # only add column if it doesn't exist
-            if name not in columnNames:
-                c.execute('ALTER TABLE experiments ADD %s %s' % (name, expprops[name][1]))
-
         hostname = readRequiredLogValue("hostname", logfile, -1, {0 : "Running"})
         date = ' '.join(ensurePrefix(logfile.readline(), "Starting").split()[2:])
         if moveitformat:
@@ -202,30 +396,22 @@ def readBenchmarkLog(dbname, filenames, moveitformat):
         numEnumsOrNone = readOptionalLogValue(logfile, 0, {-2 : "enum"})
         if numEnumsOrNone is not None:
             numEnums = int(numEnumsOrNone)
-        for _ in range(numEnums):
-            enum = logfile.readline()[:-1].split('|')
-            c.execute('SELECT * FROM enums WHERE name IS "%s"' % enum[0])
-            if c.fetchone() is None:
-                for j in range(len(enum) - 1):
-                    c.execute('INSERT INTO enums VALUES (?,?,?)', \
-                        (enum[0], j, enum[j + 1]))
-
-        # Creating entry in experiments table
+        enums = [logfile.readline()[:-1].split('|') for _ in range(numEnums)]
+
+        # entry in experiments table
         expColNames = ['name', 'totaltime', 'timelimit', 'memorylimit', 'runcount', 'version',
                        'hostname', 'cpuinfo', 'date', 'seed', 'setup']
         experimentEntries = [expname, totaltime, timelimit, memorylimit, nrruns, version,
                              hostname, cpuinfo, date, rseed, expsetup]
-        expProps = expprops.keys()
+        expProps = list(expprops.keys())
         expColNames += expProps
         experimentEntries += [expprops[name][0] for name in expProps]
-        c.execute('INSERT INTO experiments (' + ','.join(expColNames) + ') VALUES (' +
-                  ','.join('?'*len(experimentEntries)) + ')', experimentEntries)
-        experimentId = c.lastrowid
+        yield 'experiment', {'filename': filename, 'expprops': expprops, 'enums': enums,
+                             'expColNames': expColNames, 'experimentEntries': experimentEntries}
 
         numPlanners = int(readRequiredLogValue("planner count", logfile, 0, {-1 : "planners"}))
         for _ in range(numPlanners):
             plannerName = logfile.readline()[:-1]
-            print('Parsing data for ' + plannerName)
 
             # read common data for planner
             numCommon = int(logfile.readline().split()[0])
@@ -233,86 +419,145 @@ def readBenchmarkLog(dbname, filenames, moveitformat):
             for j in range(numCommon):
                 settings = settings + logfile.readline() + ';'
 
-            # find planner id
-            c.execute('SELECT id FROM plannerConfigs WHERE (name=? AND settings=?)', \
-                (plannerName, settings,))
-            p = c.fetchone()
-            if p is None:
-                c.execute('INSERT INTO plannerConfigs VALUES (?,?,?)', \
-                    (None, plannerName, settings,))
-                plannerId = c.lastrowid
-            else:
-                plannerId = p[0]
-
-            # get current column names
-            c.execute('PRAGMA table_info(runs)')
-            columnNames = [col[1] for col in c.fetchall()]
-
-            # read properties and add columns as necessary
+            # read properties
             numProperties = int(logfile.readline().split()[0])
-            propertyNames = ['experimentid', 'plannerid']
+            properties = []
             for j in range(numProperties):
                 field = logfile.readline().split()
-                propertyType = field[-1]
-                propertyName = '_'.join(field[:-1])
-                if propertyName not in columnNames:
-                    c.execute('ALTER TABLE runs ADD %s %s' % (propertyName, propertyType))
-                propertyNames.append(propertyName)
+                properties.append(('_'.join(field[:-1]), field[-1]))
             # read measurements
-            insertFmtStr = 'INSERT INTO runs (' + ','.join(propertyNames) + \
-                ') VALUES (' + ','.join('?'*len(propertyNames)) + ')'
             numRuns = int(logfile.readline().split()[0])
-            runIds = []
-            for j in range(numRuns):
-                values = tuple([experimentId, plannerId] + \
-                    [None if not x or x == 'nan' or x == 'inf' else x \
-                    for x in logfile.readline().split('; ')[:-1]])
-
-                c.execute(insertFmtStr, values)
-                # extract primary key of each run row so we can reference them
-                # in the planner progress data table if needed
-                runIds.append(c.lastrowid)
-
-            nextLine = logfile.readline().strip()
+            runs = [tuple([None if x in MISSING_VALUES else x \
+                for x in logfile.readline().split('; ')[:-1]]) for j in range(numRuns)]
 
             # read planner progress data if it's supplied
+            progressProperties = []
+            nextLine = logfile.readline().strip()
             if nextLine != '.':
-                # get current column names
-                c.execute('PRAGMA table_info(progress)')
-                columnNames = [col[1] for col in c.fetchall()]
-
-                # read progress properties and add columns as necesary
                 numProgressProperties = int(nextLine.split()[0])
-                progressPropertyNames = ['runid']
                 for _ in range(numProgressProperties):
                     field = logfile.readline().split()
-                    progressPropertyType = field[-1]
-                    progressPropertyName = "_".join(field[:-1])
-                    if progressPropertyName not in columnNames:
-                        c.execute('ALTER TABLE progress ADD %s %s' % \
-                            (progressPropertyName, progressPropertyType))
-                    progressPropertyNames.append(progressPropertyName)
-                # read progress measurements
-                insertFmtStr = 'INSERT INTO progress (' + \
-                    ','.join(progressPropertyNames) + ') VALUES (' + \
-                    ','.join('?'*len(progressPropertyNames)) + ')'
+                    progressProperties.append(("_".join(field[:-1]), field[-1]))
+            yield 'planner', {'name': plannerName, 'settings': settings,
+                              'properties': properties, 'runs': runs,
+                              'progressProperties': progressProperties}
+
+            if nextLine != '.':
                 numRuns = int(logfile.readline().split()[0])
+                progress = []
                 for j in range(numRuns):
                     dataSeries = logfile.readline().split(';')[:-1]
                     for dataSample in dataSeries:
-                        values = tuple([runIds[j]] + \
-                            [None if not x or x == 'nan' or x == 'inf' else x \
-                            for x in dataSample.split(',')[:-1]])
-                        try:
-                            c.execute(insertFmtStr, values)
-                        except sqlite3.IntegrityError:
-                            print('Ignoring duplicate progress data. Consider increasing '
-                                  'ompl::tools::Benchmark::Request::timeBetweenUpdates.')
-
+                        progress.append(tuple([j] + \
+                            [None if x in MISSING_VALUES else x \
+                            for x in dataSample.split(',')[:-1]]))
+                    if len(progress) >= PROGRESS_BUFFER_SIZE or \
+                        (j == numRuns - 1 and progress):
+                        yield 'progress', progress
+                        progress = []
                 logfile.readline()
-        logfile.close()
-    conn.commit()
-    c.close()
+
+def writeBenchmarkLog(c, columns, log):
+    """Insert the data of a log file generated by parseBenchmarkLog() using
+    cursor c. The experiment, planner configurations and runs get new ids (or
+    the id of an existing planner configuration with the same name and
+    settings). Return the id of the new experiment and the number of inserted
+    rows."""
+    numRows = 0
+    numDuplicates = 0
+    experimentId = None
+    for kind, data in log:
+        if kind == 'experiment':
+            experimentId, rows = writeExperiment(c, columns, data)
+        elif kind == 'planner':
+            reportDuplicateProgress(numDuplicates)
+            numDuplicates = 0
+            firstRunId, progressInsert, rows = writePlanner(c, columns, experimentId, data)
+        else:
+            # duplicate samples (with the same time for the same run) are skipped
+            c.executemany(progressInsert, ((firstRunId + sample[0],) + sample[1:] \
+                for sample in data))
+            rows = c.rowcount
+            numDuplicates += len(data) - c.rowcount
+        numRows += rows
+    reportDuplicateProgress(numDuplicates)
+    return experimentId, numRows
+
+def reportDuplicateProgress(numDuplicates):
+    if numDuplicates > 0:
+        print('Ignoring %d duplicate progress data samples. Consider increasing '
+              'ompl::tools::Benchmark::Request::timeBetweenUpdates.' % numDuplicates)
+
+def writeExperiment(c, columns, experiment):
+    """Insert the experiment data generated by parseBenchmarkLog(). Return the
+    id of the new experiment and the number of inserted rows."""
+    numRows = 0
+
+    # adding columns to experiments table
+    expprops = experiment['expprops']
+    for name in sorted(expprops.keys()):
+        addColumn(c, columns, 'experiments', name, expprops[name][1])
+
+    for enum in experiment['enums']:
+        c.execute('SELECT * FROM enums WHERE name IS ?', (enum[0],))
+        if c.fetchone() is None:
+            c.executemany('INSERT INTO enums VALUES (?,?,?)', \
+                [(enum[0], j, enum[j + 1]) for j in range(len(enum) - 1)])
+            numRows += len(enum) - 1
+
+    # Creating entry in experiments table
+    experimentEntries = experiment['experimentEntries']
+    c.execute('INSERT INTO experiments (' + ','.join(experiment['expColNames']) + ') VALUES (' +
+              ','.join('?'*len(experimentEntries)) + ')', experimentEntries)
+    return c.lastrowid, numRows + 1
+
+def writePlanner(c, columns, experimentId, planner):
+    """Insert a planner configuration and its runs generated by
+    parseBenchmarkLog(). Return the id of the first run, the statement to
+    insert the planner's progress data (or None if there is none), and the
+    number of inserted rows."""
+    print('Parsing data for ' + planner['name'])
+    numRows = 0
+
+    # find planner id
+    c.execute('SELECT id FROM plannerConfigs WHERE (name=? AND settings=?)', \
+        (planner['name'], planner['settings'],))
+    p = c.fetchone()
+    if p is None:
+        c.execute('INSERT INTO plannerConfigs VALUES (?,?,?)', \
+            (None, planner['name'], planner['settings'],))
+        plannerId = c.lastrowid
+        numRows += 1
+    else:
+        plannerId = p[0]
+
+    # add columns as necessary
+    propertyNames = ['id', 'experimentid', 'plannerid']
+    for propertyName, propertyType in planner['properties']:
+        addColumn(c, columns, 'runs', propertyName, propertyType)
+        propertyNames.append(propertyName)
+    # insert measurements; the ids of the runs are assigned here, so
+    # that the progress data can refer to them
+    insertFmtStr = 'INSERT INTO runs (' + ','.join(propertyNames) + \
+        ') VALUES (' + ','.join('?'*len(propertyNames)) + ')'
+    c.execute("""SELECT max(ifnull((SELECT seq FROM sqlite_sequence WHERE name = 'runs'), 0),
+        ifnull((SELECT max(id) FROM runs), 0))""")
+    firstRunId = c.fetchone()[0] + 1
+    c.executemany(insertFmtStr, [(firstRunId + j, experimentId, plannerId) + run \
+        for j, run in enumerate(planner['runs'])])
+    numRows += len(planner['runs'])
+
+    # prepare the insertion of planner progress data if it's supplied
+    progressInsert = None
+    if planner['progressProperties']:
+        progressPropertyNames = ['runid']
+        for progressPropertyName, progressPropertyType in planner['progressProperties']:
+            addColumn(c, columns, 'progress', progressPropertyName, progressPropertyType)
+            progressPropertyNames.append(progressPropertyName)
+        progressInsert = 'INSERT OR IGNORE INTO progress (' + \
+            ','.join(progressPropertyNames) + ') VALUES (' + \
+            ','.join('?'*len(progressPropertyNames)) + ')'
+    return firstRunId, progressInsert, numRows
 
 def plotAttribute(cur, planners, attribute, typename):
     """Create a plot for a particular attribute. It will include data for
@@ -324,14 +569,19 @@ def plotAttribute(cur, planners, attribute, typename):
         cur.execute('SELECT description FROM enums where name IS "%s"' % attribute)
         descriptions = [t[0] for t in cur.fetchall()]
         numValues = len(descriptions)
+    # fetch the values for all planners at once
+    values = dict((planner[0], []) for planner in planners)
+    nulls = dict((planner[0], 0) for planner in planners)
+    cur.execute('SELECT plannerid, %s FROM runs' % attribute)
+    for plannerid, value in cur:
+        if value is None:
+            nulls[plannerid] += 1
+        else:
+            values[plannerid].append(value)
     for planner in planners:
-        cur.execute('SELECT %s FROM runs WHERE plannerid = %s AND %s IS NOT NULL' \
-            % (attribute, planner[0], attribute))
-        measurement = [t[0] for t in cur.fetchall() if t[0] is not None]
+        measurement = values[planner[0]]
         if measurement:
-            cur.execute('SELECT count(*) FROM runs WHERE plannerid = %s AND %s IS NULL' \
-                % (planner[0], attribute))
-            nanCounts.append(cur.fetchone()[0])
+            nanCounts.append(nulls[planner[0]])
             labels.append(planner[1])
             if typename == 'ENUM':
                 scale = 100. / len(measurement)
@@ -396,25 +646,26 @@ each planner."""
     ax.set_xlabel('time (s)')
     ax.set_ylabel(attribute.replace('_', ' '))
     plannerNames = []
+    # fetch the data series of all runs at once; the rows are sorted by the
+    # primary key of the progress table, so each run's samples are consecutive
+    # and ordered by time
+    timeTables = dict((planner[0], []) for planner in planners)
+    dataTables = dict((planner[0], []) for planner in planners)
+    hasData = set()
+    cur.execute("""SELECT runs.plannerid, progress.runid, progress.time, progress.%s
+        FROM progress INNER JOIN runs ON progress.runid = runs.id
+        ORDER BY progress.runid, progress.time""" % attribute)
+    for (plannerid, _), samples in groupby(cur, itemgetter(0, 1)):
+        (_, _, time, data) = zip(*samples)
+        timeTables[plannerid].append(time)
+        dataTables[plannerid].append(data)
+        if plannerid not in hasData and any(d is not None for d in data):
+            hasData.add(plannerid)
     for planner in planners:
-        cur.execute("""SELECT count(progress.%s) FROM progress INNER JOIN runs
-            ON progress.runid = runs.id AND runs.plannerid=%s
-            AND progress.%s IS NOT NULL""" \
-            % (attribute, planner[0], attribute))
-        if cur.fetchone()[0] > 0:
+        if planner[0] in hasData:
             plannerNames.append(planner[1])
-            cur.execute("""SELECT DISTINCT progress.runid FROM progress INNER JOIN runs
-            WHERE progress.runid=runs.id AND runs.plannerid=?""", (planner[0],))
-            runids = [t[0] for t in cur.fetchall()]
-            timeTable = []
-            dataTable = []
-            for r in runids:
-                # Select data for given run
-                cur.execute('SELECT time, %s FROM progress WHERE runid = %s ORDER BY time' % \
-                    (attribute, r))
-                (time, data) = zip(*(cur.fetchall()))
-                timeTable.append(time)
-                dataTable.append(data)
+            timeTable = timeTables[planner[0]]
+            dataTable = dataTables[planner[0]]
             # It's conceivable that the sampling process may have
             # generated more samples for one run than another; in this
             # case, truncate all data series to length of shortest
@@ -451,14 +702,18 @@ def plotStatistics(dbname):
         for col in colInfo:
             if col[2] == 'BOOLEAN' or col[2] == 'ENUM' or \
                col[2] == 'INTEGER' or col[2] == 'REAL':
+                startTime = perf_counter()
                 plotAttribute(c, planners, col[1], col[2])
                 pp.savefig(plt.gcf())
+                print('Plotted "%s" in %.2f seconds' % (col[1], perf_counter() - startTime))
 
         c.execute('PRAGMA table_info(progress)')
         colInfo = c.fetchall()[2:]
         for col in colInfo:
+            startTime = perf_counter()
             plotProgressAttribute(c, planners, col[1])
             pp.savefig(plt.gcf())
+            print('Plotted progress of "%s" in %.2f seconds' % (col[1], perf_counter() - startTime))
         plt.clf()
 
         pagey = 0.9
@@ -534,6 +789,105 @@ def saveAsMysql(dbname):
             line = line.replace('AUTOINCREMENT', 'AUTO_INCREMENT')
             mysqldump.write(line)
 
+# Column types that are stored as integers in columnar exports
+INTEGER_TYPES = frozenset(['INTEGER', 'BOOLEAN', 'ENUM'])
+
+# Columns that contain ids, which are never NULL
+ID_COLUMNS = frozenset(['id', 'experimentid', 'plannerid', 'runid'])
+
+def columnarArray(values, name, typename):
+    """Convert the values of a database column to a NumPy array. The dtype only
+    depends on the column: ids are stored as 64-bit integers, other integer
+    and real columns as floating point numbers, so that NULL can be
+    represented by NaN, and NULL strings become empty strings."""
+    import numpy as np
+    if name in ID_COLUMNS:
+        return np.array(values, dtype=np.int64)
+    if typename in INTEGER_TYPES or typename == 'REAL':
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(['' if v is None else str(v) for v in values], dtype=str)
+
+def columnarTable(pa, names, types, rows):
+    """Convert rows of a database table to a pyarrow Table."""
+    paTypes = [pa.int64() if t in INTEGER_TYPES else pa.float64() if t == 'REAL' \
+        else pa.string() for t in types]
+    columns = list(zip(*rows)) if rows else [[] for _ in names]
+    return pa.table([pa.array([None if v is None else str(v) for v in column] \
+        if paType == pa.string() else column, type=paType) \
+        for column, paType in zip(columns, paTypes)], names=names)
+
+def exportColumnar(dbname, dirname):
+    """Export the experiments, plannerConfigs, runs and progress tables as
+    column-oriented files in the directory dirname. Each table is written as
+    a NumPy .npz file with one array per column and, if pyarrow is available,
+    as a Parquet file. The progress data is written one planner configuration
+    at a time: as the files progress_<plannerid>.npz and as the row groups of
+    progress.parquet. The database is opened read-only."""
+    import numpy as np
+    if not Path(dbname).is_file():
+        raise IOError('Database %s does not exist' % dbname)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print('pyarrow was not found; only exporting NumPy .npz files...')
+        pa = None
+    print('Exporting columnar data to ' + dirname)
+    outdir = Path(dirname)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(Path(dbname).resolve().as_uri() + '?mode=ro', uri=True)
+    c = conn.cursor()
+    for table in ['experiments', 'plannerConfigs', 'runs']:
+        startTime = perf_counter()
+        c.execute('PRAGMA table_info(%s)' % table)
+        colInfo = c.fetchall()
+        names = [col[1] for col in colInfo]
+        types = [col[2] for col in colInfo]
+        c.execute('SELECT %s FROM %s ORDER BY id' % (','.join(names), table))
+        rows = c.fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(names)
+        # the str() calls are needed for backwards compatibility with python2
+        np.savez(str(outdir / (table + '.npz')), **dict((name, columnarArray(column, name, typename)) \
+            for name, typename, column in zip(names, types, columns)))
+        if pa is not None:
+            pq.write_table(columnarTable(pa, names, types, rows), str(outdir / (table + '.parquet')))
+        print('Exported %d rows of %s in %.2f seconds' % \
+            (len(rows), table, perf_counter() - startTime))
+
+    c.execute('PRAGMA table_info(progress)')
+    colInfo = c.fetchall()
+    names = [col[1] for col in colInfo]
+    types = [col[2] for col in colInfo]
+    c.execute('SELECT id FROM plannerConfigs ORDER BY id')
+    plannerIds = [t[0] for t in c.fetchall()]
+    writer = None
+    try:
+        for plannerId in plannerIds:
+            startTime = perf_counter()
+            c.execute("""SELECT %s FROM progress INNER JOIN runs ON progress.runid = runs.id
+                WHERE runs.plannerid = ? ORDER BY progress.runid, progress.time""" % \
+                ','.join('progress.' + name for name in names), (plannerId,))
+            rows = c.fetchall()
+            if not rows:
+                continue
+            columns = list(zip(*rows))
+            np.savez(str(outdir / ('progress_%d.npz' % plannerId)), \
+                **dict((name, columnarArray(column, name, typename)) \
+                for name, typename, column in zip(names, types, columns)))
+            if pa is not None:
+                chunk = columnarTable(pa, names, types, rows)
+                if writer is None:
+                    writer = pq.ParquetWriter(str(outdir / 'progress.parquet'), chunk.schema)
+                writer.write_table(chunk)
+            print('Exported %d rows of progress data for planner %d in %.2f seconds' % \
+                (len(rows), plannerId, perf_counter() - startTime))
+    finally:
+        if writer is not None:
+            writer.close()
+    c.close()
+    conn.close()
+
 def computeViews(dbname, moveitformat):
     conn = sqlite3.connect(dbname)
     c = conn.cursor()
@@ -592,6 +946,10 @@ if __name__ == '__main__':
         help='Save SQLite3 database as a MySQL dump file')
     parser.add_argument('--moveit', action='store_true', default=False, \
         help='Log files are produced by MoveIt!')
+    parser.add_argument('--export-columnar', metavar='DIR', \
+        help='Export the database as NumPy .npz files (and Parquet files if pyarrow is available) in DIR')
+    parser.add_argument('-j', '--jobs', type=int, default=1, \
+        help='Number of processes that parse log files in parallel')
     parser.add_argument('logfile', nargs='*')
     args = parser.parse_args()
 
@@ -599,7 +957,7 @@ if __name__ == '__main__':
         Path(args.database).unlink()
 
     if args.logfile:
-        readBenchmarkLog(args.database, args.logfile, args.moveit)
+        readBenchmarkLog(args.database, args.logfile, args.moveit, args.jobs)
         # If we update the database, we recompute the views as well
         args.view = True
 
@@ -611,3 +969,6 @@ if __name__ == '__main__':
 
     if args.mysql:
         saveAsMysql(args.database)
+
+    if args.export_columnar:
+        exportColumnar(args.database, args.export_columnar)
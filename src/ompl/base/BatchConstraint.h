@@ -0,0 +1,103 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_CONSTRAINTS_BATCH_CONSTRAINT_
+#define OMPL_BASE_CONSTRAINTS_BATCH_CONSTRAINT_
+
+#include "ompl/base/Constraint.h"
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::BatchConstraint */
+        OMPL_CLASS_FORWARD(BatchConstraint);
+        /// @endcond
+
+        /** \class ompl::base::BatchConstraintPtr
+            \brief A shared pointer wrapper for ompl::base::BatchConstraint */
+
+        /** \brief Definition of a constraint whose function and Jacobian are
+            evaluated at many points in a single call. Points are passed to
+            functions() and jacobians() as the rows of a matrix. This is mostly
+            useful for constraints that are implemented in Python, where every
+            call has a significant overhead. In particular, the numerical
+            Jacobian evaluates the constraint function at all points of the
+            finite difference stencil with one call of functions(). */
+        class BatchConstraint : public Constraint
+        {
+        public:
+            /** \brief Constructor. See Constraint for the meaning of the
+                arguments. */
+            BatchConstraint(const unsigned int ambientDim, const unsigned int coDim,
+                            double tolerance = magic::CONSTRAINT_PROJECTION_TOLERANCE)
+              : Constraint(ambientDim, coDim, tolerance)
+            {
+            }
+
+            ~BatchConstraint() override = default;
+
+            /** \brief Compute the constraint function at each row of \a x.
+                The result for row \e i of \a x is returned in row \e i of \a
+                out, which is allocated to have coDim columns. */
+            virtual void functions(const Eigen::Ref<const Eigen::MatrixXd> &x,
+                                   Eigen::Ref<Eigen::MatrixXd> out) const = 0;
+
+            /** \brief Compute the Jacobian of the constraint function at each
+                row of \a x. The Jacobian at row \e i of \a x is returned in
+                rows \e i * coDim to (\e i + 1) * coDim - 1 of \a out, which is
+                allocated to have ambientDim columns. The default implementation
+                performs the differentiation numerically with the same
+                seven-point central difference stencil as Constraint::jacobian(),
+                but evaluates the constraint function at all points of the
+                stencil with one call of functions(). */
+            virtual void jacobians(const Eigen::Ref<const Eigen::MatrixXd> &x, Eigen::Ref<Eigen::MatrixXd> out) const;
+
+            /** \brief Compute the constraint function at \a x by calling
+                functions() with a batch of size one. */
+            void function(const Eigen::Ref<const Eigen::VectorXd> &x, Eigen::Ref<Eigen::VectorXd> out) const override;
+
+            /** \brief Compute the Jacobian of the constraint function at \a x
+                by calling jacobians() with a batch of size one. */
+            void jacobian(const Eigen::Ref<const Eigen::VectorXd> &x, Eigen::Ref<Eigen::MatrixXd> out) const override;
+
+            using Constraint::function;
+            using Constraint::jacobian;
+        };
+    }
+}
+
+#endif
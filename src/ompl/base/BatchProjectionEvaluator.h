@@ -0,0 +1,89 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_BATCH_PROJECTION_EVALUATOR_
+#define OMPL_BASE_BATCH_PROJECTION_EVALUATOR_
+
+#include "ompl/base/ProjectionEvaluator.h"
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::BatchProjectionEvaluator */
+        OMPL_CLASS_FORWARD(BatchProjectionEvaluator);
+        /// @endcond
+
+        /** \class ompl::base::BatchProjectionEvaluatorPtr
+            \brief A shared pointer wrapper for ompl::base::BatchProjectionEvaluator */
+
+        /** \brief Abstract definition of a projection that projects many
+            states in a single call. States are passed to projectValues() as the
+            rows of a matrix, where each row contains the real values of a state
+            as returned by StateSpace::copyToReals(). This is mostly useful for
+            projections that are implemented in Python, where every call has a
+            significant overhead: planners that project several states at once
+            (e.g., the states along a motion in ompl::control::KPIECE1) send
+            them in one batch. */
+        class BatchProjectionEvaluator : public ProjectionEvaluator
+        {
+        public:
+            /** \brief Construct a projection evaluator for a specific state space */
+            BatchProjectionEvaluator(const StateSpace *space);
+
+            /** \brief Construct a projection evaluator for a specific state space */
+            BatchProjectionEvaluator(const StateSpacePtr &space);
+
+            ~BatchProjectionEvaluator() override = default;
+
+            /** \brief Compute the projections of the states stored in the rows
+                of \e states. Row \e i of \e projections (which is allocated to
+                have one row per state and getDimension() columns) must be set
+                to the projection of row \e i of \e states. */
+            virtual void projectValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                                       Eigen::Ref<Eigen::MatrixXd> projections) const = 0;
+
+            /** \brief Project a single state by calling projectValues() with a
+                batch of size one */
+            void project(const State *state, Eigen::Ref<Eigen::VectorXd> projection) const override;
+
+            void projectStates(const std::vector<const State *> &states,
+                               Eigen::Ref<Eigen::MatrixXd> projections) const override;
+        };
+    }
+}
+
+#endif
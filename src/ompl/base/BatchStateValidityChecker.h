@@ -0,0 +1,89 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+#ifndef OMPL_BASE_BATCH_STATE_VALIDITY_CHECKER_
+#define OMPL_BASE_BATCH_STATE_VALIDITY_CHECKER_
+
+#include "ompl/base/StateValidityChecker.h"
+#include <Eigen/Core>
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::BatchStateValidityChecker */
+        OMPL_CLASS_FORWARD(BatchStateValidityChecker);
+        /// @endcond
+
+        /** \class ompl::base::BatchStateValidityCheckerPtr
+            \brief A shared pointer wrapper for ompl::base::BatchStateValidityChecker */
+
+        /** \brief Abstract definition of a state validity checker that checks
+            many states in a single call. States are passed to validity() as the
+            rows of a matrix, where each row contains the real values of a state
+            as returned by StateSpace::copyToReals(). This is mostly useful for
+            validity checkers that are implemented in Python, where every call
+            has a significant overhead: the motion validator and the valid state
+            samplers collect the states they need to check and send them in one
+            batch. */
+        class BatchStateValidityChecker : public StateValidityChecker
+        {
+        public:
+            /** \brief Constructor */
+            BatchStateValidityChecker(SpaceInformation *si);
+
+            /** \brief Constructor */
+            BatchStateValidityChecker(const SpaceInformationPtr &si);
+
+            ~BatchStateValidityChecker() override = default;
+
+            /** \brief Compute the validity of the states stored in the rows of
+                \e states. The result is returned in \e valid, which is
+                allocated to have one element per row of \e states. An element
+                should be set to a nonzero value iff the corresponding state is
+                valid. */
+            virtual void validity(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                                  Eigen::Ref<Eigen::VectorXd> valid) const = 0;
+
+            /** \brief Check the validity of a single state by calling
+                validity() with a batch of size one */
+            bool isValid(const State *state) const override;
+
+            bool areValid(const std::vector<const State *> &states, std::vector<bool> &valid) const override;
+        };
+    }
+}
+
+#endif
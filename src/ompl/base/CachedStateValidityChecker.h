@@ -0,0 +1,233 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_CACHED_STATE_VALIDITY_CHECKER_
+#define OMPL_BASE_CACHED_STATE_VALIDITY_CHECKER_
+
+#include "ompl/base/StateValidityChecker.h"
+#include <atomic>
+#include <cstdint>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::CachedStateValidityChecker */
+        OMPL_CLASS_FORWARD(CachedStateValidityChecker);
+        /// @endcond
+
+        /** \class ompl::base::CachedStateValidityChecker
+            \brief A shared pointer wrapper for ompl::base::CachedStateValidityChecker */
+
+        /** \brief A state validity checker that remembers the results of
+            another (expensive) state validity checker. Planners and path
+            simplifiers often check the same or nearly the same states
+            repeatedly; for those states the stored result is returned.
+
+            States are identified by a hash of their real values (see
+            StateSpace::getValueLocations()), rounded to a resolution that can
+            be set per subspace. With the default resolution of 0, only states
+            with identical values share a result. With a positive resolution,
+            states whose values round to the same multiples of the resolution
+            are considered the same, so results of nearby states are reused
+            (which is only correct if the validity does not change at a
+            smaller scale). Different states could also share a result if
+            their 64-bit hashes collide, which is very unlikely.
+
+            The number of stored results is bounded. When the cache is full,
+            results are evicted with the CLOCK algorithm (an approximation of
+            least recently used). The cache is divided into shards with
+            separate locks, so it can be used by multi-threaded planners. The
+            wrapped checker is called without holding a lock. */
+        class CachedStateValidityChecker : public StateValidityChecker
+        {
+        public:
+            /** \brief Constructor. Remember the results of \e checker for at
+                most \e capacity states. */
+            CachedStateValidityChecker(const SpaceInformationPtr &si, StateValidityCheckerPtr checker,
+                                       std::size_t capacity = 1000000);
+
+            ~CachedStateValidityChecker() override = default;
+
+            bool isValid(const State *state) const override;
+
+            /** \brief Check the validity and compute the clearance with the
+                wrapped checker (this is not cached) */
+            bool isValid(const State *state, double &dist) const override;
+
+            /** \brief Check the validity and compute the valid state with the
+                wrapped checker (this is not cached) */
+            bool isValid(const State *state, double &dist, State *validState, bool &validStateAvailable) const override;
+
+            /** \brief Look up the validity of all states and check the states
+                that are not stored with a single call to
+                StateValidityChecker::areValid() of the wrapped checker */
+            bool areValid(const std::vector<const State *> &states, std::vector<bool> &valid) const override;
+
+            double clearance(const State *state) const override;
+
+            double clearance(const State *state, State *validState, bool &validStateAvailable) const override;
+
+            /** \brief Get the wrapped state validity checker */
+            const StateValidityCheckerPtr &getStateValidityChecker() const
+            {
+                return checker_;
+            }
+
+            /** \brief Set the resolution used to round the values of all
+                states. A resolution of 0 means no rounding. This clears the
+                cache. */
+            void setResolution(double resolution);
+
+            /** \brief Set the resolution used to round the values of subspace
+                \e index of a compound state space. This overrides
+                setResolution() for that subspace and clears the cache. */
+            void setSubspaceResolution(unsigned int index, double resolution);
+
+            /** \brief Get the resolution used for the values of states that
+                are not in a subspace with its own resolution */
+            double getResolution() const
+            {
+                return resolution_;
+            }
+
+            /** \brief Set the maximum number of stored results. This clears
+                the cache. */
+            void setCapacity(std::size_t capacity);
+
+            /** \brief Get the maximum number of stored results */
+            std::size_t getCapacity() const
+            {
+                return capacity_;
+            }
+
+            /** \brief Set the maximum number of stored results such that the
+                cache uses at most approximately \e bytes bytes of memory. This
+                clears the cache. */
+            void setMemoryLimit(std::size_t bytes);
+
+            /** \brief Get the approximate amount of memory used per stored
+                result, in bytes */
+            static std::size_t getMemoryPerEntry();
+
+            /** \brief Get the number of stored results */
+            std::size_t size() const;
+
+            /** \brief Forget all stored results and reset the statistics. This
+                must be called if the environment changes. */
+            void clear();
+
+            /** \brief Get the number of validity checks answered from the cache */
+            unsigned long getHitCount() const
+            {
+                return hits_;
+            }
+
+            /** \brief Get the number of validity checks passed to the wrapped
+                checker */
+            unsigned long getMissCount() const
+            {
+                return misses_;
+            }
+
+            /** \brief Get the fraction of validity checks answered from the
+                cache (0 if there were no checks) */
+            double getHitRate() const;
+
+        private:
+            /** \brief A stored result */
+            struct Entry
+            {
+                std::uint64_t hash;
+                bool valid;
+                /** \brief Flag used by the CLOCK algorithm */
+                bool referenced;
+            };
+
+            /** \brief Part of the cache with its own lock */
+            struct Shard
+            {
+                std::mutex lock;
+                std::vector<Entry> entries;
+                std::unordered_map<std::uint64_t, std::size_t> index;
+                /** \brief Position of the clock hand in \e entries */
+                std::size_t hand{0};
+            };
+
+            /** \brief Compute the hash of the rounded values of \e state */
+            std::uint64_t hash(const State *state) const;
+
+            /** \brief Look up the result for \e hash. Return false if it is not stored. */
+            bool lookup(std::uint64_t hash, bool &valid) const;
+
+            /** \brief Store the result for \e hash, evicting another result if needed */
+            void insert(std::uint64_t hash, bool valid) const;
+
+            /** \brief Get the shard that stores the result for \e hash */
+            Shard &shard(std::uint64_t hash) const;
+
+            /** \brief Compute the resolution for each value of a state, if needed */
+            void computeResolutions() const;
+
+            StateValidityCheckerPtr checker_;
+
+            std::size_t capacity_;
+
+            double resolution_{0.0};
+
+            /** \brief Resolutions of the subspaces of a compound state space (negative if not set) */
+            std::vector<double> subspaceResolutions_;
+
+            /** \brief Resolution for each value location of the state space */
+            mutable std::vector<double> valueResolutions_;
+
+            mutable std::atomic<bool> resolutionsComputed_{false};
+
+            mutable std::mutex resolutionsLock_;
+
+            mutable std::vector<Shard> shards_;
+
+            mutable std::atomic<unsigned long> hits_{0};
+
+            mutable std::atomic<unsigned long> misses_{0};
+        };
+    }
+}
+
+#endif
@@ -71,6 +71,12 @@ namespace ompl
             StateSpace *stateSpace_;
 
             void defaultSettings();
+
+            /** \brief Check all the states along the motion from \e s1 to \e s2 (excluding \e s1) with a single
+                call to SpaceInformation::areValid(). This is used when the state validity checker supports batch
+                validity computation. If the motion is invalid, \e firstInvalid is set to the index of the first
+                invalid state in the range [1, \e nd]. */
+            bool checkMotionBatch(const State *s1, const State *s2, int nd, int &firstInvalid) const;
         };
     }
 }
@@ -0,0 +1,172 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_OCCUPANCY_GRID_VALIDITY_CHECKER_
+#define OMPL_BASE_OCCUPANCY_GRID_VALIDITY_CHECKER_
+
+#include "ompl/base/StateValidityChecker.h"
+#include "ompl/util/PPM.h"
+#include <mutex>
+#include <vector>
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::OccupancyGridValidityChecker */
+        OMPL_CLASS_FORWARD(OccupancyGridValidityChecker);
+        /// @endcond
+
+        /** \class ompl::base::OccupancyGridValidityCheckerPtr
+            \brief A shared pointer wrapper for ompl::base::OccupancyGridValidityChecker */
+
+        /** \brief A state validity checker for a point robot in a 2D or 3D
+            occupancy grid (e.g., a map stored as an image). The position of a
+            state is given by its first two or three real values (see
+            StateSpace::getValueAddressAtIndex()), so this works for
+            RealVectorStateSpace, SE2StateSpace, SE3StateSpace and compound
+            spaces that start with one of these. A state is valid iff the cell
+            that contains its position is free. Positions outside the grid are
+            invalid.
+
+            The cells are stored like the pixels of an image: the first
+            coordinate (x) indexes columns and varies fastest, the second
+            coordinate (y) indexes rows and the third coordinate (z) indexes
+            layers. Cell (i, j, k) covers the positions \e origin + [i, i + 1] x
+            [j, j + 1] x [k, k + 1] \e resolution.
+
+            The clearance of a state is computed with a Euclidean distance
+            transform of the grid, which is computed when clearance() is first
+            called. */
+        class OccupancyGridValidityChecker : public StateValidityChecker
+        {
+        public:
+            /** \brief Constructor. \e gridSize contains the number of cells
+                along each axis (two or three values); \e occupancy contains one
+                value per cell (in the order described above), where nonzero
+                values mark occupied cells. \e origin is the position of the
+                corner of cell (0, 0, 0); if it is empty, the origin is at 0. */
+            OccupancyGridValidityChecker(const SpaceInformationPtr &si, std::vector<unsigned int> gridSize,
+                                         std::vector<unsigned char> occupancy, double resolution = 1.0,
+                                         std::vector<double> origin = std::vector<double>());
+
+            /** \brief Constructor for a 2D grid stored in an image. Pixel (row,
+                col) is cell (x = col, y = row); it is free iff all its color
+                channels are larger than 127 (i.e., light pixels are free). */
+            OccupancyGridValidityChecker(const SpaceInformationPtr &si, const PPM &ppm, double resolution = 1.0,
+                                         std::vector<double> origin = std::vector<double>());
+
+            ~OccupancyGridValidityChecker() override = default;
+
+            bool isValid(const State *state) const override;
+
+            bool isValid(const State *state, double &dist) const override;
+
+            /** \brief Return the distance from the position of \e state to the
+                nearest occupied cell or the boundary of the grid (0 for invalid
+                states). The distance to an occupied cell is measured from the
+                center of the cell that contains the position, so it is accurate
+                up to the resolution of the grid. */
+            double clearance(const State *state) const override;
+
+            /** \brief Check whether the straight line segment between the
+                positions of \e s1 and \e s2 only passes through free cells. All
+                cells that the segment intersects are visited (no sampling). If
+                the segment is not free, \e lastValid is set to the fraction of
+                the segment before the first occupied cell (or before it leaves
+                the grid). */
+            bool checkSegment(const State *s1, const State *s2, double &lastValid) const;
+
+            /** \brief Get the number of dimensions of the grid (2 or 3) */
+            unsigned int getDimension() const
+            {
+                return gridSize_.size();
+            }
+
+            /** \brief Get the number of cells along each axis */
+            const std::vector<unsigned int> &getGridSize() const
+            {
+                return gridSize_;
+            }
+
+            /** \brief Get the size of the cells */
+            double getResolution() const
+            {
+                return resolution_;
+            }
+
+            /** \brief Get the position of the corner of cell (0, 0, 0) */
+            const std::vector<double> &getOrigin() const
+            {
+                return origin_;
+            }
+
+            /** \brief Check whether a cell is occupied. Cells outside the grid
+                are considered occupied. */
+            bool isOccupied(int x, int y, int z = 0) const;
+
+        private:
+            /** \brief Compute the cell that contains the position of \e state
+                (in cell coordinates) */
+            void getGridPosition(const State *state, double *position) const;
+
+            /** \brief Get the index of the cell that contains \e position (in
+                cell coordinates), or -1 if it is outside the grid */
+            long getCellIndex(const double *position) const;
+
+            /** \brief Compute the squared distances (in cells) of all cells to
+                the nearest occupied cell */
+            void computeDistanceTransform() const;
+
+            void setup(std::vector<double> origin);
+
+            std::vector<unsigned int> gridSize_;
+
+            std::vector<unsigned char> occupancy_;
+
+            double resolution_;
+
+            std::vector<double> origin_;
+
+            /** \brief Squared distance of each cell to the nearest occupied cell, in cells */
+            mutable std::vector<float> squaredDistance_;
+
+            mutable std::once_flag distanceTransformComputed_;
+        };
+    }
+}
+
+#endif
@@ -49,6 +49,7 @@
 
 #include <functional>
 #include <iostream>
+#include <vector>
 
 namespace ompl
 {
@@ -116,6 +117,17 @@ namespace ompl
             /** \brief Evaluate a cost map defined on the state space at a state \e s. */
             virtual Cost stateCost(const State *s) const = 0;
 
+            /** \brief Evaluate the cost map at each of the \e states. The result is stored in \e costs, which is
+                resized to have one element per state. The default implementation calls stateCost() for each state.
+                Objectives for which evaluating many states at once is cheaper than evaluating them one by one
+                (e.g., objectives implemented in Python) should override this function. */
+            virtual void stateCosts(const std::vector<const State *> &states, std::vector<Cost> &costs) const
+            {
+                costs.resize(states.size());
+                for (std::size_t i = 0; i < states.size(); ++i)
+                    costs[i] = stateCost(states[i]);
+            }
+
             /** \brief Get the cost that corresponds to the motion segment between \e s1 and \e s2 */
             virtual Cost motionCost(const State *s1, const State *s2) const = 0;
 
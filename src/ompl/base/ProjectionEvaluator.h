@@ -148,6 +148,15 @@ namespace ompl
             /** \brief Compute the projection as an array of double values */
             virtual void project(const State *state, Eigen::Ref<Eigen::VectorXd> projection) const = 0;
 
+            /** \brief Compute the projections of several states at once. Row \e i
+                of \e projections (which has one row per state and getDimension()
+                columns) is set to the projection of \e states[i]. The default
+                implementation calls project() for each state; derived classes
+                can override this if projecting many states at once is cheaper
+                (see BatchProjectionEvaluator). */
+            virtual void projectStates(const std::vector<const State *> &states,
+                                       Eigen::Ref<Eigen::MatrixXd> projections) const;
+
             /** \brief Define the size (in each dimension) of a grid
                 cell. The number of sizes set here must be the
                 same as the dimension of the projection computed by
@@ -239,6 +248,13 @@ namespace ompl
                 computeCoordinates(projection, coord);
             }
 
+            /** \brief Compute integer coordinates for several states with a
+                single call to projectStates(). The coordinates of \e states[i]
+                are stored in \e coords[i]; \e coords is only resized if it has
+                fewer elements than \e states. */
+            void computeCoordinates(const std::vector<const State *> &states,
+                                    std::vector<Eigen::VectorXi> &coords) const;
+
             /** \brief Get the parameters for this projection */
             ParamSet &params()
             {
@@ -47,11 +47,13 @@
 #include "ompl/util/Console.h"
 #include "ompl/util/Exception.h"
 
+#include <atomic>
 #include <functional>
 #include <utility>
 #include <cstdlib>
 #include <vector>
 #include <iostream>
+#include <mutex>
 
 /** \brief Main namespace. Contains everything in this library */
 namespace ompl
@@ -88,7 +90,7 @@ namespace ompl
             /** \brief Constructor. Sets the instance of the state space to plan with. */
             SpaceInformation(StateSpacePtr space);
 
-            virtual ~SpaceInformation() = default;
+            virtual ~SpaceInformation();
 
             /** \brief Check if a given state is valid or not */
             bool isValid(const State *state) const
@@ -96,6 +98,12 @@ namespace ompl
                 return stateValidityChecker_->isValid(state);
             }
 
+            /** \brief Check the validity of a batch of states. See StateValidityChecker::areValid(). */
+            bool areValid(const std::vector<const State *> &states, std::vector<bool> &valid) const
+            {
+                return stateValidityChecker_->areValid(states, valid);
+            }
+
             /** \brief Return the instance of the used state space */
             const StateSpacePtr &getStateSpace() const
             {
@@ -221,9 +229,21 @@ namespace ompl
             /** @name State memory management
                 @{ */
 
-            /** \brief Allocate memory for a state */
+            /** \brief Allocate memory for a state. If the state pool is
+                enabled (see setStatePoolCapacity()), a previously freed state
+                is reused if one is available. */
             State *allocState() const
             {
+                if (statePoolCapacity_ > 0)
+                {
+                    std::lock_guard<std::mutex> lock(statePoolLock_);
+                    if (!statePool_.empty())
+                    {
+                        State *state = statePool_.back();
+                        statePool_.pop_back();
+                        return state;
+                    }
+                }
                 return stateSpace_->allocState();
             }
 
@@ -231,12 +251,23 @@ namespace ompl
             void allocStates(std::vector<State *> &states) const
             {
                 for (auto &state : states)
-                    state = stateSpace_->allocState();
+                    state = allocState();
             }
 
-            /** \brief Free the memory of a state */
+            /** \brief Free the memory of a state. If the state pool is
+                enabled and not full, the state is kept for reuse by
+                allocState() instead. */
             void freeState(State *state) const
             {
+                if (statePoolCapacity_ > 0)
+                {
+                    std::lock_guard<std::mutex> lock(statePoolLock_);
+                    if (statePool_.size() < statePoolCapacity_)
+                    {
+                        statePool_.push_back(state);
+                        return;
+                    }
+                }
                 stateSpace_->freeState(state);
             }
 
@@ -244,7 +275,25 @@ namespace ompl
             void freeStates(std::vector<State *> &states) const
             {
                 for (auto &state : states)
-                    stateSpace_->freeState(state);
+                    freeState(state);
+            }
+
+            /** \brief Keep up to \e capacity freed states in a pool, so that
+                allocState() can reuse them instead of allocating new memory
+                through the state space. This avoids the cost of allocating and
+                freeing the memory of states in planners that frequently
+                allocate temporary states. A capacity of 0 (the default)
+                disables the pool. Pooled states are returned to the state
+                space when the capacity is reduced, in setup() and when this
+                instance is destroyed. The capacity should not be changed while
+                planning. */
+            void setStatePoolCapacity(std::size_t capacity);
+
+            /** \brief Get the maximum number of freed states that are kept
+                for reuse by allocState() */
+            std::size_t getStatePoolCapacity() const
+            {
+                return statePoolCapacity_;
             }
 
             /** \brief Copy a state to another */
@@ -256,7 +305,9 @@ namespace ompl
             /** \brief Clone a state */
             State *cloneState(const State *source) const
             {
-                return stateSpace_->cloneState(source);
+                State *copy = allocState();
+                stateSpace_->copyState(copy, source);
+                return copy;
             }
 
             /**  @} */
@@ -452,6 +503,18 @@ namespace ompl
 
             /** \brief Combined parameters for the contained classes */
             ParamSet params_;
+
+            /** \brief The maximum number of freed states kept for reuse. This
+                is only changed while holding statePoolLock_, but it is read
+                without the lock to keep allocation cheap when the pool is
+                disabled. */
+            std::atomic<std::size_t> statePoolCapacity_{0};
+
+            /** \brief Freed states that can be reused by allocState() */
+            mutable std::vector<State *> statePool_;
+
+            /** \brief Lock for accessing the state pool */
+            mutable std::mutex statePoolLock_;
         };
     }
 }
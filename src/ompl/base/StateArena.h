@@ -0,0 +1,149 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_STATE_ARENA_
+#define OMPL_BASE_STATE_ARENA_
+
+#include "ompl/base/spaces/RealVectorStateSpace.h"
+#include "ompl/util/ClassForward.h"
+#include <memory>
+#include <unordered_map>
+#include <vector>
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::StateArena */
+        OMPL_CLASS_FORWARD(StateArena);
+        /// @endcond
+
+        /** \class ompl::base::StateArenaPtr
+            \brief A shared pointer wrapper for ompl::base::StateArena */
+
+        /** \brief A fixed number of states that are allocated (and freed) at
+            once. For a RealVectorStateSpace, the states are stored in one
+            contiguous array and their values in another one, so that the
+            values of all states can be accessed as a single matrix (see
+            getValues()); for other state spaces the states are allocated
+            individually. The states can be accessed by index, or handed out
+            and recycled with allocState() and freeState(), which do not
+            allocate any memory. The states belong to the arena and must not be
+            freed through the state space. This class is not thread-safe. */
+        class StateArena
+        {
+        public:
+            /** \brief Allocate \e size states of the state space \e space */
+            StateArena(StateSpacePtr space, std::size_t size);
+
+            StateArena(const StateArena &) = delete;
+            StateArena &operator=(const StateArena &) = delete;
+
+            ~StateArena();
+
+            /** \brief Get the state space the states belong to */
+            const StateSpacePtr &getStateSpace() const
+            {
+                return space_;
+            }
+
+            /** \brief Get the number of states in the arena */
+            std::size_t size() const
+            {
+                return states_.size();
+            }
+
+            /** \brief Get the state with index \e index */
+            State *getState(std::size_t index) const
+            {
+                return states_[index];
+            }
+
+            /** \brief Get the index of \e state, or size() if \e state does
+                not belong to the arena */
+            std::size_t getIndex(const State *state) const;
+
+            /** \brief Get a state that is not in use. Returns nullptr if all
+                states are in use. Initially, no state is in use. */
+            State *allocState();
+
+            /** \brief Mark \e state as not in use, so that it can be
+                returned by allocState() again */
+            void freeState(State *state);
+
+            /** \brief Get the number of states that are not in use */
+            std::size_t numFreeStates() const
+            {
+                return free_.size();
+            }
+
+            /** \brief If the state space is a RealVectorStateSpace, return
+                the values of all states, stored as a row-major matrix with one
+                row per state. Otherwise, return nullptr. */
+            double *getValues() const
+            {
+                return values_.get();
+            }
+
+        private:
+            /** \brief The state space the states belong to */
+            StateSpacePtr space_;
+
+            /** \brief The states of the arena */
+            std::vector<State *> states_;
+
+            /** \brief The indices of the states that are not in use */
+            std::vector<std::size_t> free_;
+
+            /** \brief Flag indicating whether a state is in use */
+            std::vector<bool> used_;
+
+            /** \brief The index of each state, if the states are allocated
+                individually */
+            std::unordered_map<const State *, std::size_t> indices_;
+
+            /** \brief Contiguous memory for the values of the states of a
+                RealVectorStateSpace */
+            std::unique_ptr<double[]> values_;
+
+            /** \brief Contiguous memory for the states of a
+                RealVectorStateSpace */
+            std::unique_ptr<RealVectorStateSpace::StateType[]> realVectorStates_;
+        };
+    }
+}
+
+#endif
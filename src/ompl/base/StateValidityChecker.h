@@ -39,6 +39,7 @@
 
 #include "ompl/base/State.h"
 #include "ompl/util/ClassForward.h"
+#include <vector>
 
 namespace ompl
 {
@@ -82,6 +83,11 @@ namespace ompl
             /** \brief Flag indicating that this state validity checker can return
                 a direction that moves a state away from being invalid. */
             bool hasValidDirectionComputation{false};
+
+            /** \brief Flag indicating that this state validity checker can check
+                a batch of states at once more efficiently than one state at a time
+                (see StateValidityChecker::areValid()). */
+            bool hasBatchValidityComputation{false};
         };
 
         /** \brief Abstract definition for a class checking the
@@ -131,6 +137,23 @@ namespace ompl
                 return isValid(state);
             }
 
+            /** \brief Check the validity of all the states in \e states at once. On return, \e valid[i] is true iff
+                \e states[i] is valid. The return value is true iff all states are valid. The default implementation
+                calls isValid() for each state. Implementations for which checking many states at once is cheaper
+                than checking them one by one should override this function and set
+                StateValidityCheckerSpecs::hasBatchValidityComputation. */
+            virtual bool areValid(const std::vector<const State *> &states, std::vector<bool> &valid) const
+            {
+                bool result = true;
+                valid.resize(states.size());
+                for (std::size_t i = 0; i < states.size(); ++i)
+                {
+                    valid[i] = isValid(states[i]);
+                    result = result && valid[i];
+                }
+                return result;
+            }
+
             /** \brief Report the distance to the nearest invalid state when starting from \e state. If the distance is
                 negative, the value of clearance is the penetration depth.*/
             virtual double clearance(const State * /*state*/) const
@@ -0,0 +1,85 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#ifndef OMPL_BASE_OBJECTIVES_BATCH_STATE_COST_INTEGRAL_OBJECTIVE_
+#define OMPL_BASE_OBJECTIVES_BATCH_STATE_COST_INTEGRAL_OBJECTIVE_
+
+#include "ompl/base/objectives/StateCostIntegralObjective.h"
+#include <Eigen/Core>
+
+namespace ompl
+{
+    namespace base
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::base::BatchStateCostIntegralObjective */
+        OMPL_CLASS_FORWARD(BatchStateCostIntegralObjective);
+        /// @endcond
+
+        /** \class ompl::base::BatchStateCostIntegralObjectivePtr
+            \brief A shared pointer wrapper for ompl::base::BatchStateCostIntegralObjective */
+
+        /** \brief A StateCostIntegralObjective whose cost map is evaluated for
+            many states in a single call. States are passed to stateCostValues()
+            as the rows of a matrix, where each row contains the real values of
+            a state as returned by StateSpace::copyToReals(). This is mostly
+            useful for objectives that are implemented in Python, where every
+            call has a significant overhead: motionCost() evaluates all the
+            states along a motion in one batch. */
+        class BatchStateCostIntegralObjective : public StateCostIntegralObjective
+        {
+        public:
+            /** \brief Constructor. See StateCostIntegralObjective for the
+                meaning of \e enableMotionCostInterpolation. */
+            BatchStateCostIntegralObjective(const SpaceInformationPtr &si, bool enableMotionCostInterpolation = false);
+
+            ~BatchStateCostIntegralObjective() override = default;
+
+            /** \brief Compute the cost of the states stored in the rows of \e
+                states. The result is returned in \e costs, which is allocated
+                to have one element per row of \e states. */
+            virtual void stateCostValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                                         Eigen::Ref<Eigen::VectorXd> costs) const = 0;
+
+            /** \brief Evaluate the cost of a single state by calling
+                stateCostValues() with a batch of size one */
+            Cost stateCost(const State *s) const override;
+
+            void stateCosts(const std::vector<const State *> &states, std::vector<Cost> &costs) const override;
+        };
+    }
+}
+
+#endif
@@ -0,0 +1,71 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/objectives/BatchStateCostIntegralObjective.h"
+
+ompl::base::BatchStateCostIntegralObjective::BatchStateCostIntegralObjective(const SpaceInformationPtr &si,
+                                                                             bool enableMotionCostInterpolation)
+  : StateCostIntegralObjective(si, enableMotionCostInterpolation)
+{
+    description_ = "Batch State Cost Integral";
+}
+
+ompl::base::Cost ompl::base::BatchStateCostIntegralObjective::stateCost(const State *s) const
+{
+    std::vector<Cost> costs;
+    stateCosts(std::vector<const State *>(1, s), costs);
+    return costs[0];
+}
+
+void ompl::base::BatchStateCostIntegralObjective::stateCosts(const std::vector<const State *> &states,
+                                                             std::vector<Cost> &costs) const
+{
+    const StateSpacePtr &space = si_->getStateSpace();
+    std::vector<double> reals;
+    Eigen::MatrixXd values(states.size(), space->getValueLocations().size());
+    Eigen::VectorXd result(Eigen::VectorXd::Zero(states.size()));
+
+    for (std::size_t i = 0; i < states.size(); ++i)
+    {
+        space->copyToReals(reals, states[i]);
+        values.row(i) = Eigen::Map<const Eigen::VectorXd>(reals.data(), reals.size());
+    }
+
+    stateCostValues(values, result);
+
+    costs.resize(states.size());
+    for (std::size_t i = 0; i < states.size(); ++i)
+        costs[i] = Cost(result[i]);
+}
@@ -35,6 +35,7 @@
 /* Author: Luis G. Torres */
 
 #include "ompl/base/objectives/StateCostIntegralObjective.h"
+#include <algorithm>
 
 ompl::base::StateCostIntegralObjective::StateCostIntegralObjective(const SpaceInformationPtr &si,
                                                                    bool enableMotionCostInterpolation)
@@ -52,42 +53,43 @@ ompl::base::Cost ompl::base::StateCostIntegralObjective::motionCost(const State
 {
     if (interpolateMotionCost_)
     {
-        Cost totalCost = this->identityCost();
-
         int nd = si_->getStateSpace()->validSegmentCount(s1, s2);
 
-        State *test1 = si_->cloneState(s1);
-        Cost prevStateCost = this->stateCost(test1);
-        if (nd > 1)
+        // compute the costs of all states along the motion at once, so that
+        // objectives that evaluate batches of states are called only once
+        std::vector<State *> interpolated(std::max(nd - 1, 0));
+        si_->allocStates(interpolated);
+        std::vector<const State *> states(1, s1);
+        for (int j = 1; j < nd; ++j)
         {
-            State *test2 = si_->allocState();
-            for (int j = 1; j < nd; ++j)
-            {
-                si_->getStateSpace()->interpolate(s1, s2, (double)j / (double)nd, test2);
-                Cost nextStateCost = this->stateCost(test2);
-                totalCost = Cost(totalCost.value() +
-                                 this->trapezoid(prevStateCost, nextStateCost, si_->distance(test1, test2)).value());
-                std::swap(test1, test2);
-                prevStateCost = nextStateCost;
-            }
-            si_->freeState(test2);
+            si_->getStateSpace()->interpolate(s1, s2, (double)j / (double)nd, interpolated[j - 1]);
+            states.push_back(interpolated[j - 1]);
         }
+        states.push_back(s2);
 
-        // Lastly, add s2
-        totalCost = Cost(totalCost.value() +
-                         this->trapezoid(prevStateCost, this->stateCost(s2), si_->distance(test1, s2)).value());
+        std::vector<Cost> costs;
+        this->stateCosts(states, costs);
+
+        Cost totalCost = this->identityCost();
+        for (std::size_t j = 1; j < states.size(); ++j)
+            totalCost = Cost(totalCost.value() +
+                             this->trapezoid(costs[j - 1], costs[j], si_->distance(states[j - 1], states[j])).value());
 
-        si_->freeState(test1);
+        si_->freeStates(interpolated);
 
         return totalCost;
     }
 
-    return this->trapezoid(this->stateCost(s1), this->stateCost(s2), si_->distance(s1, s2));
+    std::vector<Cost> costs;
+    this->stateCosts({s1, s2}, costs);
+    return this->trapezoid(costs[0], costs[1], si_->distance(s1, s2));
 }
 
 ompl::base::Cost ompl::base::StateCostIntegralObjective::motionCostBestEstimate(const State *s1, const State *s2) const
 {
-    return this->trapezoid(this->stateCost(s1), this->stateCost(s2), si_->distance(s1, s2));
+    std::vector<Cost> costs;
+    this->stateCosts({s1, s2}, costs);
+    return this->trapezoid(costs[0], costs[1], si_->distance(s1, s2));
 }
 
 bool ompl::base::StateCostIntegralObjective::isMotionCostInterpolationEnabled() const
@@ -39,6 +39,8 @@
 
 #include "ompl/base/ValidStateSampler.h"
 #include "ompl/base/StateSampler.h"
+#include <functional>
+#include <vector>
 
 namespace ompl
 {
@@ -51,14 +53,26 @@ namespace ompl
             /** \brief Constructor */
             UniformValidStateSampler(const SpaceInformation *si);
 
-            ~UniformValidStateSampler() override = default;
+            ~UniformValidStateSampler() override;
 
             bool sample(State *state) override;
             bool sampleNear(State *state, const State *near, double distance) override;
 
         protected:
+            /** \brief Draw samples with \e sampleFn in chunks of at most BATCH_SIZE states and check the validity
+                of each chunk with a single call to SpaceInformation::areValid(), until a valid sample is found or
+                the number of attempts is exhausted. The first valid sample is copied to \e state. This is used
+                when the state validity checker supports batch validity computation. */
+            bool sampleBatch(State *state, const std::function<void(State *)> &sampleFn);
+
+            /** \brief The maximum number of samples whose validity is checked at once */
+            static constexpr unsigned int BATCH_SIZE = 8;
+
             /** \brief The sampler to build upon */
             StateSamplerPtr sampler_;
+
+            /** \brief Scratch states for sampleBatch(), allocated when first needed */
+            std::vector<State *> batch_;
         };
     }
 }
@@ -36,6 +36,7 @@
 
 #include "ompl/base/samplers/UniformValidStateSampler.h"
 #include "ompl/base/SpaceInformation.h"
+#include <algorithm>
 
 ompl::base::UniformValidStateSampler::UniformValidStateSampler(const SpaceInformation *si)
   : ValidStateSampler(si), sampler_(si->allocStateSampler())
@@ -43,8 +44,16 @@ ompl::base::UniformValidStateSampler::UniformValidStateSampler(const SpaceInform
     name_ = "uniform";
 }
 
+ompl::base::UniformValidStateSampler::~UniformValidStateSampler()
+{
+    si_->freeStates(batch_);
+}
+
 bool ompl::base::UniformValidStateSampler::sample(State *state)
 {
+    if (si_->getStateValidityChecker()->getSpecs().hasBatchValidityComputation)
+        return sampleBatch(state, [this](State *s) { sampler_->sampleUniform(s); });
+
     unsigned int attempts = 0;
     bool valid = false;
     do
@@ -58,6 +67,9 @@ bool ompl::base::UniformValidStateSampler::sample(State *state)
 
 bool ompl::base::UniformValidStateSampler::sampleNear(State *state, const State *near, const double distance)
 {
+    if (si_->getStateValidityChecker()->getSpecs().hasBatchValidityComputation)
+        return sampleBatch(state, [this, near, distance](State *s) { sampler_->sampleUniformNear(s, near, distance); });
+
     unsigned int attempts = 0;
     bool valid = false;
     do
@@ -68,3 +80,34 @@ bool ompl::base::UniformValidStateSampler::sampleNear(State *state, const State
     } while (!valid && attempts < attempts_);
     return valid;
 }
+
+bool ompl::base::UniformValidStateSampler::sampleBatch(State *state, const std::function<void(State *)> &sampleFn)
+{
+    if (batch_.empty())
+    {
+        batch_.resize(BATCH_SIZE);
+        si_->allocStates(batch_);
+    }
+
+    std::vector<const State *> samples;
+    std::vector<bool> valid;
+    unsigned int attempts = std::max(attempts_, 1u);
+    while (attempts > 0)
+    {
+        unsigned int count = std::min(attempts, BATCH_SIZE);
+        attempts -= count;
+        samples.assign(batch_.begin(), batch_.begin() + count);
+        for (unsigned int i = 0; i < count; ++i)
+            sampleFn(batch_[i]);
+        si_->areValid(samples, valid);
+        auto it = std::find(valid.begin(), valid.end(), true);
+        if (it != valid.end())
+        {
+            si_->copyState(state, batch_[it - valid.begin()]);
+            return true;
+        }
+        if (attempts == 0)
+            si_->copyState(state, batch_[count - 1]);
+    }
+    return false;
+}
@@ -0,0 +1,95 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/BatchConstraint.h"
+#include <cmath>
+#include <limits>
+
+void ompl::base::BatchConstraint::jacobians(const Eigen::Ref<const Eigen::MatrixXd> &x,
+                                            Eigen::Ref<Eigen::MatrixXd> out) const
+{
+    const Eigen::Index points = x.rows(), n = n_, k = getCoDimension();
+
+    // Use a 7-point central difference stencil on each column. Row
+    // 6 * (i * n + j) + 2 * s (+ 1) of y is point i shifted by (s + 1) * h
+    // in the positive (negative) direction of coordinate j.
+    Eigen::MatrixXd y(6 * points * n, n);
+    for (Eigen::Index i = 0; i < points; ++i)
+        for (Eigen::Index j = 0; j < n; ++j)
+        {
+            const double ax = std::fabs(x(i, j));
+            // Make step size as small as possible while still giving usable accuracy.
+            const double h = std::sqrt(std::numeric_limits<double>::epsilon()) * (ax >= 1 ? ax : 1);
+            double y1 = x(i, j), y2 = x(i, j);
+            for (Eigen::Index s = 0; s < 3; ++s)
+            {
+                Eigen::Index row = 6 * (i * n + j) + 2 * s;
+                y1 += h;
+                y2 -= h;
+                y.row(row) = y.row(row + 1) = x.row(i);
+                y(row, j) = y1;
+                y(row + 1, j) = y2;
+            }
+        }
+
+    Eigen::MatrixXd t(y.rows(), k);
+    functions(y, t);
+
+    for (Eigen::Index i = 0; i < points; ++i)
+        for (Eigen::Index j = 0; j < n; ++j)
+        {
+            Eigen::Index row = 6 * (i * n + j);
+            // Can't assume y1[j]-y2[j] == 2*h because of precision errors.
+            auto m = [&](Eigen::Index s) -> Eigen::VectorXd {
+                return (t.row(row + 2 * s) - t.row(row + 2 * s + 1)).transpose() /
+                       (y(row + 2 * s, j) - y(row + 2 * s + 1, j));
+            };
+            out.block(i * k, j, k, 1) = 1.5 * m(0) - 0.6 * m(1) + 0.1 * m(2);
+        }
+}
+
+void ompl::base::BatchConstraint::function(const Eigen::Ref<const Eigen::VectorXd> &x,
+                                           Eigen::Ref<Eigen::VectorXd> out) const
+{
+    Eigen::MatrixXd result(1, getCoDimension());
+    functions(x.transpose(), result);
+    out = result.row(0).transpose();
+}
+
+void ompl::base::BatchConstraint::jacobian(const Eigen::Ref<const Eigen::VectorXd> &x,
+                                           Eigen::Ref<Eigen::MatrixXd> out) const
+{
+    jacobians(x.transpose(), out);
+}
@@ -0,0 +1,303 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/CachedStateValidityChecker.h"
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/util/Exception.h"
+#include <cmath>
+#include <cstring>
+
+namespace
+{
+    // number of independently locked parts of the cache (a power of two)
+    constexpr std::size_t NUM_SHARDS = 16;
+
+    // the finalizer of MurmurHash3
+    std::uint64_t mix(std::uint64_t h)
+    {
+        h ^= h >> 33;
+        h *= 0xff51afd7ed558ccdULL;
+        h ^= h >> 33;
+        h *= 0xc4ceb9fe1a85ec53ULL;
+        h ^= h >> 33;
+        return h;
+    }
+}
+
+ompl::base::CachedStateValidityChecker::CachedStateValidityChecker(const SpaceInformationPtr &si,
+                                                                   StateValidityCheckerPtr checker,
+                                                                   std::size_t capacity)
+  : StateValidityChecker(si), checker_(std::move(checker)), capacity_(capacity), shards_(NUM_SHARDS)
+{
+    if (!checker_)
+        throw Exception("CachedStateValidityChecker needs a state validity checker");
+    specs_ = checker_->getSpecs();
+}
+
+void ompl::base::CachedStateValidityChecker::setResolution(double resolution)
+{
+    resolution_ = resolution;
+    resolutionsComputed_ = false;
+    clear();
+}
+
+void ompl::base::CachedStateValidityChecker::setSubspaceResolution(unsigned int index, double resolution)
+{
+    if (subspaceResolutions_.size() <= index)
+        subspaceResolutions_.resize(index + 1, -1.0);
+    subspaceResolutions_[index] = resolution;
+    resolutionsComputed_ = false;
+    clear();
+}
+
+void ompl::base::CachedStateValidityChecker::setCapacity(std::size_t capacity)
+{
+    capacity_ = capacity;
+    clear();
+}
+
+void ompl::base::CachedStateValidityChecker::setMemoryLimit(std::size_t bytes)
+{
+    setCapacity(bytes / getMemoryPerEntry());
+}
+
+std::size_t ompl::base::CachedStateValidityChecker::getMemoryPerEntry()
+{
+    // an entry, plus a node and a bucket of the hash table that indexes it
+    return sizeof(Entry) + sizeof(std::pair<const std::uint64_t, std::size_t>) + 3 * sizeof(void *);
+}
+
+std::size_t ompl::base::CachedStateValidityChecker::size() const
+{
+    std::size_t result = 0;
+    for (auto &shard : shards_)
+    {
+        std::lock_guard<std::mutex> guard(shard.lock);
+        result += shard.entries.size();
+    }
+    return result;
+}
+
+void ompl::base::CachedStateValidityChecker::clear()
+{
+    for (auto &shard : shards_)
+    {
+        std::lock_guard<std::mutex> guard(shard.lock);
+        shard.entries.clear();
+        shard.index.clear();
+        shard.hand = 0;
+    }
+    hits_ = 0;
+    misses_ = 0;
+}
+
+double ompl::base::CachedStateValidityChecker::getHitRate() const
+{
+    unsigned long hits = hits_, total = hits + misses_;
+    return total > 0 ? (double)hits / (double)total : 0.0;
+}
+
+void ompl::base::CachedStateValidityChecker::computeResolutions() const
+{
+    if (resolutionsComputed_)
+        return;
+    std::lock_guard<std::mutex> guard(resolutionsLock_);
+    if (resolutionsComputed_)
+        return;
+    const std::vector<StateSpace::ValueLocation> &locations = si_->getStateSpace()->getValueLocations();
+    if (locations.empty())
+        throw Exception("The state space must be set up before states are checked");
+    valueResolutions_.resize(locations.size());
+    for (std::size_t i = 0; i < locations.size(); ++i)
+    {
+        const std::vector<std::size_t> &chain = locations[i].stateLocation.chain;
+        double resolution = resolution_;
+        if (!chain.empty() && chain[0] < subspaceResolutions_.size() && subspaceResolutions_[chain[0]] >= 0.0)
+            resolution = subspaceResolutions_[chain[0]];
+        valueResolutions_[i] = resolution;
+    }
+    resolutionsComputed_ = true;
+}
+
+std::uint64_t ompl::base::CachedStateValidityChecker::hash(const State *state) const
+{
+    computeResolutions();
+    const StateSpace *space = si_->getStateSpace().get();
+    const std::vector<StateSpace::ValueLocation> &locations = space->getValueLocations();
+    std::uint64_t result = 0;
+    for (std::size_t i = 0; i < locations.size(); ++i)
+    {
+        double value = *space->getValueAddressAtLocation(state, locations[i]);
+        std::uint64_t bits;
+        if (valueResolutions_[i] > 0.0 && std::isfinite(value))
+            bits = (std::uint64_t)(std::int64_t)std::floor(value / valueResolutions_[i] + 0.5);
+        else
+        {
+            // +0 and -0 are the same value
+            if (value == 0.0)
+                value = 0.0;
+            std::memcpy(&bits, &value, sizeof(bits));
+        }
+        result = mix(result ^ (bits + 0x9e3779b97f4a7c15ULL + (result << 6) + (result >> 2)));
+    }
+    return result;
+}
+
+ompl::base::CachedStateValidityChecker::Shard &ompl::base::CachedStateValidityChecker::shard(std::uint64_t hash) const
+{
+    return shards_[hash >> 60 & (NUM_SHARDS - 1)];
+}
+
+bool ompl::base::CachedStateValidityChecker::lookup(std::uint64_t hash, bool &valid) const
+{
+    Shard &s = shard(hash);
+    std::lock_guard<std::mutex> guard(s.lock);
+    auto it = s.index.find(hash);
+    if (it == s.index.end())
+        return false;
+    Entry &entry = s.entries[it->second];
+    entry.referenced = true;
+    valid = entry.valid;
+    return true;
+}
+
+void ompl::base::CachedStateValidityChecker::insert(std::uint64_t hash, bool valid) const
+{
+    std::size_t capacity = (capacity_ + NUM_SHARDS - 1) / NUM_SHARDS;
+    if (capacity == 0)
+        return;
+    Shard &s = shard(hash);
+    std::lock_guard<std::mutex> guard(s.lock);
+    auto it = s.index.find(hash);
+    if (it != s.index.end())
+    {
+        // another thread checked the same state in the meantime
+        s.entries[it->second].valid = valid;
+        return;
+    }
+    if (s.entries.size() < capacity)
+    {
+        s.index.emplace(hash, s.entries.size());
+        s.entries.push_back(Entry{hash, valid, false});
+        return;
+    }
+    // evict the first entry that has not been referenced since the clock hand passed it
+    while (s.entries[s.hand].referenced)
+    {
+        s.entries[s.hand].referenced = false;
+        s.hand = (s.hand + 1) % s.entries.size();
+    }
+    s.index.erase(s.entries[s.hand].hash);
+    s.entries[s.hand] = Entry{hash, valid, false};
+    s.index.emplace(hash, s.hand);
+    s.hand = (s.hand + 1) % s.entries.size();
+}
+
+bool ompl::base::CachedStateValidityChecker::isValid(const State *state) const
+{
+    std::uint64_t h = hash(state);
+    bool valid;
+    if (lookup(h, valid))
+    {
+        ++hits_;
+        return valid;
+    }
+    ++misses_;
+    valid = checker_->isValid(state);
+    insert(h, valid);
+    return valid;
+}
+
+bool ompl::base::CachedStateValidityChecker::isValid(const State *state, double &dist) const
+{
+    return checker_->isValid(state, dist);
+}
+
+bool ompl::base::CachedStateValidityChecker::isValid(const State *state, double &dist, State *validState,
+                                                     bool &validStateAvailable) const
+{
+    return checker_->isValid(state, dist, validState, validStateAvailable);
+}
+
+bool ompl::base::CachedStateValidityChecker::areValid(const std::vector<const State *> &states,
+                                                      std::vector<bool> &valid) const
+{
+    valid.resize(states.size());
+    std::vector<std::uint64_t> hashes;
+    std::vector<std::size_t> missing;
+    std::vector<const State *> unknown;
+    bool result = true;
+    for (std::size_t i = 0; i < states.size(); ++i)
+    {
+        std::uint64_t h = hash(states[i]);
+        bool v;
+        if (lookup(h, v))
+        {
+            ++hits_;
+            valid[i] = v;
+            result = result && v;
+        }
+        else
+        {
+            hashes.push_back(h);
+            missing.push_back(i);
+            unknown.push_back(states[i]);
+        }
+    }
+    if (unknown.empty())
+        return result;
+
+    misses_ += unknown.size();
+    std::vector<bool> unknownValid;
+    checker_->areValid(unknown, unknownValid);
+    for (std::size_t i = 0; i < unknown.size(); ++i)
+    {
+        valid[missing[i]] = unknownValid[i];
+        result = result && unknownValid[i];
+        insert(hashes[i], unknownValid[i]);
+    }
+    return result;
+}
+
+double ompl::base::CachedStateValidityChecker::clearance(const State *state) const
+{
+    return checker_->clearance(state);
+}
+
+double ompl::base::CachedStateValidityChecker::clearance(const State *state, State *validState,
+                                                         bool &validStateAvailable) const
+{
+    return checker_->clearance(state, validState, validStateAvailable);
+}
@@ -36,6 +36,7 @@
 
 #include "ompl/base/DiscreteMotionValidator.h"
 #include "ompl/util/Exception.h"
+#include <algorithm>
 #include <queue>
 
 void ompl::base::DiscreteMotionValidator::defaultSettings()
@@ -45,6 +46,31 @@ void ompl::base::DiscreteMotionValidator::defaultSettings()
         throw Exception("No state space for motion validator");
 }
 
+bool ompl::base::DiscreteMotionValidator::checkMotionBatch(const State *s1, const State *s2, int nd,
+                                                           int &firstInvalid) const
+{
+    /* temporary storage for the interpolated states */
+    std::vector<State *> test(nd > 1 ? nd - 1 : 0);
+    si_->allocStates(test);
+
+    std::vector<const State *> states;
+    states.reserve(test.size() + 1);
+    for (std::size_t j = 0; j < test.size(); ++j)
+    {
+        stateSpace_->interpolate(s1, s2, (double)(j + 1) / (double)nd, test[j]);
+        states.push_back(test[j]);
+    }
+    states.push_back(s2);
+
+    std::vector<bool> valid;
+    bool result = si_->areValid(states, valid);
+    if (!result)
+        firstInvalid = std::find(valid.begin(), valid.end(), false) - valid.begin() + 1;
+
+    si_->freeStates(test);
+    return result;
+}
+
 bool ompl::base::DiscreteMotionValidator::checkMotion(const State *s1, const State *s2,
                                                       std::pair<State *, double> &lastValid) const
 {
@@ -53,7 +79,20 @@ bool ompl::base::DiscreteMotionValidator::checkMotion(const State *s1, const Sta
     bool result = true;
     int nd = stateSpace_->validSegmentCount(s1, s2);
 
-    if (nd > 1)
+    bool batch = si_->getStateValidityChecker()->getSpecs().hasBatchValidityComputation;
+
+    if (batch)
+    {
+        int j = 0;
+        if (!checkMotionBatch(s1, s2, nd, j))
+        {
+            lastValid.second = (double)(j - 1) / (double)nd;
+            if (lastValid.first != nullptr)
+                stateSpace_->interpolate(s1, s2, lastValid.second, lastValid.first);
+            result = false;
+        }
+    }
+    else if (nd > 1)
     {
         /* temporary storage for the checked state */
         State *test = si_->allocState();
@@ -73,7 +112,7 @@ bool ompl::base::DiscreteMotionValidator::checkMotion(const State *s1, const Sta
         si_->freeState(test);
     }
 
-    if (result)
+    if (result && !batch)
         if (!si_->isValid(s2))
         {
             lastValid.second = (double)(nd - 1) / (double)nd;
@@ -93,6 +132,17 @@ bool ompl::base::DiscreteMotionValidator::checkMotion(const State *s1, const Sta
 bool ompl::base::DiscreteMotionValidator::checkMotion(const State *s1, const State *s2) const
 {
     /* assume motion starts in a valid configuration so s1 is valid */
+    if (si_->getStateValidityChecker()->getSpecs().hasBatchValidityComputation)
+    {
+        int j = 0;
+        bool result = checkMotionBatch(s1, s2, stateSpace_->validSegmentCount(s1, s2), j);
+        if (result)
+            valid_++;
+        else
+            invalid_++;
+        return result;
+    }
+
     if (!si_->isValid(s2))
     {
         invalid_++;
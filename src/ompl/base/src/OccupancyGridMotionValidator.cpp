@@ -0,0 +1,82 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/OccupancyGridMotionValidator.h"
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/util/Exception.h"
+
+ompl::base::OccupancyGridMotionValidator::OccupancyGridMotionValidator(SpaceInformation *si) : MotionValidator(si)
+{
+    defaultSettings();
+}
+
+ompl::base::OccupancyGridMotionValidator::OccupancyGridMotionValidator(const SpaceInformationPtr &si)
+  : MotionValidator(si)
+{
+    defaultSettings();
+}
+
+void ompl::base::OccupancyGridMotionValidator::defaultSettings()
+{
+    checker_ = std::dynamic_pointer_cast<OccupancyGridValidityChecker>(si_->getStateValidityChecker());
+    if (!checker_)
+        throw Exception("OccupancyGridMotionValidator requires an OccupancyGridValidityChecker");
+}
+
+bool ompl::base::OccupancyGridMotionValidator::checkMotion(const State *s1, const State *s2) const
+{
+    double lastValid;
+    bool result = checker_->checkSegment(s1, s2, lastValid);
+    if (result)
+        valid_++;
+    else
+        invalid_++;
+    return result;
+}
+
+bool ompl::base::OccupancyGridMotionValidator::checkMotion(const State *s1, const State *s2,
+                                                           std::pair<State *, double> &lastValid) const
+{
+    bool result = checker_->checkSegment(s1, s2, lastValid.second);
+    if (result)
+        valid_++;
+    else
+    {
+        if (lastValid.first != nullptr)
+            si_->getStateSpace()->interpolate(s1, s2, lastValid.second, lastValid.first);
+        invalid_++;
+    }
+    return result;
+}
@@ -0,0 +1,281 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/OccupancyGridValidityChecker.h"
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/util/Exception.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+#include <limits>
+#include <numeric>
+
+namespace
+{
+    // squared distance (in cells) of cells that have no occupied cell in range
+    constexpr double UNREACHABLE = 1e20;
+
+    // One-dimensional squared Euclidean distance transform of the sampled
+    // function f (Felzenszwalb and Huttenlocher, Distance Transforms of
+    // Sampled Functions, 2012). v and z are scratch buffers of size n and
+    // n + 1.
+    void distanceTransform1D(const std::vector<double> &f, std::vector<double> &d, std::vector<int> &v,
+                             std::vector<double> &z)
+    {
+        const int n = f.size();
+        int k = 0;
+        v[0] = 0;
+        z[0] = -std::numeric_limits<double>::infinity();
+        z[1] = std::numeric_limits<double>::infinity();
+        for (int q = 1; q < n; ++q)
+        {
+            double s = ((f[q] + q * q) - (f[v[k]] + v[k] * v[k])) / (2 * q - 2 * v[k]);
+            while (s <= z[k])
+            {
+                --k;
+                s = ((f[q] + q * q) - (f[v[k]] + v[k] * v[k])) / (2 * q - 2 * v[k]);
+            }
+            ++k;
+            v[k] = q;
+            z[k] = s;
+            z[k + 1] = std::numeric_limits<double>::infinity();
+        }
+        k = 0;
+        for (int q = 0; q < n; ++q)
+        {
+            while (z[k + 1] < q)
+                ++k;
+            d[q] = (q - v[k]) * (q - v[k]) + f[v[k]];
+        }
+    }
+}
+
+ompl::base::OccupancyGridValidityChecker::OccupancyGridValidityChecker(const SpaceInformationPtr &si,
+                                                                       std::vector<unsigned int> gridSize,
+                                                                       std::vector<unsigned char> occupancy,
+                                                                       double resolution, std::vector<double> origin)
+  : StateValidityChecker(si), gridSize_(std::move(gridSize)), occupancy_(std::move(occupancy)), resolution_(resolution)
+{
+    setup(std::move(origin));
+}
+
+ompl::base::OccupancyGridValidityChecker::OccupancyGridValidityChecker(const SpaceInformationPtr &si, const PPM &ppm,
+                                                                       double resolution, std::vector<double> origin)
+  : StateValidityChecker(si), gridSize_({ppm.getWidth(), ppm.getHeight()}), resolution_(resolution)
+{
+    const std::vector<PPM::Color> &pixels = ppm.getPixels();
+    occupancy_.resize(pixels.size());
+    std::transform(pixels.begin(), pixels.end(), occupancy_.begin(), [](const PPM::Color &c) {
+        return (c.red > 127 && c.green > 127 && c.blue > 127) ? 0 : 1;
+    });
+    setup(std::move(origin));
+}
+
+void ompl::base::OccupancyGridValidityChecker::setup(std::vector<double> origin)
+{
+    if (gridSize_.size() != 2 && gridSize_.size() != 3)
+        throw Exception("Occupancy grids must have two or three dimensions");
+    std::size_t numCells = std::accumulate(gridSize_.begin(), gridSize_.end(), std::size_t(1), std::multiplies<>());
+    if (numCells == 0 || occupancy_.size() != numCells)
+        throw Exception("The occupancy grid does not match the grid size");
+    if (resolution_ <= 0.0)
+        throw Exception("The resolution of an occupancy grid must be positive");
+    if (origin.empty())
+        origin.resize(gridSize_.size(), 0.0);
+    else if (origin.size() != gridSize_.size())
+        throw Exception("The origin of an occupancy grid must have one coordinate per grid dimension");
+    origin_ = std::move(origin);
+    specs_.clearanceComputationType = StateValidityCheckerSpecs::APPROXIMATE;
+}
+
+void ompl::base::OccupancyGridValidityChecker::getGridPosition(const State *state, double *position) const
+{
+    const StateSpace *space = si_->getStateSpace().get();
+    for (unsigned int i = 0; i < gridSize_.size(); ++i)
+        position[i] = (*space->getValueAddressAtIndex(state, i) - origin_[i]) / resolution_;
+}
+
+long ompl::base::OccupancyGridValidityChecker::getCellIndex(const double *position) const
+{
+    long index = 0;
+    for (int i = gridSize_.size() - 1; i >= 0; --i)
+    {
+        // also rejects NaN
+        if (!(position[i] >= 0.0 && position[i] < gridSize_[i]))
+            return -1;
+        index = index * gridSize_[i] + (long)position[i];
+    }
+    return index;
+}
+
+bool ompl::base::OccupancyGridValidityChecker::isOccupied(int x, int y, int z) const
+{
+    int cell[3] = {x, y, z};
+    long index = 0;
+    for (int i = 2; i >= 0; --i)
+    {
+        int size = i < (int)gridSize_.size() ? gridSize_[i] : 1;
+        if (cell[i] < 0 || cell[i] >= size)
+            return true;
+        index = index * size + cell[i];
+    }
+    return occupancy_[index] != 0;
+}
+
+bool ompl::base::OccupancyGridValidityChecker::isValid(const State *state) const
+{
+    double position[3];
+    getGridPosition(state, position);
+    long index = getCellIndex(position);
+    return index >= 0 && occupancy_[index] == 0;
+}
+
+bool ompl::base::OccupancyGridValidityChecker::isValid(const State *state, double &dist) const
+{
+    dist = clearance(state);
+    return isValid(state);
+}
+
+double ompl::base::OccupancyGridValidityChecker::clearance(const State *state) const
+{
+    double position[3];
+    getGridPosition(state, position);
+    long index = getCellIndex(position);
+    if (index < 0 || occupancy_[index] != 0)
+        return 0.0;
+
+    std::call_once(distanceTransformComputed_, [this] { computeDistanceTransform(); });
+
+    // distance to the boundary of the grid
+    double dist = std::numeric_limits<double>::infinity();
+    for (unsigned int i = 0; i < gridSize_.size(); ++i)
+        dist = std::min(dist, std::min(position[i], gridSize_[i] - position[i]));
+    // distance to the nearest occupied cell, measured from the center of the cell
+    dist = std::min(dist, std::sqrt((double)squaredDistance_[index]) - 0.5);
+    return dist * resolution_;
+}
+
+void ompl::base::OccupancyGridValidityChecker::computeDistanceTransform() const
+{
+    std::size_t numCells = occupancy_.size(), stride = 1;
+    squaredDistance_.resize(numCells);
+    for (std::size_t i = 0; i < numCells; ++i)
+        squaredDistance_[i] = occupancy_[i] != 0 ? 0.0f : (float)UNREACHABLE;
+
+    // the transform is separable: apply the 1D transform along each axis
+    std::vector<double> f, d, z;
+    std::vector<int> v;
+    for (unsigned int size : gridSize_)
+    {
+        f.resize(size);
+        d.resize(size);
+        v.resize(size);
+        z.resize(size + 1);
+        // the lines along the current axis start at the cells whose index
+        // along that axis is 0
+        for (std::size_t start = 0; start < numCells; ++start)
+        {
+            if ((start / stride) % size != 0)
+                continue;
+            for (unsigned int j = 0; j < size; ++j)
+                f[j] = squaredDistance_[start + j * stride];
+            distanceTransform1D(f, d, v, z);
+            for (unsigned int j = 0; j < size; ++j)
+                squaredDistance_[start + j * stride] = (float)std::min(d[j], UNREACHABLE);
+        }
+        stride *= size;
+    }
+}
+
+bool ompl::base::OccupancyGridValidityChecker::checkSegment(const State *s1, const State *s2,
+                                                            double &lastValid) const
+{
+    // visit the cells along the segment as in Amanatides and Woo, A Fast Voxel
+    // Traversal Algorithm for Ray Tracing, 1987
+    const double inf = std::numeric_limits<double>::infinity();
+    double p[3], q[3], tMax[3] = {inf, inf, inf}, tDelta[3] = {inf, inf, inf};
+    int cell[3] = {0, 0, 0}, step[3] = {0, 0, 0};
+    unsigned int dim = gridSize_.size();
+    getGridPosition(s1, p);
+    getGridPosition(s2, q);
+    if (getCellIndex(p) < 0)
+    {
+        lastValid = 0.0;
+        return false;
+    }
+    for (unsigned int i = 0; i < dim; ++i)
+    {
+        cell[i] = (int)std::floor(p[i]);
+        double delta = q[i] - p[i];
+        if (delta > 0.0)
+        {
+            step[i] = 1;
+            tDelta[i] = 1.0 / delta;
+            tMax[i] = (cell[i] + 1 - p[i]) / delta;
+        }
+        else if (delta < 0.0)
+        {
+            step[i] = -1;
+            tDelta[i] = -1.0 / delta;
+            tMax[i] = (cell[i] - p[i]) / delta;
+        }
+    }
+
+    double t = 0.0;
+    while (true)
+    {
+        if (isOccupied(cell[0], cell[1], cell[2]))
+        {
+            // stop just before the segment enters the occupied cell
+            lastValid = std::max(0.0, t - 1e-9);
+            return false;
+        }
+        unsigned int axis = std::min_element(tMax, tMax + dim) - tMax;
+        if (tMax[axis] >= 1.0)
+            break;
+        t = tMax[axis];
+        cell[axis] += step[axis];
+        tMax[axis] += tDelta[axis];
+    }
+
+    // the end point may lie on the boundary of the last visited cell
+    long index = getCellIndex(q);
+    if (index < 0 || occupancy_[index] != 0)
+    {
+        lastValid = 1.0 - 1e-9;
+        return false;
+    }
+    return true;
+}
@@ -296,6 +296,29 @@ void ompl::base::ProjectionEvaluator::computeCoordinates(const Eigen::Ref<Eigen:
     computeCoordinatesHelper(cellSizes_, projection, coord);
 }
 
+void ompl::base::ProjectionEvaluator::projectStates(const std::vector<const State *> &states,
+                                                    Eigen::Ref<Eigen::MatrixXd> projections) const
+{
+    Eigen::VectorXd projection(getDimension());
+    for (std::size_t i = 0; i < states.size(); ++i)
+    {
+        project(states[i], projection);
+        projections.row(i) = projection.transpose();
+    }
+}
+
+void ompl::base::ProjectionEvaluator::computeCoordinates(const std::vector<const State *> &states,
+                                                         std::vector<Eigen::VectorXi> &coords) const
+{
+    Eigen::MatrixXd projections(states.size(), getDimension());
+    projectStates(states, projections);
+    if (coords.size() < states.size())
+        coords.resize(states.size());
+    Eigen::Map<const Eigen::RowVectorXd> cellSizes(cellSizes_.data(), cellSizes_.size());
+    for (std::size_t i = 0; i < states.size(); ++i)
+        coords[i] = (projections.row(i).array() / cellSizes.array()).floor().cast<int>().transpose();
+}
+
 void ompl::base::ProjectionEvaluator::printSettings(std::ostream &out) const
 {
     out << "Projection of dimension " << getDimension() << std::endl;
@@ -55,6 +55,22 @@ ompl::base::SpaceInformation::SpaceInformation(StateSpacePtr space) : stateSpace
     params_.include(stateSpace_->params());
 }
 
+ompl::base::SpaceInformation::~SpaceInformation()
+{
+    setStatePoolCapacity(0);
+}
+
+void ompl::base::SpaceInformation::setStatePoolCapacity(std::size_t capacity)
+{
+    std::lock_guard<std::mutex> lock(statePoolLock_);
+    statePoolCapacity_ = capacity;
+    while (statePool_.size() > capacity)
+    {
+        stateSpace_->freeState(statePool_.back());
+        statePool_.pop_back();
+    }
+}
+
 void ompl::base::SpaceInformation::setup()
 {
     if (!stateValidityChecker_)
@@ -66,6 +82,14 @@ void ompl::base::SpaceInformation::setup()
     if (!motionValidator_)
         setDefaultMotionValidator();
 
+    {
+        // the state space may change in setup(), so pooled states are not reused
+        std::lock_guard<std::mutex> lock(statePoolLock_);
+        for (State *state : statePool_)
+            stateSpace_->freeState(state);
+        statePool_.clear();
+    }
+
     stateSpace_->setup();
     if (stateSpace_->getDimension() <= 0)
         throw Exception("The dimension of the state space we plan in must be > 0");
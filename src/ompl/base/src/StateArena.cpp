@@ -0,0 +1,106 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#include "ompl/base/StateArena.h"
+#include "ompl/util/Exception.h"
+#include <utility>
+
+ompl::base::StateArena::StateArena(StateSpacePtr space, std::size_t size)
+  : space_(std::move(space)), states_(size), used_(size, false)
+{
+    if (auto *rvSpace = dynamic_cast<RealVectorStateSpace *>(space_.get()))
+    {
+        unsigned int dim = rvSpace->getDimension();
+        values_.reset(new double[size * dim]);
+        realVectorStates_.reset(new RealVectorStateSpace::StateType[size]);
+        for (std::size_t i = 0; i < size; ++i)
+        {
+            realVectorStates_[i].values = values_.get() + i * dim;
+            states_[i] = &realVectorStates_[i];
+        }
+    }
+    else
+        for (std::size_t i = 0; i < size; ++i)
+        {
+            states_[i] = space_->allocState();
+            indices_[states_[i]] = i;
+        }
+
+    // hand out the states in order of increasing index
+    free_.reserve(size);
+    for (std::size_t i = size; i > 0; --i)
+        free_.push_back(i - 1);
+}
+
+ompl::base::StateArena::~StateArena()
+{
+    if (!realVectorStates_)
+        for (auto *state : states_)
+            space_->freeState(state);
+}
+
+std::size_t ompl::base::StateArena::getIndex(const State *state) const
+{
+    if (realVectorStates_)
+    {
+        const auto *rvState = static_cast<const RealVectorStateSpace::StateType *>(state);
+        if (rvState >= realVectorStates_.get() && rvState < realVectorStates_.get() + size())
+            return rvState - realVectorStates_.get();
+        return size();
+    }
+    auto it = indices_.find(state);
+    return it == indices_.end() ? size() : it->second;
+}
+
+ompl::base::State *ompl::base::StateArena::allocState()
+{
+    if (free_.empty())
+        return nullptr;
+    std::size_t index = free_.back();
+    free_.pop_back();
+    used_[index] = true;
+    return states_[index];
+}
+
+void ompl::base::StateArena::freeState(State *state)
+{
+    std::size_t index = getIndex(state);
+    if (index == size())
+        throw Exception("StateArena::freeState(): state does not belong to this arena");
+    if (!used_[index])
+        throw Exception("StateArena::freeState(): state is not in use");
+    used_[index] = false;
+    free_.push_back(index);
+}
@@ -0,0 +1,103 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+#ifndef OMPL_CONTROL_BATCH_STATE_PROPAGATOR_
+#define OMPL_CONTROL_BATCH_STATE_PROPAGATOR_
+
+#include "ompl/control/StatePropagator.h"
+#include <Eigen/Core>
+
+namespace ompl
+{
+    namespace control
+    {
+        /// @cond IGNORE
+        /** \brief Forward declaration of ompl::control::BatchStatePropagator */
+        OMPL_CLASS_FORWARD(BatchStatePropagator);
+        /// @endcond
+
+        /** \class ompl::control::BatchStatePropagatorPtr
+            \brief A shared pointer wrapper for ompl::control::BatchStatePropagator */
+
+        /** \brief Abstract definition of a state propagator that propagates
+            many states in a single call. States, controls and durations are
+            passed to propagateValues() as the rows of matrices, where each row
+            contains the real values of a state (as returned by
+            base::StateSpace::copyToReals()) or of a control. This is mostly
+            useful for propagators that are implemented in Python, where every
+            call has a significant overhead and the dynamics can be written as
+            vectorized operations over all rows. SpaceInformation::propagateWhileValid()
+            for batches of states uses it, e.g., when SimpleDirectedControlSampler
+            tries several controls. */
+        class BatchStatePropagator : public StatePropagator
+        {
+        public:
+            /** \brief Constructor */
+            BatchStatePropagator(SpaceInformation *si);
+
+            /** \brief Constructor */
+            BatchStatePropagator(const SpaceInformationPtr &si);
+
+            ~BatchStatePropagator() override = default;
+
+            /** \brief Propagate the states stored in the rows of \e states.
+                Row \e i of \e results (which is allocated to have the same
+                shape as \e states) must be set to the state reached from row \e
+                i of \e states when applying the control in row \e i of \e
+                controls for \e durations[i]. */
+            virtual void propagateValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                                         const Eigen::Ref<const Eigen::MatrixXd> &controls,
+                                         const Eigen::Ref<const Eigen::VectorXd> &durations,
+                                         Eigen::Ref<Eigen::MatrixXd> results) const = 0;
+
+            /** \brief Propagate a single state by calling propagateValues()
+                with a batch of size one. This requires that all values of
+                the control can be accessed through
+                ControlSpace::getValueAddressAtIndex(); for other control
+                spaces (e.g., DiscreteControlSpace), derived classes need to
+                override this function. */
+            void propagate(const base::State *state, const Control *control, double duration,
+                           base::State *result) const override;
+
+            /** \brief Propagate all states with a single call to
+                propagateValues(), or one at a time with propagate() if the
+                values of the controls cannot be accessed */
+            void propagateStates(const std::vector<const base::State *> &states,
+                                 const std::vector<const Control *> &controls, const std::vector<double> &durations,
+                                 const std::vector<base::State *> &results) const override;
+        };
+    }
+}
+
+#endif
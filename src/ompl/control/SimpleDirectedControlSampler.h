@@ -39,6 +39,7 @@
 
 #include "ompl/control/DirectedControlSampler.h"
 #include "ompl/control/ControlSampler.h"
+#include <vector>
 
 namespace ompl
 {
@@ -104,7 +105,10 @@ namespace ompl
 
         protected:
             /** \brief Samples \e numControlSamples_ controls, and returns the
-                control that brings the system the closest to \e target */
+                control that brings the system the closest to \e target. All
+                controls are propagated with a single call to
+                SpaceInformation::propagateWhileValid(), so a
+                BatchStatePropagator receives all of them at once. */
             virtual unsigned int getBestControl(Control *control, const base::State *source, base::State *dest,
                                                 const Control *previous);
 
@@ -113,6 +117,13 @@ namespace ompl
 
             /** \brief The number of controls to sample when finding the best control*/
             unsigned int numControlSamples_;
+
+            /** \brief Scratch space for all sampled controls but the first
+                one, which is sampled into the output argument */
+            std::vector<Control *> controls_;
+
+            /** \brief Scratch space for the states reached by the sampled controls */
+            std::vector<base::State *> states_;
         };
     }
 }
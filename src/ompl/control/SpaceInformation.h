@@ -250,6 +250,27 @@ namespace ompl
             unsigned int propagateWhileValid(const base::State *state, const Control *control, int steps,
                                              base::State *result) const;
 
+            /** \brief Propagate several states at once, in the same way as
+                propagateWhileValid() for a single state. Propagation \e i
+                starts at \e states[i], applies \e controls[i] for at most \e
+                steps[i] time steps (backward if \e steps[i] is negative) and
+                stores the last valid state in \e results[i]; the number of
+                steps actually performed is stored in \e stepsTaken[i]. All
+                propagations advance together, so the state propagator is
+                called once per time step for all of them (see
+                StatePropagator::propagateStates()) and the reached states are
+                checked with a single call to areValid().
+                \param states the states to start at
+                \param controls the controls to apply
+                \param steps the maximum number of time steps to apply each control for
+                \param results the states at the end of the propagations or the last valid states if a collision is
+               found
+                \param stepsTaken the number of steps performed without collision for each propagation */
+            void propagateWhileValid(const std::vector<const base::State *> &states,
+                                     const std::vector<const Control *> &controls, const std::vector<int> &steps,
+                                     const std::vector<base::State *> &results,
+                                     std::vector<unsigned int> &stepsTaken) const;
+
             /** \brief Propagate the model of the system forward, starting a a given state, with a given control, for a
                given number of steps.
                 \param state the state to start at
@@ -40,6 +40,7 @@
 #include "ompl/base/State.h"
 #include "ompl/control/Control.h"
 #include "ompl/util/ClassForward.h"
+#include <vector>
 
 namespace ompl
 {
@@ -92,6 +93,24 @@ namespace ompl
             virtual void propagate(const base::State *state, const Control *control, double duration,
                                    base::State *result) const = 0;
 
+            /** \brief Propagate several states at once. For every \e i, the
+                system is propagated from \e states[i], with control \e controls[i],
+                for \e durations[i] and the reached state is stored in \e results[i].
+                The default implementation calls propagate() for each state;
+                derived classes can override this if propagating many states at
+                once is cheaper (see BatchStatePropagator).
+
+                \note As for propagate(), \e states[i] and \e results[i] may
+                point to the same state. */
+            virtual void propagateStates(const std::vector<const base::State *> &states,
+                                         const std::vector<const Control *> &controls,
+                                         const std::vector<double> &durations,
+                                         const std::vector<base::State *> &results) const
+            {
+                for (std::size_t i = 0; i < states.size(); ++i)
+                    propagate(states[i], controls[i], durations[i], results[i]);
+            }
+
             /** \brief Some systems can only propagate forward in time (i.e., the \e duration argument for the
                propagate()
                 function is always positive). If this is the case, this function should return false. Planners that need
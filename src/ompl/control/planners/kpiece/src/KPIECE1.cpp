@@ -207,6 +207,8 @@ ompl::base::PlannerStatus ompl::control::KPIECE1::solve(const base::PlannerTermi
     std::vector<base::State *> states(siC_->getMaxControlDuration() + 1);
     std::vector<Grid::Coord> coords(states.size(), Grid::Coord(projectionEvaluator_->getDimension()));
     std::vector<Grid::Cell *> cells(coords.size());
+    std::vector<const base::State *> batch;
+    batch.reserve(states.size());
 
     for (auto &state : states)
         state = si_->allocState();
@@ -245,10 +247,13 @@ ompl::base::PlannerStatus ompl::control::KPIECE1::solve(const base::PlannerTermi
             std::size_t avgCov_two_thirds = (2 * tree_.size) / (3 * tree_.grid.size());
             bool interestingMotion = false;
 
+            // project all the states along the motion at once
+            batch.assign(states.begin(), states.begin() + cd);
+            projectionEvaluator_->computeCoordinates(batch, coords);
+
             // split the motion into smaller ones, so we do not cross cell boundaries
             for (unsigned int i = 0; i < cd; ++i)
             {
-                projectionEvaluator_->computeCoordinates(states[i], coords[i]);
                 cells[i] = tree_.grid.getCell(coords[i]);
                 if (!cells[i])
                     interestingMotion = true;
@@ -0,0 +1,109 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+#include "ompl/control/BatchStatePropagator.h"
+#include "ompl/control/SpaceInformation.h"
+#include "ompl/util/Exception.h"
+
+namespace
+{
+    // check whether all values of a control can be accessed through
+    // ControlSpace::getValueAddressAtIndex(), which is not the case for
+    // control spaces that store their values in other types (e.g.,
+    // DiscreteControlSpace)
+    bool hasValueAddresses(const ompl::control::ControlSpace &space, const ompl::control::Control *control)
+    {
+        for (unsigned int j = 0; j < space.getDimension(); ++j)
+            if (space.getValueAddressAtIndex(const_cast<ompl::control::Control *>(control), j) == nullptr)
+                return false;
+        return true;
+    }
+}
+
+ompl::control::BatchStatePropagator::BatchStatePropagator(SpaceInformation *si) : StatePropagator(si)
+{
+}
+
+ompl::control::BatchStatePropagator::BatchStatePropagator(const SpaceInformationPtr &si) : StatePropagator(si)
+{
+}
+
+void ompl::control::BatchStatePropagator::propagate(const base::State *state, const Control *control,
+                                                    double duration, base::State *result) const
+{
+    if (!hasValueAddresses(*si_->getControlSpace(), control))
+        throw Exception("BatchStatePropagator", "The values of the controls cannot be passed to propagateValues(); "
+                                                "override propagate() to propagate them one at a time");
+    propagateStates(std::vector<const base::State *>(1, state), std::vector<const Control *>(1, control),
+                    std::vector<double>(1, duration), std::vector<base::State *>(1, result));
+}
+
+void ompl::control::BatchStatePropagator::propagateStates(const std::vector<const base::State *> &states,
+                                                          const std::vector<const Control *> &controls,
+                                                          const std::vector<double> &durations,
+                                                          const std::vector<base::State *> &results) const
+{
+    const base::StateSpacePtr &space = si_->getStateSpace();
+    const ControlSpacePtr &controlSpace = si_->getControlSpace();
+    const unsigned int stateDim = space->getValueLocations().size();
+    const unsigned int controlDim = controlSpace->getDimension();
+    // propagate controls whose values cannot be put in a matrix one at a time
+    if (!states.empty() && !hasValueAddresses(*controlSpace, controls[0]))
+    {
+        StatePropagator::propagateStates(states, controls, durations, results);
+        return;
+    }
+
+    std::vector<double> reals;
+    Eigen::MatrixXd stateValues(states.size(), stateDim);
+    Eigen::MatrixXd controlValues(states.size(), controlDim);
+    for (std::size_t i = 0; i < states.size(); ++i)
+    {
+        space->copyToReals(reals, states[i]);
+        stateValues.row(i) = Eigen::Map<const Eigen::RowVectorXd>(reals.data(), reals.size());
+        for (unsigned int j = 0; j < controlDim; ++j)
+            controlValues(i, j) = *controlSpace->getValueAddressAtIndex(const_cast<Control *>(controls[i]), j);
+    }
+
+    Eigen::MatrixXd resultValues(states.size(), stateDim);
+    propagateValues(stateValues, controlValues, Eigen::Map<const Eigen::VectorXd>(durations.data(), durations.size()),
+                    resultValues);
+
+    reals.resize(stateDim);
+    for (std::size_t i = 0; i < results.size(); ++i)
+    {
+        Eigen::Map<Eigen::RowVectorXd>(reals.data(), stateDim) = resultValues.row(i);
+        space->copyFromReals(results[i], reals);
+    }
+}
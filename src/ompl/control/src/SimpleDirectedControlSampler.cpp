@@ -36,13 +36,19 @@
 
 #include "ompl/control/SimpleDirectedControlSampler.h"
 #include "ompl/control/SpaceInformation.h"
+#include <algorithm>
 
 ompl::control::SimpleDirectedControlSampler::SimpleDirectedControlSampler(const SpaceInformation *si, unsigned int k)
   : DirectedControlSampler(si), cs_(si->allocControlSampler()), numControlSamples_(k)
 {
 }
 
-ompl::control::SimpleDirectedControlSampler::~SimpleDirectedControlSampler() = default;
+ompl::control::SimpleDirectedControlSampler::~SimpleDirectedControlSampler()
+{
+    for (auto &control : controls_)
+        si_->freeControl(control);
+    si_->freeStates(states_);
+}
 
 unsigned int ompl::control::SimpleDirectedControlSampler::sampleTo(Control *control, const base::State *source,
                                                                    base::State *dest)
@@ -59,52 +65,57 @@ unsigned int ompl::control::SimpleDirectedControlSampler::sampleTo(Control *cont
 unsigned int ompl::control::SimpleDirectedControlSampler::getBestControl(Control *control, const base::State *source,
                                                                          base::State *dest, const Control *previous)
 {
-    // Sample the first control
+    const unsigned int minDuration = si_->getMinControlDuration();
+    const unsigned int maxDuration = si_->getMaxControlDuration();
+    const unsigned int k = std::max(numControlSamples_, 1u);
+
+    // Reuse the controls and states of previous calls, allocating more if k has grown
+    while (controls_.size() + 1 < k)
+        controls_.push_back(si_->allocControl());
+    while (states_.size() < k)
+        states_.push_back(si_->allocState());
+
+    // Sample all controls; the first one is stored directly in the output argument
+    std::vector<const Control *> controls(k);
+    std::vector<int> steps(k);
+    controls[0] = control;
     if (previous != nullptr)
         cs_->sampleNext(control, previous, source);
     else
         cs_->sample(control, source);
+    steps[0] = cs_->sampleStepCount(minDuration, maxDuration);
+    for (unsigned int i = 1; i < k; ++i)
+    {
+        controls[i] = controls_[i - 1];
+        steps[i] = cs_->sampleStepCount(minDuration, maxDuration);
+        if (previous != nullptr)
+            cs_->sampleNext(controls_[i - 1], previous, source);
+        else
+            cs_->sample(controls_[i - 1], source);
+    }
 
-    const unsigned int minDuration = si_->getMinControlDuration();
-    const unsigned int maxDuration = si_->getMaxControlDuration();
-
-    unsigned int steps = cs_->sampleStepCount(minDuration, maxDuration);
-    // Propagate the first control, and find how far it is from the target state
-    base::State *bestState = si_->allocState();
-    steps = si_->propagateWhileValid(source, control, steps, bestState);
+    // Propagate all controls at once, and find the one that gets closest to the target state
+    std::vector<unsigned int> stepsTaken;
+    si_->propagateWhileValid(std::vector<const base::State *>(k, source), controls, steps, states_, stepsTaken);
 
-    if (numControlSamples_ > 1)
+    unsigned int best = 0;
+    if (k > 1)
     {
-        Control *tempControl = si_->allocControl();
-        base::State *tempState = si_->allocState();
-        double bestDistance = si_->distance(bestState, dest);
-
-        // Sample k-1 more controls, and save the control that gets closest to target
-        for (unsigned int i = 1; i < numControlSamples_; ++i)
+        double bestDistance = si_->distance(states_[0], dest);
+        for (unsigned int i = 1; i < k; ++i)
         {
-            unsigned int sampleSteps = cs_->sampleStepCount(minDuration, maxDuration);
-            if (previous != nullptr)
-                cs_->sampleNext(tempControl, previous, source);
-            else
-                cs_->sample(tempControl, source);
-
-            sampleSteps = si_->propagateWhileValid(source, tempControl, sampleSteps, tempState);
-            double tempDistance = si_->distance(tempState, dest);
+            double tempDistance = si_->distance(states_[i], dest);
             if (tempDistance < bestDistance)
             {
-                si_->copyState(bestState, tempState);
-                si_->copyControl(control, tempControl);
                 bestDistance = tempDistance;
-                steps = sampleSteps;
+                best = i;
             }
         }
-
-        si_->freeState(tempState);
-        si_->freeControl(tempControl);
+        if (best != 0)
+            si_->copyControl(control, controls[best]);
     }
 
-    si_->copyState(dest, bestState);
-    si_->freeState(bestState);
+    si_->copyState(dest, states_[best]);
 
-    return steps;
+    return stepsTaken[best];
 }
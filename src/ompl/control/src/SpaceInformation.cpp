@@ -222,6 +222,103 @@ unsigned int ompl::control::SpaceInformation::propagateWhileValid(const base::St
     return 0;
 }
 
+void ompl::control::SpaceInformation::propagateWhileValid(const std::vector<const base::State *> &states,
+                                                          const std::vector<const Control *> &controls,
+                                                          const std::vector<int> &steps,
+                                                          const std::vector<base::State *> &results,
+                                                          std::vector<unsigned int> &stepsTaken) const
+{
+    const std::size_t n = states.size();
+    stepsTaken.assign(n, 0);
+
+    // the propagations that have not reached an invalid state or their number of steps yet
+    std::vector<std::size_t> active;
+    active.reserve(n);
+    for (std::size_t i = 0; i < n; ++i)
+    {
+        if (steps[i] == 0)
+        {
+            if (results[i] != states[i])
+                copyState(results[i], states[i]);
+        }
+        else
+            active.push_back(i);
+    }
+    if (active.empty())
+        return;
+
+    // the last valid state of each propagation and the state it is propagated to
+    std::vector<base::State *> last(results);
+    std::vector<base::State *> next(n, nullptr);
+    std::vector<base::State *> toDelete;
+    toDelete.reserve(active.size());
+
+    std::vector<const base::State *> from;
+    std::vector<const Control *> ctrls;
+    std::vector<double> durations;
+    std::vector<base::State *> to;
+    std::vector<const base::State *> reached;
+    std::vector<bool> valid;
+
+    bool first = true;
+    while (!active.empty())
+    {
+        from.clear();
+        ctrls.clear();
+        durations.clear();
+        to.clear();
+        for (std::size_t i : active)
+        {
+            // perform the first step of propagation directly into the result
+            if (first)
+                from.push_back(states[i]);
+            else
+            {
+                if (next[i] == nullptr)
+                {
+                    next[i] = allocState();
+                    toDelete.push_back(next[i]);
+                }
+                from.push_back(last[i]);
+            }
+            ctrls.push_back(controls[i]);
+            durations.push_back(steps[i] > 0 ? stepSize_ : -stepSize_);
+            to.push_back(first ? results[i] : next[i]);
+        }
+        statePropagator_->propagateStates(from, ctrls, durations, to);
+
+        reached.assign(to.begin(), to.end());
+        areValid(reached, valid);
+
+        std::size_t remaining = 0;
+        for (std::size_t k = 0; k < active.size(); ++k)
+        {
+            std::size_t i = active[k];
+            if (valid[k])
+            {
+                if (!first)
+                    std::swap(last[i], next[i]);
+                if (++stepsTaken[i] < (unsigned int)abs(steps[i]))
+                    active[remaining++] = i;
+            }
+            // if the first propagation step produced an invalid step, the
+            // last valid state is the starting one (assumed to be valid)
+            else if (first && results[i] != states[i])
+                copyState(results[i], states[i]);
+        }
+        active.resize(remaining);
+        first = false;
+    }
+
+    // make sure the results contain the last valid states
+    for (std::size_t i = 0; i < n; ++i)
+        if (last[i] != results[i])
+            copyState(results[i], last[i]);
+
+    for (base::State *state : toDelete)
+        freeState(state);
+}
+
 void ompl::control::SpaceInformation::propagate(const base::State *state, const Control *control, int steps,
                                                 std::vector<base::State *> &result, bool alloc) const
 {
@@ -234,6 +234,12 @@ namespace ompl
             /// Set the event to be called after the run of a planner
             void setPostRunEvent(const PostSetupEvent &event);
 
+            /// Get the event to be called before the run of a planner
+            const PreSetupEvent &getPreRunEvent() const;
+
+            /// Get the event to be called after the run of a planner
+            const PostSetupEvent &getPostRunEvent() const;
+
             /** \brief Benchmark the added planners on the defined problem. Repeated calls clear previously gathered
                data.
                 \param req The parameters for the execution of the benchmark
@@ -265,6 +265,16 @@ void ompl::tools::Benchmark::setPostRunEvent(const PostSetupEvent &event)
     postRun_ = event;
 }
 
+const ompl::tools::Benchmark::PreSetupEvent &ompl::tools::Benchmark::getPreRunEvent() const
+{
+    return preRun_;
+}
+
+const ompl::tools::Benchmark::PostSetupEvent &ompl::tools::Benchmark::getPostRunEvent() const
+{
+    return postRun_;
+}
+
 const ompl::tools::Benchmark::Status &ompl::tools::Benchmark::getStatus() const
 {
     return status_;
@@ -0,0 +1,132 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#define BOOST_TEST_MODULE "OptimizationObjectives"
+#include <boost/test/unit_test.hpp>
+
+#include "ompl/base/objectives/BatchStateCostIntegralObjective.h"
+#include "ompl/base/ScopedState.h"
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/base/spaces/RealVectorStateSpace.h"
+
+using namespace ompl;
+
+namespace
+{
+    // the cost of a state is 1 + x
+    class XCostObjective : public base::StateCostIntegralObjective
+    {
+    public:
+        XCostObjective(const base::SpaceInformationPtr &si, bool interpolate)
+          : base::StateCostIntegralObjective(si, interpolate)
+        {
+        }
+
+        base::Cost stateCost(const base::State *state) const override
+        {
+            return base::Cost(1. + state->as<base::RealVectorStateSpace::StateType>()->values[0]);
+        }
+    };
+
+    class BatchXCostObjective : public base::BatchStateCostIntegralObjective
+    {
+    public:
+        BatchXCostObjective(const base::SpaceInformationPtr &si, bool interpolate)
+          : base::BatchStateCostIntegralObjective(si, interpolate)
+        {
+        }
+
+        void stateCostValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                             Eigen::Ref<Eigen::VectorXd> costs) const override
+        {
+            ++calls;
+            costs = states.col(0).array() + 1.;
+        }
+
+        mutable unsigned int calls{0};
+    };
+
+    base::SpaceInformationPtr createSpaceInformation()
+    {
+        auto space(std::make_shared<base::RealVectorStateSpace>(2));
+        space->setBounds(0., 1.);
+        auto si(std::make_shared<base::SpaceInformation>(space));
+        si->setStateValidityCheckingResolution(0.01);
+        si->setup();
+        return si;
+    }
+}
+
+BOOST_AUTO_TEST_CASE(BatchStateCost)
+{
+    auto si = createSpaceInformation();
+    BatchXCostObjective objective(si, false);
+    base::ScopedState<base::RealVectorStateSpace> s1(si), s2(si);
+    s1[0] = 0.2;
+    s1[1] = 0.3;
+    s2[0] = 0.7;
+    s2[1] = 0.3;
+    BOOST_CHECK_CLOSE(objective.stateCost(s1.get()).value(), 1.2, 1e-9);
+
+    std::vector<base::Cost> costs;
+    objective.stateCosts({s1.get(), s2.get()}, costs);
+    BOOST_REQUIRE_EQUAL(costs.size(), 2u);
+    BOOST_CHECK_CLOSE(costs[0].value(), 1.2, 1e-9);
+    BOOST_CHECK_CLOSE(costs[1].value(), 1.7, 1e-9);
+    BOOST_CHECK_EQUAL(objective.calls, 2u);
+}
+
+BOOST_AUTO_TEST_CASE(BatchMotionCost)
+{
+    auto si = createSpaceInformation();
+    base::ScopedState<base::RealVectorStateSpace> s1(si), s2(si);
+    for (bool interpolate : {false, true})
+    {
+        BatchXCostObjective objective(si, interpolate);
+        XCostObjective reference(si, interpolate);
+        for (unsigned int i = 0; i < 100; ++i)
+        {
+            s1.random();
+            s2.random();
+            unsigned int calls = objective.calls;
+            BOOST_CHECK_CLOSE(objective.motionCost(s1.get(), s2.get()).value(),
+                              reference.motionCost(s1.get(), s2.get()).value(), 1e-9);
+            BOOST_CHECK_EQUAL(objective.calls, calls + 1);
+            BOOST_CHECK_CLOSE(objective.motionCostBestEstimate(s1.get(), s2.get()).value(),
+                              reference.motionCostBestEstimate(s1.get(), s2.get()).value(), 1e-9);
+            BOOST_CHECK_EQUAL(objective.calls, calls + 2);
+        }
+    }
+}
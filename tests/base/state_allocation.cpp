@@ -0,0 +1,133 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+
+#define BOOST_TEST_MODULE "StateAllocation"
+#include <boost/test/unit_test.hpp>
+
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/base/StateArena.h"
+#include "ompl/base/spaces/RealVectorStateSpace.h"
+#include "ompl/base/spaces/SE2StateSpace.h"
+
+#include <set>
+
+using namespace ompl;
+
+BOOST_AUTO_TEST_CASE(StatePool)
+{
+    auto space(std::make_shared<base::SE2StateSpace>());
+    base::SpaceInformation si(space);
+    BOOST_CHECK_EQUAL(si.getStatePoolCapacity(), 0u);
+
+    // only two of the three freed states are kept in the pool
+    si.setStatePoolCapacity(2);
+    std::vector<base::State *> states(3);
+    si.allocStates(states);
+    std::set<base::State *> allocated(states.begin(), states.end());
+    si.freeStates(states);
+
+    // the two pooled states are reused
+    base::State *s1 = si.allocState();
+    base::State *s2 = si.cloneState(s1);
+    BOOST_CHECK(s1 != s2);
+    BOOST_CHECK(allocated.count(s1) == 1);
+    BOOST_CHECK(allocated.count(s2) == 1);
+    si.freeState(s1);
+    si.freeState(s2);
+
+    // reducing the capacity releases pooled states
+    si.setStatePoolCapacity(0);
+    base::State *s3 = si.allocState();
+    si.freeState(s3);
+}
+
+BOOST_AUTO_TEST_CASE(RealVectorStateArena)
+{
+    auto space(std::make_shared<base::RealVectorStateSpace>(3));
+    space->setBounds(-1., 1.);
+    base::StateArena arena(space, 10);
+    BOOST_CHECK_EQUAL(arena.size(), 10u);
+    BOOST_CHECK_EQUAL(arena.numFreeStates(), 10u);
+
+    // the values of all states are stored in one matrix
+    double *values = arena.getValues();
+    BOOST_REQUIRE(values != nullptr);
+    for (std::size_t i = 0; i < arena.size(); ++i)
+    {
+        auto *state = arena.getState(i)->as<base::RealVectorStateSpace::StateType>();
+        BOOST_CHECK_EQUAL(state->values, values + 3 * i);
+        BOOST_CHECK_EQUAL(arena.getIndex(state), i);
+    }
+
+    base::State *state = space->allocState();
+    BOOST_CHECK_EQUAL(arena.getIndex(state), arena.size());
+    BOOST_CHECK_THROW(arena.freeState(state), Exception);
+    space->freeState(state);
+
+    // states are handed out until the arena is exhausted and can be recycled
+    std::vector<base::State *> states;
+    while (base::State *s = arena.allocState())
+        states.push_back(s);
+    BOOST_CHECK_EQUAL(states.size(), 10u);
+    BOOST_CHECK_EQUAL(states[0], arena.getState(0));
+    BOOST_CHECK_EQUAL(arena.numFreeStates(), 0u);
+    arena.freeState(states[3]);
+    BOOST_CHECK_THROW(arena.freeState(states[3]), Exception);
+    BOOST_CHECK_EQUAL(arena.allocState(), states[3]);
+}
+
+BOOST_AUTO_TEST_CASE(CompoundStateArena)
+{
+    auto space(std::make_shared<base::SE2StateSpace>());
+    base::RealVectorBounds bounds(2);
+    bounds.setLow(-1.);
+    bounds.setHigh(1.);
+    space->setBounds(bounds);
+    space->setup();
+    base::StateArena arena(space, 5);
+    BOOST_CHECK(arena.getValues() == nullptr);
+
+    auto sampler = space->allocStateSampler();
+    for (std::size_t i = 0; i < arena.size(); ++i)
+    {
+        base::State *state = arena.allocState();
+        BOOST_CHECK_EQUAL(arena.getIndex(state), i);
+        sampler->sampleUniform(state);
+        BOOST_CHECK(space->satisfiesBounds(state));
+    }
+    BOOST_CHECK(arena.allocState() == nullptr);
+    arena.freeState(arena.getState(2));
+    BOOST_CHECK_EQUAL(arena.allocState(), arena.getState(2));
+}
@@ -40,6 +40,7 @@
 
 #include "ompl/base/ScopedState.h"
 #include "ompl/base/SpaceInformation.h"
+#include "ompl/base/BatchProjectionEvaluator.h"
 
 #include "ompl/base/spaces/TimeStateSpace.h"
 #include "ompl/base/spaces/RealVectorStateSpace.h"
@@ -184,6 +185,85 @@ BOOST_AUTO_TEST_CASE(SO2_Projection)
     BOOST_CHECK_EQUAL(p[0], s->value);
 }
 
+namespace
+{
+    /* project SE(2) states onto their position, counting the number of batches */
+    class BatchPositionProjection : public base::BatchProjectionEvaluator
+    {
+    public:
+        BatchPositionProjection(const base::StateSpacePtr &space) : base::BatchProjectionEvaluator(space)
+        {
+        }
+
+        unsigned int getDimension() const override
+        {
+            return 2;
+        }
+
+        void defaultCellSizes() override
+        {
+            cellSizes_ = {0.5, 0.25};
+        }
+
+        void projectValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                           Eigen::Ref<Eigen::MatrixXd> projections) const override
+        {
+            ++batches;
+            projections = states.leftCols(2);
+        }
+
+        mutable unsigned int batches{0};
+    };
+}
+
+BOOST_AUTO_TEST_CASE(Batch_Projection)
+{
+    auto m(std::make_shared<base::SE2StateSpace>());
+    base::RealVectorBounds bounds(2);
+    bounds.setLow(-2);
+    bounds.setHigh(2);
+    m->setBounds(bounds);
+    m->setup();
+
+    BatchPositionProjection proj(m);
+    proj.setup();
+    base::ProjectionEvaluatorPtr def = m->getDefaultProjection();
+
+    std::vector<base::ScopedState<base::SE2StateSpace>> states(10, base::ScopedState<base::SE2StateSpace>(m));
+    std::vector<const base::State *> ptrs;
+    for (auto &s : states)
+    {
+        s.random();
+        ptrs.push_back(s.get());
+    }
+
+    Eigen::MatrixXd projections(ptrs.size(), 2);
+    proj.projectStates(ptrs, projections);
+    BOOST_CHECK_EQUAL(proj.batches, 1u);
+    std::vector<Eigen::VectorXi> coords;
+    proj.computeCoordinates(ptrs, coords);
+    BOOST_CHECK_EQUAL(proj.batches, 2u);
+    BOOST_CHECK_EQUAL(coords.size(), ptrs.size());
+
+    // the default implementation projects one state at a time
+    Eigen::MatrixXd defProjections(ptrs.size(), def->getDimension());
+    def->projectStates(ptrs, defProjections);
+
+    Eigen::VectorXd p(2);
+    Eigen::VectorXi c(2);
+    for (std::size_t i = 0; i < ptrs.size(); ++i)
+    {
+        BOOST_CHECK_EQUAL(projections(i, 0), states[i]->getX());
+        BOOST_CHECK_EQUAL(projections(i, 1), states[i]->getY());
+        proj.project(ptrs[i], p);
+        BOOST_CHECK(p == projections.row(i).transpose());
+        proj.computeCoordinates(ptrs[i], c);
+        BOOST_CHECK(c == coords[i]);
+        def->project(ptrs[i], p);
+        BOOST_CHECK(p == defProjections.row(i).transpose());
+    }
+}
+
 BOOST_AUTO_TEST_CASE(SO2_Sampler)
 {
     auto m(std::make_shared<base::SO2StateSpace>());
@@ -0,0 +1,395 @@
+/*********************************************************************
+ * Software License Agreement (BSD License)
+ *
+ *  Copyright (c) 2026, Rice University
+ *  All rights reserved.
+ *
+ *  Redistribution and use in source and binary forms, with or without
+ *  modification, are permitted provided that the following conditions
+ *  are met:
+ *
+ *   * Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *   * Redistributions in binary form must reproduce the above
+ *     copyright notice, this list of conditions and the following
+ *     disclaimer in the documentation and/or other materials provided
+ *     with the distribution.
+ *   * Neither the name of the Rice University nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ *  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ *  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ *  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+ *  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+ *  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+ *  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+ *  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+ *  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ *  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+ *  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+ *  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ *  POSSIBILITY OF SUCH DAMAGE.
+ *********************************************************************/
+
+#define BOOST_TEST_MODULE "StateValidityChecker"
+#include <boost/test/unit_test.hpp>
+
+#include "ompl/base/BatchStateValidityChecker.h"
+#include "ompl/base/CachedStateValidityChecker.h"
+#include "ompl/base/DiscreteMotionValidator.h"
+#include "ompl/base/OccupancyGridMotionValidator.h"
+#include "ompl/base/ScopedState.h"
+#include "ompl/base/SpaceInformation.h"
+#include "ompl/base/samplers/UniformValidStateSampler.h"
+#include "ompl/base/spaces/RealVectorStateSpace.h"
+#include "ompl/base/spaces/SE2StateSpace.h"
+#include "ompl/util/RandomNumbers.h"
+
+#include <atomic>
+#include <cmath>
+#include <thread>
+
+using namespace ompl;
+
+namespace
+{
+    // all states with x < 0.5 are valid
+    bool isLeft(const base::State *state)
+    {
+        return state->as<base::RealVectorStateSpace::StateType>()->values[0] < 0.5;
+    }
+
+    class LeftValidityChecker : public base::BatchStateValidityChecker
+    {
+    public:
+        LeftValidityChecker(const base::SpaceInformationPtr &si) : base::BatchStateValidityChecker(si)
+        {
+        }
+
+        void validity(const Eigen::Ref<const Eigen::MatrixXd> &states, Eigen::Ref<Eigen::VectorXd> valid) const override
+        {
+            ++calls;
+            checked += states.rows();
+            for (Eigen::Index i = 0; i < states.rows(); ++i)
+                valid[i] = states(i, 0) < threshold ? 1. : 0.;
+        }
+
+        double threshold{0.5};
+        mutable unsigned int calls{0};
+        mutable unsigned int checked{0};
+    };
+
+    base::SpaceInformationPtr createSpaceInformation()
+    {
+        auto space(std::make_shared<base::RealVectorStateSpace>(2));
+        space->setBounds(0., 1.);
+        return std::make_shared<base::SpaceInformation>(space);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(BatchValidity)
+{
+    auto si = createSpaceInformation();
+    auto checker = std::make_shared<LeftValidityChecker>(si);
+    si->setStateValidityChecker(checker);
+    si->setup();
+    BOOST_CHECK(checker->getSpecs().hasBatchValidityComputation);
+
+    base::ScopedState<base::RealVectorStateSpace> s1(si), s2(si);
+    s1[0] = 0.2;
+    s1[1] = 0.3;
+    s2[0] = 0.7;
+    s2[1] = 0.3;
+    BOOST_CHECK(si->isValid(s1.get()));
+    BOOST_CHECK(!si->isValid(s2.get()));
+
+    std::vector<bool> valid;
+    BOOST_CHECK(!si->areValid({s1.get(), s2.get()}, valid));
+    BOOST_REQUIRE_EQUAL(valid.size(), 2u);
+    BOOST_CHECK(valid[0]);
+    BOOST_CHECK(!valid[1]);
+}
+
+BOOST_AUTO_TEST_CASE(BatchMotionValidation)
+{
+    auto si = createSpaceInformation();
+    auto checker = std::make_shared<LeftValidityChecker>(si);
+    si->setStateValidityChecker(checker);
+    si->setStateValidityCheckingResolution(0.01);
+    si->setup();
+
+    auto reference = createSpaceInformation();
+    reference->setStateValidityChecker(isLeft);
+    reference->setStateValidityCheckingResolution(0.01);
+    reference->setup();
+
+    base::ScopedState<base::RealVectorStateSpace> s1(si), s2(si), last1(si), last2(si);
+    for (unsigned int i = 0; i < 100; ++i)
+    {
+        s1.random();
+        s1[0] *= 0.5;
+        s2.random();
+        std::pair<base::State *, double> lastValid1(last1.get(), 0.), lastValid2(last2.get(), 0.);
+
+        unsigned int calls = checker->calls;
+        bool result = si->checkMotion(s1.get(), s2.get());
+        BOOST_CHECK_EQUAL(checker->calls, calls + 1);
+        BOOST_CHECK_EQUAL(result, reference->checkMotion(s1.get(), s2.get()));
+
+        result = si->getMotionValidator()->checkMotion(s1.get(), s2.get(), lastValid1);
+        BOOST_CHECK_EQUAL(result, reference->getMotionValidator()->checkMotion(s1.get(), s2.get(), lastValid2));
+        if (!result)
+        {
+            BOOST_CHECK_CLOSE(lastValid1.second, lastValid2.second, 1e-9);
+            BOOST_CHECK(si->equalStates(last1.get(), last2.get()));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(BatchValidStateSampling)
+{
+    auto si = createSpaceInformation();
+    auto checker = std::make_shared<LeftValidityChecker>(si);
+    si->setStateValidityChecker(checker);
+    si->setup();
+
+    base::UniformValidStateSampler sampler(si.get());
+    base::ScopedState<base::RealVectorStateSpace> state(si);
+    for (unsigned int i = 0; i < 100; ++i)
+    {
+        unsigned int calls = checker->calls, checked = checker->checked;
+        BOOST_CHECK(sampler.sample(state.get()));
+        BOOST_CHECK(isLeft(state.get()));
+        // states are checked in chunks, and sampling stops after the first
+        // chunk with a valid state
+        BOOST_CHECK_GE(checker->calls, calls + 1);
+        BOOST_CHECK_EQUAL(checker->checked - checked, (checker->calls - calls) * 8);
+    }
+
+    // no valid states: all attempts are used up
+    checker->threshold = -1.;
+    sampler.setNrAttempts(20);
+    unsigned int calls = checker->calls, checked = checker->checked;
+    BOOST_CHECK(!sampler.sample(state.get()));
+    BOOST_CHECK_EQUAL(checker->calls, calls + 3);
+    BOOST_CHECK_EQUAL(checker->checked, checked + 20);
+}
+
+namespace
+{
+    // a 20 x 10 grid with a wall at x = 12 from y = 0 to y = 7, and an
+    // occupied cell at (3, 8)
+    std::vector<unsigned char> createOccupancyGrid()
+    {
+        std::vector<unsigned char> occupancy(200, 0);
+        for (unsigned int y = 0; y < 8; ++y)
+            occupancy[12 + 20 * y] = 1;
+        occupancy[3 + 20 * 8] = 1;
+        return occupancy;
+    }
+}
+
+BOOST_AUTO_TEST_CASE(OccupancyGridValidity)
+{
+    auto space(std::make_shared<base::SE2StateSpace>());
+    base::RealVectorBounds bounds(2);
+    bounds.setLow(-1.);
+    bounds.setHigh(6.);
+    space->setBounds(bounds);
+    auto si(std::make_shared<base::SpaceInformation>(space));
+    // cells of size 0.5, starting at (-1, 0)
+    auto checker(std::make_shared<base::OccupancyGridValidityChecker>(
+        si, std::vector<unsigned int>{20, 10}, createOccupancyGrid(), 0.5, std::vector<double>{-1., 0.}));
+    si->setStateValidityChecker(checker);
+    si->setup();
+    BOOST_CHECK_EQUAL(checker->getDimension(), 2u);
+    BOOST_CHECK(checker->isOccupied(12, 3));
+    BOOST_CHECK(checker->isOccupied(-1, 3));
+    BOOST_CHECK(!checker->isOccupied(11, 3));
+
+    base::ScopedState<base::SE2StateSpace> state(space);
+    state->setXY(5.1, 1.);  // cell (12, 2)
+    BOOST_CHECK(!si->isValid(state.get()));
+    state->setXY(4.9, 1.);  // cell (11, 2)
+    BOOST_CHECK(si->isValid(state.get()));
+    state->setXY(-1.1, 1.);  // outside the grid
+    BOOST_CHECK(!si->isValid(state.get()));
+    BOOST_CHECK_EQUAL(checker->clearance(state.get()), 0.);
+
+    // compare the clearance with the distance to the nearest occupied cell center
+    RNG rng;
+    for (unsigned int i = 0; i < 100; ++i)
+    {
+        state->setXY(rng.uniformReal(-1., 9.), rng.uniformReal(0., 5.));
+        double clearance;
+        if (!checker->isValid(state.get(), clearance))
+            continue;
+        double cx = std::floor((state->getX() + 1.) / 0.5), cy = std::floor(state->getY() / 0.5);
+        double expected = std::min({state->getX() + 1., 9. - state->getX(), state->getY(), 5. - state->getY()});
+        for (int y = 0; y < 10; ++y)
+            for (int x = 0; x < 20; ++x)
+                if (checker->isOccupied(x, y))
+                    expected = std::min(expected, (std::hypot(x - cx, y - cy) - 0.5) * 0.5);
+        BOOST_CHECK_CLOSE(clearance, expected, 1e-4);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(OccupancyGridMotionValidation)
+{
+    auto space(std::make_shared<base::RealVectorStateSpace>(3));
+    space->setBounds(0., 4.);
+    auto si(std::make_shared<base::SpaceInformation>(space));
+    // a 4 x 4 x 4 grid with an occupied cell in the middle
+    std::vector<unsigned char> occupancy(64, 0);
+    occupancy[1 + 4 * (2 + 4 * 1)] = 1;
+    auto checker(std::make_shared<base::OccupancyGridValidityChecker>(si, std::vector<unsigned int>{4, 4, 4},
+                                                                      occupancy));
+    si->setStateValidityChecker(checker);
+    si->setStateValidityCheckingResolution(0.001);
+    si->setup();
+    auto discrete(std::make_shared<base::DiscreteMotionValidator>(si));
+    auto grid(std::make_shared<base::OccupancyGridMotionValidator>(si));
+
+    // the results agree with dense sampling along the motion, except that
+    // sampling can miss the corners of occupied cells
+    RNG rng;
+    base::ScopedState<> s1(space), s2(space), last(space);
+    unsigned int numInvalid = 0;
+    for (unsigned int i = 0; i < 200; ++i)
+    {
+        for (unsigned int j = 0; j < 3; ++j)
+        {
+            s1[j] = rng.uniformReal(0., 4.);
+            s2[j] = rng.uniformReal(0., 4.);
+        }
+        if (!si->isValid(s1.get()))
+            continue;
+        bool valid = grid->checkMotion(s1.get(), s2.get());
+        if (valid)
+        {
+            BOOST_CHECK(discrete->checkMotion(s1.get(), s2.get()));
+            continue;
+        }
+        ++numInvalid;
+        std::pair<base::State *, double> lastValid(last.get(), 0.);
+        BOOST_CHECK(!grid->checkMotion(s1.get(), s2.get(), lastValid));
+        BOOST_CHECK(si->isValid(last.get()));
+        std::pair<base::State *, double> lastValidDiscrete(nullptr, 0.);
+        if (!discrete->checkMotion(s1.get(), s2.get(), lastValidDiscrete))
+            BOOST_CHECK_SMALL(lastValid.second - lastValidDiscrete.second,
+                              2. / space->validSegmentCount(s1.get(), s2.get()));
+    }
+    BOOST_CHECK(numInvalid > 0);
+
+    // the motion validator requires an occupancy grid validity checker
+    auto other(std::make_shared<base::SpaceInformation>(space));
+    other->setStateValidityChecker([](const base::State *) { return true; });
+    BOOST_CHECK_THROW(base::OccupancyGridMotionValidator validator(other), Exception);
+}
+
+namespace
+{
+    // counts the states it checks; all states with x < 0.5 are valid
+    class CountingValidityChecker : public base::StateValidityChecker
+    {
+    public:
+        CountingValidityChecker(const base::SpaceInformationPtr &si) : base::StateValidityChecker(si)
+        {
+        }
+
+        bool isValid(const base::State *state) const override
+        {
+            ++calls;
+            return isLeft(state);
+        }
+
+        mutable std::atomic<unsigned int> calls{0};
+    };
+}
+
+BOOST_AUTO_TEST_CASE(CachedValidity)
+{
+    auto si(createSpaceInformation());
+    auto counting(std::make_shared<CountingValidityChecker>(si));
+    auto cached(std::make_shared<base::CachedStateValidityChecker>(si, counting));
+    si->setStateValidityChecker(cached);
+    si->setup();
+
+    base::ScopedState<> state(si);
+    state[0] = 0.25;
+    state[1] = 0.5;
+    BOOST_CHECK(si->isValid(state.get()));
+    BOOST_CHECK(si->isValid(state.get()));
+    state[0] = 0.75;
+    BOOST_CHECK(!si->isValid(state.get()));
+    BOOST_CHECK(!si->isValid(state.get()));
+    BOOST_CHECK_EQUAL(counting->calls, 2u);
+    BOOST_CHECK_EQUAL(cached->getHitCount(), 2u);
+    BOOST_CHECK_EQUAL(cached->getMissCount(), 2u);
+    BOOST_CHECK_CLOSE(cached->getHitRate(), 0.5, 1e-9);
+    BOOST_CHECK_EQUAL(cached->size(), 2u);
+
+    // nearby states share a result if a resolution is set
+    cached->setResolution(0.01);
+    BOOST_CHECK_EQUAL(cached->size(), 0u);
+    BOOST_CHECK(!si->isValid(state.get()));
+    state[0] = 0.751;
+    BOOST_CHECK(!si->isValid(state.get()));
+    BOOST_CHECK_EQUAL(counting->calls, 3u);
+
+    // batches only pass the unknown states to the wrapped checker
+    base::ScopedState<> other(si);
+    other[0] = 0.1;
+    other[1] = 0.1;
+    std::vector<bool> valid;
+    BOOST_CHECK(!cached->areValid({state.get(), other.get()}, valid));
+    BOOST_CHECK(!valid[0]);
+    BOOST_CHECK(valid[1]);
+    BOOST_CHECK_EQUAL(counting->calls, 4u);
+
+    // the number of stored results is bounded
+    cached->setResolution(0.);
+    cached->setCapacity(64);
+    RNG rng;
+    for (unsigned int i = 0; i < 1000; ++i)
+    {
+        state[0] = rng.uniformReal(0., 1.);
+        state[1] = rng.uniformReal(0., 1.);
+        BOOST_CHECK_EQUAL(si->isValid(state.get()), state[0] < 0.5);
+    }
+    BOOST_CHECK(cached->size() <= 64u);
+    BOOST_CHECK(cached->size() >= 48u);
+}
+
+BOOST_AUTO_TEST_CASE(CachedValidityThreads)
+{
+    auto si(createSpaceInformation());
+    auto counting(std::make_shared<CountingValidityChecker>(si));
+    auto cached(std::make_shared<base::CachedStateValidityChecker>(si, counting, 500));
+    cached->setResolution(0.01);
+    si->setStateValidityChecker(cached);
+    si->setup();
+
+    // 4 threads check states on a 50 x 50 grid, so most checks are cache hits
+    std::atomic<unsigned int> errors{0};
+    std::vector<std::thread> threads;
+    for (unsigned int t = 0; t < 4; ++t)
+        threads.emplace_back([&si, &errors] {
+            RNG rng;
+            base::ScopedState<> state(si);
+            for (unsigned int i = 0; i < 20000; ++i)
+            {
+                state[0] = rng.uniformInt(0, 49) * 0.02;
+                state[1] = rng.uniformInt(0, 49) * 0.02;
+                if (si->isValid(state.get()) != (state[0] < 0.5))
+                    ++errors;
+            }
+        });
+    for (auto &thread : threads)
+        thread.join();
+    BOOST_CHECK_EQUAL(errors, 0u);
+    BOOST_CHECK_EQUAL(cached->getHitCount() + cached->getMissCount(), 80000u);
+    BOOST_CHECK(cached->getHitRate() > 0.1);
+    BOOST_CHECK(cached->size() <= 500u + 15u);
+}
@@ -37,6 +37,8 @@
 # Author: Mark Moll
 
 import unittest
+import ctypes
+import pickle
 from math import pi
 import sys
 from os.path import abspath, dirname, join
@@ -91,11 +93,196 @@ class TestSO3(unittest.TestCase):
             self.assertAlmostEqual(nrm, 1.0, 15)
             si.freeState(state)
 
+@unittest.skipUnless(hasattr(State, 'asarray'), 'requires Boost.Python NumPy support')
+class TestStateAsArray(unittest.TestCase):
+    def testRealVector(self):
+        m = RealVectorStateSpace(3)
+        s = RealVectorState(m)
+        values = s.asarray()
+        values[:] = [1., 2., 3.]
+        self.assertEqual([s[0], s[1], s[2]], [1., 2., 3.])
+        values = s().asarray(3)
+        values[1] = 5.
+        self.assertEqual(s[1], 5.)
+
+    def testSE2(self):
+        m = SE2StateSpace()
+        s = SE2State(m)
+        s().setX(1.)
+        s().setY(2.)
+        s().setYaw(.5)
+        values = s.asarray()
+        self.assertEqual(list(values), [1., 2., .5])
+        # a copy is returned for non-RealVector spaces
+        values[0] = 3.
+        self.assertEqual(s().getX(), 1.)
+
+class TestCFunctionStateValidityChecker(unittest.TestCase):
+    def testSE2(self):
+        CStateValidityFn = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_double), ctypes.c_uint)
+        dims = []
+        def isValidC(state, dim):
+            dims.append(dim)
+            return int(state[0] < .5)
+        fn = CStateValidityFn(isValidC)
+        m = SE2StateSpace()
+        si = SpaceInformation(m)
+        si.setStateValidityChecker(fn)
+        si.setup()
+        s = SE2State(m)
+        s().setX(0.)
+        self.assertTrue(si.isValid(s()))
+        s().setX(1.)
+        self.assertFalse(si.isValid(s()))
+        self.assertEqual(dims, [3, 3])
+
+class TestPickle(unittest.TestCase):
+    def testRealVector(self):
+        m = RealVectorStateSpace(3)
+        m.setBounds(-1., 2.)
+        m.setDimensionName(1, 'y')
+        s = RealVectorState(m)
+        s[0], s[1], s[2] = 1., 2., 3.
+        s2 = pickle.loads(pickle.dumps(s))
+        self.assertEqual(type(s2), RealVectorState)
+        self.assertEqual([s2[0], s2[1], s2[2]], [1., 2., 3.])
+        m2 = s2.getSpace()
+        self.assertEqual(m2.getName(), m.getName())
+        self.assertEqual(m2.getDimensionName(1), 'y')
+        self.assertEqual(list(m2.getBounds().low), [-1.] * 3)
+        self.assertEqual(list(m2.getBounds().high), [2.] * 3)
+
+    def testCompound(self):
+        m = CompoundStateSpace()
+        m.addSubspace(SO2StateSpace(), .5)
+        m.addSubspace(TimeStateSpace(), 2.)
+        m.getSubspace(1).setBounds(0., 10.)
+        s = State(m)
+        s.random()
+        s2 = pickle.loads(pickle.dumps(s))
+        m2 = s2.getSpace()
+        self.assertEqual(m2.getSubspaceCount(), 2)
+        self.assertEqual(m2.getSubspaceWeight(1), 2.)
+        self.assertEqual(m2.getSubspace(1).getMaxTimeBound(), 10.)
+        self.assertEqual(s2.serialize(), s.serialize())
+
+    def testUnsupportedSpace(self):
+        class MySpace(RealVectorStateSpace):
+            pass
+        s = State(MySpace(2))
+        self.assertRaises(pickle.PicklingError, pickle.dumps, s)
+
+class TestStateArena(unittest.TestCase):
+    def testRealVector(self):
+        m = RealVectorStateSpace(3)
+        si = SpaceInformation(m)
+        states = si.allocStates(4)
+        self.assertEqual(len(states), 4)
+        states[2][1] = 5.
+        self.assertEqual(states[-2][1], 5.)
+        self.assertRaises(IndexError, lambda: states[4])
+        self.assertEqual(len(list(states)), 4)
+        if hasattr(states, 'asarray'):
+            values = states.asarray()
+            self.assertEqual(values.shape, (4, 3))
+            self.assertEqual(values[2, 1], 5.)
+            values[3, 0] = 1.
+            self.assertEqual(states[3][0], 1.)
+        # states can be recycled
+        allocated = [states.allocState() for _ in range(4)]
+        self.assertIsNone(states.allocState())
+        self.assertEqual(states.numFreeStates(), 0)
+        states.freeState(allocated[1])
+        self.assertEqual(states.getIndex(states.allocState()), 1)
+
+    def testSE2(self):
+        m = SE2StateSpace()
+        si = SpaceInformation(m)
+        states = si.allocStates(2)
+        states[1].setX(1.)
+        self.assertEqual(states[1].getX(), 1.)
+        if hasattr(states, 'asarray'):
+            self.assertEqual(states.asarray()[1, 0], 1.)
+
+    def testStatePool(self):
+        si = SpaceInformation(RealVectorStateSpace(3))
+        si.setStatePoolCapacity(10)
+        self.assertEqual(si.getStatePoolCapacity(), 10)
+        s = si.allocState()
+        si.freeState(s)
+        si.setStatePoolCapacity(0)
+
+class TestOccupancyGrid(unittest.TestCase):
+    def testArray(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('requires NumPy')
+        space = SE2StateSpace()
+        bounds = RealVectorBounds(2)
+        bounds.setLow(0.)
+        bounds.setHigh(4.)
+        space.setBounds(bounds)
+        si = SpaceInformation(space)
+        # a wall at x = 2, indexed as [y, x]
+        grid = np.zeros((8, 8), dtype=bool)
+        grid[:6, 4] = True
+        checker = OccupancyGridValidityChecker(si, grid, resolution=.5)
+        si.setStateValidityChecker(checker)
+        si.setMotionValidator(OccupancyGridMotionValidator(si))
+        si.setup()
+        s1 = SE2State(space)
+        s2 = SE2State(space)
+        s1().setXY(1., 1.)
+        s2().setXY(3., 1.)
+        self.assertTrue(si.isValid(s1()))
+        self.assertAlmostEqual(checker.clearance(s1()), .75)
+        self.assertFalse(si.checkMotion(s1(), s2()))
+        s2().setXY(1., 3.5)
+        self.assertTrue(si.checkMotion(s1(), s2()))
+        s1().setXY(3., 3.5)
+        self.assertTrue(si.checkMotion(s1(), s2()))
+        s1().setXY(2.2, 1.)
+        self.assertFalse(si.isValid(s1()))
+
+class TestCachedStateValidityChecker(unittest.TestCase):
+    def testCache(self):
+        calls = []
+        def isLeft(state):
+            calls.append(state[0])
+            return state[0] < .5
+        m = RealVectorStateSpace(2)
+        m.setBounds(0., 1.)
+        si = SpaceInformation(m)
+        si.setStateValidityChecker(StateValidityCheckerFn(isLeft))
+        checker = CachedStateValidityChecker(si, si.getStateValidityChecker(), 1000)
+        checker.setResolution(.01)
+        si.setStateValidityChecker(checker)
+        si.setup()
+        s = RealVectorState(m)
+        s[0], s[1] = .25, .5
+        self.assertTrue(si.isValid(s()))
+        s[0] = .251
+        self.assertTrue(si.isValid(s()))
+        s[0] = .75
+        self.assertFalse(si.isValid(s()))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(checker.getHitCount(), 1)
+        self.assertAlmostEqual(checker.getHitRate(), 1. / 3.)
+        checker.clear()
+        self.assertEqual(checker.size(), 0)
+
 
 def suite():
     suites = (
         unittest.makeSuite(TestSO2),
-        unittest.makeSuite(TestSO3))
+        unittest.makeSuite(TestSO3),
+        unittest.makeSuite(TestStateAsArray),
+        unittest.makeSuite(TestCFunctionStateValidityChecker),
+        unittest.makeSuite(TestPickle),
+        unittest.makeSuite(TestStateArena),
+        unittest.makeSuite(TestOccupancyGrid),
+        unittest.makeSuite(TestCachedStateValidityChecker))
     return unittest.TestSuite(suites)
 
 if __name__ == '__main__':
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+######################################################################
+# Software License Agreement (BSD License)
+#
+#  Copyright (c) 2026, Rice University
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions
+#  are met:
+#
+#   * Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above
+#     copyright notice, this list of conditions and the following
+#     disclaimer in the documentation and/or other materials provided
+#     with the distribution.
+#   * Neither the name of the Rice University nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#  "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#  LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+#  FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+#  COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+#  INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+#  BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+#  LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+#  ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+######################################################################
+
+"""Measure the start-up cost of the OMPL Python bindings.
+
+For every submodule, a fresh interpreter is started that imports the module
+and then accesses one of its attributes, which loads the extension module (and
+those of its dependencies). The median times over several runs are reported
+and can optionally be appended as a JSON record to a file, so that regressions
+in import time can be tracked over time."""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from os.path import abspath, dirname, join
+from statistics import median
+
+# submodule -> attribute whose access loads the extension module
+SUBMODULES = [
+    ('ompl.util', 'RNG'),
+    ('ompl.base', 'RealVectorStateSpace'),
+    ('ompl.geometric', 'RRT'),
+    ('ompl.control', 'KPIECE1'),
+    ('ompl.tools', 'Benchmark')
+]
+
+MEASURE = """
+import sys
+from time import perf_counter
+sys.path = {path!r}
+start = perf_counter()
+import {module}
+imported = perf_counter()
+{module}.{attribute}
+loaded = perf_counter()
+print(imported - start, loaded - start)
+"""
+
+def measure(module, attribute, path):
+    """Return the time to import module and the time until attribute is
+    accessible in a fresh interpreter, and the wall time of the process."""
+    start = time.perf_counter()
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE.format(path=path, module=module, attribute=attribute)],
+        universal_newlines=True)
+    total = time.perf_counter() - start
+    imported, loaded = [float(t) for t in output.split()]
+    return imported, loaded, total
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--runs', type=int, default=10,
+                        help='number of interpreters started per submodule (default: 10)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='append the results as a JSON record to this file')
+    parser.add_argument('modules', nargs='*',
+                        help='submodules to measure (default: all)')
+    args = parser.parse_args()
+
+    path = [join(dirname(dirname(dirname(abspath(__file__)))), 'py-bindings')] + sys.path
+    results = {}
+    print('%-16s %12s %12s %12s' % ('module', 'import (ms)', 'load (ms)', 'process (ms)'))
+    for module, attribute in SUBMODULES:
+        if args.modules and module not in args.modules and module[5:] not in args.modules:
+            continue
+        times = [measure(module, attribute, path) for _ in range(args.runs)]
+        results[module] = {key: 1000. * median(t[i] for t in times)
+                           for i, key in enumerate(('import', 'load', 'process'))}
+        print('%-16s %12.1f %12.1f %12.1f' % (module, results[module]['import'],
+                                              results[module]['load'],
+                                              results[module]['process']))
+    if args.output:
+        with open(args.output, 'a') as f:
+            json.dump({'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'python': sys.version.split()[0],
+                       'runs': args.runs,
+                       'results': results}, f)
+            f.write('\n')
+
+if __name__ == '__main__':
+    main()
@@ -39,9 +39,13 @@
 #include <boost/filesystem.hpp>
 #include <iostream>
 
+#include "ompl/base/BatchProjectionEvaluator.h"
 #include "ompl/base/goals/GoalState.h"
 #include "ompl/base/spaces/RealVectorStateSpace.h"
+#include "ompl/control/spaces/DiscreteControlSpace.h"
 #include "ompl/control/spaces/RealVectorControlSpace.h"
+#include "ompl/control/BatchStatePropagator.h"
+#include "ompl/control/SimpleDirectedControlSampler.h"
 #include "ompl/control/planners/rrt/RRT.h"
 #include "ompl/control/planners/kpiece/KPIECE1.h"
 #include "ompl/control/planners/est/EST.h"
@@ -138,6 +142,63 @@ public:
     }
 };
 
+/** The same model as myStatePropagator, but all states of a batch are propagated at once */
+class myBatchStatePropagator : public control::BatchStatePropagator
+{
+public:
+    myBatchStatePropagator(const control::SpaceInformationPtr &si) : control::BatchStatePropagator(si)
+    {
+    }
+
+    void propagateValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                         const Eigen::Ref<const Eigen::MatrixXd> &controls,
+                         const Eigen::Ref<const Eigen::VectorXd> &durations,
+                         Eigen::Ref<Eigen::MatrixXd> results) const override
+    {
+        results.leftCols(2) = states.leftCols(2) + (controls.array().colwise() * durations.array()).matrix();
+        results.rightCols(2) = controls;
+
+        const base::RealVectorBounds &bounds = si_->getStateSpace()->as<base::RealVectorStateSpace>()->getBounds();
+        for (unsigned int j = 0; j < 4; ++j)
+            results.col(j) = results.col(j).cwiseMax(bounds.low[j]).cwiseMin(bounds.high[j]);
+    }
+};
+
+/** A batch propagator for a control space whose values cannot be put in a
+    matrix, so it has to propagate one state at a time */
+class discreteBatchStatePropagator : public control::BatchStatePropagator
+{
+public:
+    discreteBatchStatePropagator(const control::SpaceInformationPtr &si, bool single)
+      : control::BatchStatePropagator(si), single_(single)
+    {
+    }
+
+    void propagateValues(const Eigen::Ref<const Eigen::MatrixXd> & /*states*/,
+                         const Eigen::Ref<const Eigen::MatrixXd> & /*controls*/,
+                         const Eigen::Ref<const Eigen::VectorXd> & /*durations*/,
+                         Eigen::Ref<Eigen::MatrixXd> /*results*/) const override
+    {
+        BOOST_FAIL("discrete controls cannot be propagated in batches");
+    }
+
+    void propagate(const base::State *state, const control::Control *control, double duration,
+                   base::State *result) const override
+    {
+        if (!single_)
+        {
+            control::BatchStatePropagator::propagate(state, control, duration, result);
+            return;
+        }
+        result->as<base::RealVectorStateSpace::StateType>()->values[0] =
+            state->as<base::RealVectorStateSpace::StateType>()->values[0] +
+            duration * control->as<control::DiscreteControlSpace::ControlType>()->value;
+    }
+
+private:
+    bool single_;
+};
+
 class myProjectionEvaluator : public base::ProjectionEvaluator
 {
 public:
@@ -165,6 +226,57 @@ public:
     }
 };
 
+/** Batch version of myProjectionEvaluator that checks every batch against
+    the projections of the individual states */
+class myBatchProjectionEvaluator : public base::BatchProjectionEvaluator
+{
+public:
+    myBatchProjectionEvaluator(const base::StateSpacePtr &space, const std::vector<double> &cellSizes)
+      : base::BatchProjectionEvaluator(space), single_(space, cellSizes), stateSpace_(space), state_(space->allocState())
+    {
+        setCellSizes(cellSizes);
+    }
+
+    ~myBatchProjectionEvaluator() override
+    {
+        stateSpace_->freeState(state_);
+    }
+
+    unsigned int getDimension() const override
+    {
+        return 2;
+    }
+
+    void projectValues(const Eigen::Ref<const Eigen::MatrixXd> &states,
+                       Eigen::Ref<Eigen::MatrixXd> projections) const override
+    {
+        projections = states.leftCols(2);
+
+        ++batches;
+        largestBatch = std::max<std::size_t>(largestBatch, states.rows());
+        std::vector<double> reals(states.cols());
+        Eigen::VectorXd projection(2);
+        for (Eigen::Index i = 0; i < states.rows(); ++i)
+        {
+            Eigen::Map<Eigen::RowVectorXd>(reals.data(), reals.size()) = states.row(i);
+            stateSpace_->copyFromReals(state_, reals);
+            single_.project(state_, projection);
+            if (projection != projections.row(i).transpose())
+                ++mismatches;
+        }
+    }
+
+    mutable unsigned int batches{0};
+    mutable std::size_t largestBatch{0};
+    mutable unsigned int mismatches{0};
+
+private:
+    myProjectionEvaluator single_;
+    // keep the space alive: the test holds on to this evaluator after the planner is gone
+    base::StateSpacePtr stateSpace_;
+    base::State *state_;
+};
+
 /** Space information */
 control::SpaceInformationPtr mySpaceInformation(Environment2D &env)
 {
@@ -327,6 +439,21 @@ protected:
     }
 };
 
+class RRTBatchTest : public TestPlanner
+{
+protected:
+    base::PlannerPtr newPlanner(const control::SpaceInformationPtr &si) override
+    {
+        // try several controls per extension; they are all propagated together
+        si->setStatePropagator(std::make_shared<myBatchStatePropagator>(si));
+        si->setDirectedControlSamplerAllocator([](const control::SpaceInformation *si)
+                                               { return std::make_shared<control::SimpleDirectedControlSampler>(si, 5); });
+        auto rrt(std::make_shared<control::RRT>(si));
+        rrt->setIntermediateStates(false);
+        return rrt;
+    }
+};
+
 class RRTIntermediateTest : public TestPlanner
 {
 protected:
@@ -427,6 +554,24 @@ protected:
     }
 };
 
+class KPIECEBatchTest : public TestPlanner
+{
+public:
+    std::shared_ptr<myBatchProjectionEvaluator> projection;
+
+protected:
+    base::PlannerPtr newPlanner(const control::SpaceInformationPtr &si) override
+    {
+        auto kpiece(std::make_shared<control::KPIECE1>(si));
+
+        std::vector<double> cdim = {1, 1};
+        projection = std::make_shared<myBatchProjectionEvaluator>(si->getStateSpace(), cdim);
+        kpiece->setProjectionEvaluator(projection);
+
+        return kpiece;
+    }
+};
+
 class ESTTest : public TestPlanner
 {
 protected:
@@ -515,6 +660,110 @@ protected:
     bool verbose;
 };
 
+
+BOOST_FIXTURE_TEST_CASE(control_BatchPropagation, PlanTest)
+{
+    control::SpaceInformationPtr si = mySpaceInformation(env);
+    auto batchPropagator(std::make_shared<myBatchStatePropagator>(si));
+    base::StateSamplerPtr sampler = si->allocStateSampler();
+    control::ControlSamplerPtr controlSampler = si->allocControlSampler();
+    RNG rng;
+
+    const unsigned int n = 50;
+    std::vector<base::State *> states(n), results(n), batchResults(n);
+    std::vector<control::Control *> controls(n);
+    std::vector<int> steps(n);
+    si->allocStates(states);
+    si->allocStates(results);
+    si->allocStates(batchResults);
+    for (unsigned int i = 0; i < n; ++i)
+    {
+        do
+            sampler->sampleUniform(states[i]);
+        while (!si->isValid(states[i]));
+        controls[i] = si->allocControl();
+        controlSampler->sample(controls[i]);
+        steps[i] = rng.uniformInt(-25, 25);
+    }
+
+    // propagate one state at a time with the same dynamics
+    std::vector<unsigned int> stepsTaken(n);
+    for (unsigned int i = 0; i < n; ++i)
+        stepsTaken[i] = si->propagateWhileValid(states[i], controls[i], steps[i], results[i]);
+
+    si->setStatePropagator(batchPropagator);
+    std::vector<unsigned int> batchStepsTaken;
+    si->propagateWhileValid(std::vector<const base::State *>(states.begin(), states.end()),
+                            std::vector<const control::Control *>(controls.begin(), controls.end()), steps,
+                            batchResults, batchStepsTaken);
+
+    BOOST_CHECK_EQUAL(batchStepsTaken.size(), n);
+    for (unsigned int i = 0; i < n; ++i)
+    {
+        BOOST_CHECK_EQUAL(stepsTaken[i], batchStepsTaken[i]);
+        for (unsigned int j = 0; j < 4; ++j)
+            BOOST_CHECK_SMALL((*results[i]->as<base::RealVectorStateSpace::StateType>())[j] -
+                                  (*batchResults[i]->as<base::RealVectorStateSpace::StateType>())[j],
+                              1e-9);
+        si->freeControl(controls[i]);
+    }
+
+    si->freeStates(states);
+    si->freeStates(results);
+    si->freeStates(batchResults);
+}
+
+BOOST_AUTO_TEST_CASE(control_BatchPropagationDiscreteControls)
+{
+    auto space(std::make_shared<base::RealVectorStateSpace>(1));
+    space->setBounds(-10, 10);
+    auto si(std::make_shared<control::SpaceInformation>(
+        space, std::make_shared<control::DiscreteControlSpace>(space, 0, 2)));
+    si->setStateValidityChecker([](const base::State *) { return true; });
+    si->setStatePropagator(std::make_shared<discreteBatchStatePropagator>(si, true));
+    si->setup();
+
+    const unsigned int n = 3;
+    std::vector<base::State *> states(n), results(n);
+    std::vector<control::Control *> controls(n);
+    si->allocStates(states);
+    si->allocStates(results);
+    for (unsigned int i = 0; i < n; ++i)
+    {
+        states[i]->as<base::RealVectorStateSpace::StateType>()->values[0] = i;
+        controls[i] = si->allocControl();
+        controls[i]->as<control::DiscreteControlSpace::ControlType>()->value = i;
+    }
+
+    // the batch falls back to propagating one state at a time
+    si->getStatePropagator()->propagateStates(std::vector<const base::State *>(states.begin(), states.end()),
+                                              std::vector<const control::Control *>(controls.begin(), controls.end()),
+                                              std::vector<double>(n, 0.5), results);
+    for (unsigned int i = 0; i < n; ++i)
+        BOOST_CHECK_EQUAL(results[i]->as<base::RealVectorStateSpace::StateType>()->values[0], 1.5 * i);
+
+    // without an implementation of propagate() for single states, this is an error
+    discreteBatchStatePropagator batchOnly(si, false);
+    BOOST_CHECK_THROW(batchOnly.propagate(states[0], controls[0], 0.5, results[0]), Exception);
+
+    for (auto &control : controls)
+        si->freeControl(control);
+    si->freeStates(states);
+    si->freeStates(results);
+}
+
+BOOST_FIXTURE_TEST_CASE(control_BatchProjection, PlanTest)
+{
+    // KPIECE1 projects all states along a motion at once; the projections
+    // must be the same as those of the individual states
+    KPIECEBatchTest test;
+    BOOST_CHECK(test.execute(env));
+    BOOST_REQUIRE(test.projection);
+    BOOST_CHECK(test.projection->batches > 0);
+    BOOST_CHECK(test.projection->largestBatch > 1);
+    BOOST_CHECK_EQUAL(test.projection->mismatches, 0u);
+}
+
 BOOST_FIXTURE_TEST_SUITE(MyPlanTestFixture, PlanTest)
 
 #define MACHINE_SPEED_FACTOR 1.0
@@ -531,6 +780,7 @@ BOOST_FIXTURE_TEST_SUITE(MyPlanTestFixture, PlanTest)
     }
 
 OMPL_PLANNER_TEST(RRT, 99.0, 0.05)
+OMPL_PLANNER_TEST(RRTBatch, 99.0, 0.05)
 OMPL_PLANNER_TEST(RRTIntermediate, 99.0, 0.25)
 OMPL_PLANNER_TEST(KPIECE, 99.0, 0.05)
 OMPL_PLANNER_TEST(EST, 99.0, 0.05)
@@ -41,9 +41,14 @@ from os.path import abspath, dirname, join
 sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'py-bindings'))
 from functools import partial
 from time import perf_counter
-from math import fabs
+from math import fabs, cos, sin
 import unittest
 import copy
+import pickle
+try:
+    import numpy as np
+except ImportError:
+    np = None
 import ompl.util as ou
 import ompl.base as ob
 import ompl.control as oc
@@ -104,6 +109,17 @@ class MyProjectionEvaluator(ob.ProjectionEvaluator):
         projection[0] = state[0]
         projection[1] = state[1]
 
+class MyBatchProjectionEvaluator(ob.BatchProjectionEvaluator):
+    def __init__(self, space, cellSizes):
+        super(MyBatchProjectionEvaluator, self).__init__(space)
+        self.setCellSizes(cellSizes)
+
+    def getDimension(self):
+        return 2
+
+    def projectValues(self, states, projections):
+        projections[:, :] = states[:, :2]
+
 class MyStatePropagator(oc.StatePropagator):
     def propagate(self, state, control, duration, result):
         result[0] = state[0] + duration*control[0]
@@ -111,6 +127,11 @@ class MyStatePropagator(oc.StatePropagator):
         result[2] = control[0]
         result[3] = control[1]
 
+class MyBatchStatePropagator(oc.BatchStatePropagator):
+    def propagateValues(self, states, controls, durations, results):
+        results[:, :2] = states[:, :2] + durations[:, None] * controls
+        results[:, 2:] = controls
+
 class TestPlanner(object):
 
     def execute(self, env, time, pathLength, show=False):
@@ -200,6 +221,12 @@ class RRTTest(TestPlanner):
         planner = oc.RRT(si)
         return planner
 
+class RRTBatchTest(TestPlanner):
+    def newplanner(self, si):
+        si.setStatePropagator(MyBatchStatePropagator(si))
+        planner = oc.RRT(si)
+        return planner
+
 class ESTTest(TestPlanner):
     def newplanner(self, si):
         planner = oc.EST(si)
@@ -269,6 +296,15 @@ class KPIECE1Test(TestPlanner):
         planner.setProjectionEvaluator(ope)
         return planner
 
+class KPIECE1BatchTest(TestPlanner):
+    def newplanner(self, si):
+        planner = oc.KPIECE1(si)
+        cdim = ou.vectorDouble()
+        cdim.extend([1, 1])
+        ope = MyBatchProjectionEvaluator(si.getStateSpace(), cdim)
+        planner.setProjectionEvaluator(ope)
+        return planner
+
 class PlanTest(unittest.TestCase):
     def setUp(self):
         self.env = Environment(dirname(abspath(__file__))+'/../../tests/resources/env1.txt')
@@ -305,6 +341,13 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 5)
         self.assertTrue(avglength < 100.0)
 
+    def testControl_RRTBatch(self):
+        planner = RRTBatchTest()
+        (success, avgruntime, avglength) = self.runPlanTest(planner)
+        self.assertTrue(success >= 99.0)
+        self.assertTrue(avgruntime < 5)
+        self.assertTrue(avglength < 100.0)
+
     def testControl_EST(self):
         planner = ESTTest()
         (success, avgruntime, avglength) = self.runPlanTest(planner)
@@ -319,6 +362,13 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 2.5)
         self.assertTrue(avglength < 100.0)
 
+    def testControl_KPIECE1Batch(self):
+        planner = KPIECE1BatchTest()
+        (success, avgruntime, avglength) = self.runPlanTest(planner)
+        self.assertTrue(success >= 99.0)
+        self.assertTrue(avgruntime < 2.5)
+        self.assertTrue(avglength < 100.0)
+
     def testControl_SyclopRRT(self):
         planner = SyclopRRTTest()
         (success, avgruntime, avglength) = self.runPlanTest(planner)
@@ -333,9 +383,144 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 2.5)
         self.assertTrue(avglength < 100.0)
 
+class PathArrayTest(unittest.TestCase):
+    def checkToFromArray(self, setup):
+        space = ob.SE2StateSpace()
+        bounds = ob.RealVectorBounds(2)
+        bounds.setLow(-1)
+        bounds.setHigh(1)
+        space.setBounds(bounds)
+        if setup:
+            space.setup()
+        cspace = oc.RealVectorControlSpace(space, 2)
+        cspace.setBounds(-1, 1)
+        si = oc.SpaceInformation(space, cspace)
+        state = ob.State(space)
+        states = []
+        for _ in range(5):
+            state.random()
+            states.append([state().getX(), state().getY(), state().getYaw()])
+        controls = [[.1 * i, -.2 * i] for i in range(4)]
+        durations = [.5 + i for i in range(4)]
+        path = oc.PathControl.fromArray(si, states, controls, durations)
+        self.assertEqual(path.getStateCount(), 5)
+        self.assertEqual(path.getControlCount(), 4)
+        self.assertAlmostEqual(path.length(), sum(durations))
+        for i in range(5):
+            self.assertEqual(path.getState(i).getX(), states[i][0])
+            self.assertEqual(path.getState(i).getY(), states[i][1])
+            self.assertEqual(path.getState(i).getYaw(), states[i][2])
+        states2, controls2, durations2 = path.toArray()
+        self.assertEqual(states2.shape, (5, 3))
+        self.assertEqual(controls2.shape, (4, 2))
+        self.assertEqual(durations2.shape, (4,))
+        self.assertEqual(states2.tolist(), states)
+        self.assertEqual(controls2.tolist(), controls)
+        self.assertEqual(durations2.tolist(), durations)
+        path2 = oc.PathControl.fromArray(si, states2, controls2, durations2)
+        states3, controls3, durations3 = path2.toArray()
+        self.assertEqual(states3.tolist(), states)
+        self.assertEqual(controls3.tolist(), controls)
+        self.assertEqual(durations3.tolist(), durations)
+        # there should be one control and duration less than there are states
+        self.assertRaises(ValueError, oc.PathControl.fromArray, si, states, controls[:3], durations)
+        self.assertRaises(ValueError, oc.PathControl.fromArray, si, states, controls, durations[:3])
+
+    def testToFromArray(self):
+        self.checkToFromArray(True)
+
+    def testToFromArrayWithoutSetup(self):
+        # the value locations of the state space are only computed by setup()
+        self.checkToFromArray(False)
+
+class PickleTest(unittest.TestCase):
+    def testPathControl(self):
+        space = ob.SE2StateSpace()
+        bounds = ob.RealVectorBounds(2)
+        bounds.setLow(-1)
+        bounds.setHigh(1)
+        space.setBounds(bounds)
+        cspace = oc.RealVectorControlSpace(space, 2)
+        cbounds = ob.RealVectorBounds(2)
+        cbounds.setLow(-.5)
+        cbounds.setHigh(.5)
+        cspace.setBounds(cbounds)
+        si = oc.SpaceInformation(space, cspace)
+        si.setPropagationStepSize(.05)
+        states = [[0., 0., 0.], [.1, .2, .3], [.2, .3, .4]]
+        controls = [[.1, .2], [.3, .4]]
+        path = oc.PathControl.fromArray(si, states, controls, [.1, .2])
+        path2 = pickle.loads(pickle.dumps(path))
+        si2 = path2.getSpaceInformation()
+        self.assertEqual(si2.getPropagationStepSize(), .05)
+        self.assertEqual(list(si2.getControlSpace().getBounds().high), [.5, .5])
+        states2, controls2, durations2 = path2.toArray()
+        self.assertEqual(states2.tolist(), states)
+        self.assertEqual(controls2.tolist(), controls)
+        self.assertEqual(durations2.tolist(), [.1, .2])
+
+
+def oscillatorODE(q, u):
+    # harmonic oscillator with frequency u
+    return np.stack([q[:, 1], -u[:, 0] ** 2 * q[:, 0]], axis=1)
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class ODENumPySolverTest(unittest.TestCase):
+    def setUp(self):
+        space = ob.RealVectorStateSpace(2)
+        space.setBounds(-10., 10.)
+        cspace = oc.RealVectorControlSpace(space, 1)
+        cspace.setBounds(.5, 2.)
+        self.si = oc.SpaceInformation(space, cspace)
+        self.si.setPropagationStepSize(.1)
+
+    def testSolve(self):
+        solver = oc.ODENumPySolver(self.si, oscillatorODE, atol=1e-9, rtol=1e-9)
+        rng = np.random.default_rng(1)
+        q0 = rng.normal(size=(100, 2))
+        w = rng.uniform(.5, 2., size=100)
+        T = rng.uniform(-2., 2., size=100)
+
+        def exact(t):
+            return np.stack([q0[:, 0] * np.cos(w * t) + q0[:, 1] / w * np.sin(w * t),
+                             -q0[:, 0] * w * np.sin(w * t) + q0[:, 1] * np.cos(w * t)], axis=1)
+
+        q1, dense = solver.solve(q0, w[:, None], T, dense=True)
+        self.assertLess(np.abs(q1 - exact(T)).max(), 1e-7)
+        for fraction in [0., .3, .75, 1.]:
+            self.assertLess(np.abs(dense(fraction * T) - exact(fraction * T)).max(), 1e-7)
+
+    def testNonFinite(self):
+        # integration must stop instead of retrying steps with NaN errors forever
+        for value in [np.nan, np.inf]:
+            solver = oc.ODENumPySolver(self.si, lambda q, u: np.full_like(q, value))
+            with self.assertRaises(RuntimeError):
+                solver.solve([[1., 0.]], [[1.]], [1.])
+        def blowUp(q, u):
+            qdot = q ** 2
+            qdot[q[:, 0] > 1e3] = np.nan
+            return qdot
+        solver = oc.ODENumPySolver(self.si, blowUp)
+        with self.assertRaises(RuntimeError):
+            solver.solve([[1., 1.], [0., 0.]], [[1.], [1.]], [2., 2.])
+
+    def testStatePropagator(self):
+        solver = oc.ODENumPySolver(self.si, oscillatorODE)
+        self.si.setStatePropagator(solver.getStatePropagator())
+        self.si.setup()
+        state = ob.State(self.si.getStateSpace())
+        state[0], state[1] = 1., 0.
+        result = ob.State(self.si.getStateSpace())
+        control = self.si.allocControl()
+        control[0] = 1.
+        self.si.propagate(state(), control, 10, result())
+        self.assertAlmostEqual(result[0], cos(1.), 5)
+        self.assertAlmostEqual(result[1], -sin(1.), 5)
+        self.si.freeControl(control)
 
 def suite():
-    suites = (unittest.makeSuite(PlanTest))
+    suites = (unittest.makeSuite(PlanTest), unittest.makeSuite(PathArrayTest),
+              unittest.makeSuite(PickleTest), unittest.makeSuite(ODENumPySolverTest))
     return unittest.TestSuite(suites)
 
 if __name__ == '__main__':
@@ -40,6 +40,7 @@
 #include <fstream>
 
 #include <ompl/base/Constraint.h>
+#include <ompl/base/BatchConstraint.h>
 #include <ompl/base/ConstrainedSpaceInformation.h>
 #include <ompl/base/spaces/constraint/ConstrainedStateSpace.h>
 #include <ompl/base/spaces/constraint/AtlasStateSpace.h>
@@ -406,6 +407,55 @@ protected:
     }
 };
 
+// Same as Sphere, but evaluated at many points at once and without an
+// analytic Jacobian
+class BatchSphere : public ob::BatchConstraint
+{
+public:
+    BatchSphere() : ob::BatchConstraint(3, 1)
+    {
+    }
+
+    void functions(const Eigen::Ref<const Eigen::MatrixXd> &x, Eigen::Ref<Eigen::MatrixXd> out) const override
+    {
+        ++calls;
+        out.col(0) = x.rowwise().norm().array() - 1;
+    }
+
+    mutable unsigned int calls{0};
+};
+
+BOOST_AUTO_TEST_CASE(batch_constraint)
+{
+    Sphere sphere;
+    BatchSphere batchSphere;
+    Eigen::MatrixXd x(Eigen::MatrixXd::Random(10, 3));
+    Eigen::MatrixXd f(10, 1), j(10, 3), j1(1, 3);
+    Eigen::VectorXd f1(1);
+
+    batchSphere.functions(x, f);
+    BOOST_CHECK_EQUAL(batchSphere.calls, 1u);
+    batchSphere.jacobians(x, j);
+    BOOST_CHECK_EQUAL(batchSphere.calls, 2u);
+    for (Eigen::Index i = 0; i < x.rows(); ++i)
+    {
+        sphere.function(x.row(i).transpose(), f1);
+        BOOST_CHECK_CLOSE(f(i, 0), f1[0], 1e-9);
+        sphere.jacobian(x.row(i).transpose(), j1);
+        BOOST_CHECK_SMALL((j.row(i) - j1).norm(), 1e-6);
+        // the single point versions give the same result
+        batchSphere.function(x.row(i).transpose(), f1);
+        BOOST_CHECK_CLOSE(f(i, 0), f1[0], 1e-9);
+        batchSphere.jacobian(x.row(i).transpose(), j1);
+        BOOST_CHECK_SMALL((j.row(i) - j1).norm(), 1e-12);
+    }
+
+    Eigen::VectorXd y = x.row(0).transpose();
+    BOOST_CHECK(batchSphere.project(y));
+    BOOST_CHECK(batchSphere.isSatisfied(y));
+    BOOST_CHECK_SMALL(y.norm() - 1, 1e-4);
+}
+
 BOOST_FIXTURE_TEST_SUITE(MyPlanTestFixture, PlanTest)
 
 #ifndef MACHINE_SPEED_FACTOR
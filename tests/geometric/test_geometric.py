@@ -42,11 +42,18 @@ sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'py-bindin
 from functools import partial
 from time import perf_counter
 from math import fabs
+from tempfile import TemporaryDirectory
+from unittest import mock
+import asyncio
+import os
 import unittest
 import copy
+import pickle
+import ompl
 import ompl.util as ou
 import ompl.base as ob
 import ompl.geometric as og
+import ompl.tools as ot
 from ompl.util import setLogLevel, LogLevel
 
 SOLUTION_TIME = 10.0
@@ -335,14 +342,12 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 0.5)
         self.assertTrue(avglength < 100.0)
 
-    # need to make bindings threadsafe
-    # see http://wiki.python.org/moin/boost.python/HowTo#MultithreadingSupportformyfunction
-    # def testGeometric_pRRT(self):
-    #     planner = pRRTTest()
-    #     (success, avgruntime, avglength) = self.runPlanTest(planner)
-    #     self.assertTrue(success >= 99.0)
-    #     self.assertTrue(avgruntime < 2.5)
-    #     self.assertTrue(avglength < 100.0)
+    def testGeometric_pRRT(self):
+        planner = pRRTTest()
+        (success, avgruntime, avglength) = self.runPlanTest(planner)
+        self.assertTrue(success >= 99.0)
+        self.assertTrue(avgruntime < 2.5)
+        self.assertTrue(avglength < 100.0)
 
     def testGeometric_LazyRRT(self):
         planner = LazyRRTTest()
@@ -358,14 +363,12 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 0.1)
         self.assertTrue(avglength < 100.0)
 
-    # need to make bindings threadsafe
-    # see http://wiki.python.org/moin/boost.python/HowTo#MultithreadingSupportformyfunction
-    # def testGeometric_pSBL(self):
-    #     planner = pSBLTest()
-    #     (success, avgruntime, avglength) = self.runPlanTest(planner)
-    #     self.assertTrue(success >= 99.0)
-    #     self.assertTrue(avgruntime < 0.1)
-    #     self.assertTrue(avglength < 100.0)
+    def testGeometric_pSBL(self):
+        planner = pSBLTest()
+        (success, avgruntime, avglength) = self.runPlanTest(planner)
+        self.assertTrue(success >= 99.0)
+        self.assertTrue(avgruntime < 0.1)
+        self.assertTrue(avglength < 100.0)
 
     def testGeometric_KPIECE1(self):
         planner = KPIECE1Test()
@@ -395,8 +398,216 @@ class PlanTest(unittest.TestCase):
         self.assertTrue(avgruntime < 2.0)
         self.assertTrue(avglength < 100.0)
 
+class PathArrayTest(unittest.TestCase):
+    def checkToFromArray(self, setup):
+        space = ob.SE2StateSpace()
+        bounds = ob.RealVectorBounds(2)
+        bounds.setLow(-1)
+        bounds.setHigh(1)
+        space.setBounds(bounds)
+        si = ob.SpaceInformation(space)
+        if setup:
+            si.setup()
+        path = og.PathGeometric(si)
+        state = ob.State(space)
+        for _ in range(5):
+            state.random()
+            path.append(state())
+        array = path.toArray()
+        self.assertEqual(array.shape, (5, 3))
+        for i in range(5):
+            self.assertAlmostEqual(array[i][0], path.getState(i).getX())
+            self.assertAlmostEqual(array[i][1], path.getState(i).getY())
+            self.assertAlmostEqual(array[i][2], path.getState(i).getYaw())
+        path2 = og.PathGeometric.fromArray(si, array)
+        self.assertEqual(path2.getStateCount(), 5)
+        for i in range(5):
+            self.assertAlmostEqual(space.distance(path.getState(i), path2.getState(i)), 0.)
+        self.assertRaises(ValueError, og.PathGeometric.fromArray, si, array[:, :2])
+
+    def testToFromArray(self):
+        self.checkToFromArray(True)
+
+    def testToFromArrayWithoutSetup(self):
+        # the value locations of the state space are only computed by setup()
+        self.checkToFromArray(False)
+
+    def testPlannerDataToFromArrays(self):
+        space = ob.RealVectorStateSpace(2)
+        space.setBounds(0, 1)
+        ss = og.SimpleSetup(space)
+        ss.setStateValidityChecker(ob.StateValidityCheckerFn(lambda state: True))
+        start = ob.State(space)
+        goal = ob.State(space)
+        start[0], start[1], goal[0], goal[1] = .1, .1, .9, .9
+        ss.setStartAndGoalStates(start, goal)
+        ss.setPlanner(og.PRM(ss.getSpaceInformation()))
+        ss.solve(.1)
+        pd = ob.PlannerData(ss.getSpaceInformation())
+        ss.getPlannerData(pd)
+        pd.computeEdgeWeights()
+        states, (weights, indices, indptr), isStart, isGoal = pd.toArrays()
+        n = pd.numVertices()
+        self.assertEqual(states.shape, (n, 2))
+        self.assertEqual(len(indptr), n + 1)
+        self.assertEqual(len(indices), pd.numEdges())
+        self.assertEqual(list(isStart), [pd.isStartVertex(i) for i in range(n)])
+        self.assertEqual(list(isGoal), [pd.isGoalVertex(i) for i in range(n)])
+        for i in range(n):
+            for k in range(indptr[i], indptr[i + 1]):
+                self.assertTrue(pd.edgeExists(i, int(indices[k])))
+        pd2 = ob.PlannerData(ss.getSpaceInformation())
+        pd2.fromArrays(states, (weights, indices, indptr), isStart, isGoal)
+        self.assertEqual((pd2.numVertices(), pd2.numEdges()), (n, pd.numEdges()))
+        states2, (weights2, indices2, indptr2), isStart2, isGoal2 = pd2.toArrays()
+        self.assertTrue((states == states2).all())
+        self.assertTrue((weights == weights2).all())
+        self.assertTrue((indices == indices2).all())
+        self.assertTrue((indptr == indptr2).all())
+        self.assertTrue((isStart == isStart2).all() and (isGoal == isGoal2).all())
+
+    def testPlannerDataFromArraysWithoutSetup(self):
+        space = ob.RealVectorStateSpace(2)
+        si = ob.SpaceInformation(space)
+        pd = ob.PlannerData(si)
+        states = [[0., 0.], [1., 0.], [1., 1.]]
+        weights, indices = [1., 2.], [1, 2]
+        pd.fromArrays(states, (weights, indices, [0, 1, 2, 2]))
+        self.assertEqual((pd.numVertices(), pd.numEdges()), (3, 2))
+        self.assertEqual(pd.toArrays()[0].tolist(), states)
+        # malformed graphs are rejected before any edge is added
+        for indptr in ([0, 2, 1, 2], [0, 1, 2, 3], [1, 1, 2, 2]):
+            self.assertRaises(ValueError, pd.fromArrays, states, (weights, indices, indptr))
+        self.assertRaises(ValueError, pd.fromArrays, states, (weights, [1, 3], [0, 1, 2, 2]))
+
+    def testPickle(self):
+        space = ob.SE2StateSpace()
+        bounds = ob.RealVectorBounds(2)
+        bounds.setLow(-1)
+        bounds.setHigh(1)
+        space.setBounds(bounds)
+        ss = og.SimpleSetup(space)
+        ss.setStateValidityChecker(ob.StateValidityCheckerFn(lambda state: True))
+        start = ob.State(space)
+        goal = ob.State(space)
+        start.random()
+        goal.random()
+        ss.setStartAndGoalStates(start, goal)
+        self.assertTrue(ss.solve(1.))
+        path = ss.getSolutionPath()
+        path.interpolate(20)
+        path2 = pickle.loads(pickle.dumps(path))
+        self.assertEqual(path2.getStateCount(), 20)
+        self.assertTrue((path2.toArray() == path.toArray()).all())
+        pd = ob.PlannerData(ss.getSpaceInformation())
+        ss.getPlannerData(pd)
+        pd2 = pickle.loads(pickle.dumps(pd))
+        self.assertEqual((pd2.numVertices(), pd2.numEdges()), (pd.numVertices(), pd.numEdges()))
+        self.assertEqual(pd2.numStartVertices(), pd.numStartVertices())
+        self.assertTrue((pd2.toArrays()[0] == pd.toArrays()[0]).all())
+
+def makeProcessParallelPlanProblem():
+    # problem factory for ProcessParallelPlanTest; it needs to be defined at
+    # the top level of the module, so that it can be pickled
+    space = ob.RealVectorStateSpace(2)
+    space.setBounds(0, 1)
+    ss = og.SimpleSetup(space)
+    ss.setStateValidityChecker(ob.StateValidityCheckerFn(
+        lambda state: not (.4 < state[0] < .6 and state[1] < .8)))
+    start = ob.State(space)
+    goal = ob.State(space)
+    start[0], start[1], goal[0], goal[1] = .1, .1, .9, .1
+    ss.setStartAndGoalStates(start, goal)
+    return ss
+
+class ProcessParallelPlanTest(unittest.TestCase):
+    def testFirstSolution(self):
+        pp = ot.ProcessParallelPlan(makeProcessParallelPlanProblem, processes=2)
+        pp.addPlanner(og.RRTConnect)
+        pp.addPlanner(og.RRTConnect)
+        self.assertTrue(pp.solve(5.))
+        ss = pp.getSimpleSetup()
+        self.assertTrue(ss.haveExactSolutionPath())
+        self.assertTrue(ss.getSolutionPath().check())
+        self.assertTrue(1 <= len(pp.getResults()) <= 2)
+
+    def testHybridization(self):
+        pp = ot.ProcessParallelPlan(makeProcessParallelPlanProblem)
+        for seed in range(1, 4):
+            pp.addPlanner(og.RRT, seed)
+        self.assertTrue(pp.solve(5., hybridize=True))
+        results = pp.getResults()
+        self.assertEqual(len(results), 3)
+        self.assertEqual([result['seed'] for result in results], [1, 2, 3])
+        path = pp.getSimpleSetup().getSolutionPath()
+        self.assertTrue(path.check())
+        self.assertLessEqual(path.length(), min(result['path'].length() for result in results) + 1e-9)
+
+class AsyncSolveTest(unittest.TestCase):
+    def testSolveAsync(self):
+        async def solveBoth():
+            setups = [makeProcessParallelPlanProblem() for _ in range(2)]
+            for ss in setups:
+                ss.setPlanner(og.RRTConnect(ss.getSpaceInformation()))
+            return setups, await asyncio.gather(*[ss.solveAsync(5.) for ss in setups])
+        setups, results = asyncio.run(solveBoth())
+        for ss, result in zip(setups, results):
+            self.assertTrue(result)
+            self.assertTrue(ss.haveExactSolutionPath())
+            self.assertTrue(ss.getSolutionPath().check())
+
+    def testCancel(self):
+        ss = makeProcessParallelPlanProblem()
+        ss.setPlanner(og.RRTstar(ss.getSpaceInformation()))
+        async def cancelSolve():
+            task = asyncio.ensure_future(ss.solveAsync(60.))
+            await asyncio.sleep(.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        start = perf_counter()
+        asyncio.run(cancelSolve())
+        self.assertLess(perf_counter() - start, 10.)
+
+    def testIntermediateSolutions(self):
+        ss = makeProcessParallelPlanProblem()
+        ss.setPlanner(og.RRTstar(ss.getSpaceInformation()))
+        async def collect():
+            return [(states, cost) async for states, cost in ss.intermediateSolutions(1.)]
+        solutions = asyncio.run(collect())
+        self.assertGreater(len(solutions), 0)
+        costs = [cost.value() for _, cost in solutions]
+        self.assertEqual(costs, sorted(costs, reverse=True))
+        self.assertGreater(len(solutions[0][0]), 1)
+
+class PlanningAlgorithmsTest(unittest.TestCase):
+    def testParamsCache(self):
+        with TemporaryDirectory() as cacheDir, mock.patch.dict(os.environ, {'OMPL_CACHE_DIR': cacheDir}):
+            planners = ompl.PlanningAlgorithms(og)
+            params = planners.getPlannerParams('ompl.geometric.RRT')
+            self.assertIn('range', params)
+            self.assertIsNone(planners.getPlannerParams('ompl.geometric.PathGeometric'))
+            # only the requested planner has been instantiated, and only
+            # planners are cached
+            self.assertEqual(list(planners.plannerMap), ['ompl.geometric.RRT'])
+            # a new instance loads the parameters from the cache
+            planners = ompl.PlanningAlgorithms(og)
+            with mock.patch.object(planners, 'computeParams', side_effect=AssertionError):
+                self.assertEqual(planners.getPlannerParams('ompl.geometric.RRT'), params)
+            allPlanners = planners.getPlanners()
+            self.assertEqual(allPlanners['ompl.geometric.RRT'], params)
+            self.assertIn('ompl.geometric.PRM', allPlanners)
+            self.assertNotIn('ompl.geometric.SimpleSetup', planners.plannerMap)
+            self.assertNotIn('ompl.geometric.__builtins__', planners.plannerMap)
+            planners = ompl.PlanningAlgorithms(og)
+            with mock.patch.object(planners, 'computeParams', side_effect=AssertionError):
+                self.assertEqual(planners.getPlanners(), allPlanners)
+
 def suite():
-    suites = (unittest.makeSuite(PlanTest))
+    suites = (unittest.makeSuite(PlanTest), unittest.makeSuite(PathArrayTest),
+              unittest.makeSuite(PlanningAlgorithmsTest),
+              unittest.makeSuite(ProcessParallelPlanTest),
+              unittest.makeSuite(AsyncSolveTest))
     return unittest.TestSuite(suites)
 
 if __name__ == '__main__':
@@ -36,6 +36,7 @@
 
 #include <boost/python.hpp>
 #include <memory>
+#include <thread>
 #include "../../py-bindings/py_std_function.hpp"
 
 namespace bp = boost::python;
@@ -58,6 +59,15 @@ std::function<IntClass(const IntClass&,int)>     intClassFun2_obj(intClassFun2);
 std::function<IntClass(IntClass&,int&)>          intClassFun3_obj(intClassFun3);
 std::function<void(IntClass*,int)>               intClassFun4_obj(intClassFun4);
 
+// call a function object from another thread while the calling thread has released the GIL
+IntClass intClassFunInThread(const std::function<IntClass(IntClass,int)>& f, IntClass i, int j)
+{
+    detail::ReleaseGIL nogil;
+    IntClass result;
+    std::thread([&] { result = f(i, j); }).join();
+    return result;
+}
+
 
 BOOST_PYTHON_MODULE(py_std_function)
 {
@@ -75,4 +85,8 @@ BOOST_PYTHON_MODULE(py_std_function)
     bp::scope().attr("intClassFun2_obj") = intClassFun2_obj;
     bp::scope().attr("intClassFun3_obj") = intClassFun3_obj;
     bp::scope().attr("intClassFun4_obj") = intClassFun4_obj;
+
+    bp::def("intClassFunInThread", &intClassFunInThread);
+
+    detail::exposeCallbackStatistics(true);
 }
\ No newline at end of file
@@ -37,6 +37,7 @@
 # Author: Mark Moll
 
 import unittest
+import py_std_function
 from py_std_function import *
 
 def myIntFun0(i, j):
@@ -93,6 +94,35 @@ class TestPyStdFunction(unittest.TestCase):
         f = IntClassFun4_t(myIntFun2)
         f(i, 3)
         self.assertEqual(i.value, 3)
+    def testCallFromOtherThread(self):
+        i = IntClass(0)
+        f = IntClassFun0_t(myIntFun0)
+        j = intClassFunInThread(f, i, 4)
+        self.assertEqual((i.value, j.value), (0, 4))
+        # the Python function must outlive the original wrapper
+        del f
+        f = IntClassFun0_t(lambda i, j: myIntFun0(i, j + 1))
+        j = intClassFunInThread(f, i, 4)
+        self.assertEqual(j.value, 5)
+    def testCallbackStatistics(self):
+        i = IntClass(0)
+        f = IntClassFun0_t(myIntFun0)
+        f(i, 1)
+        self.assertEqual(py_std_function._getCallbackStatistics(), {})
+        py_std_function._setCallbackStatisticsEnabled(True)
+        self.assertTrue(py_std_function._isCallbackStatisticsEnabled())
+        f(i, 1)
+        intClassFunInThread(f, i, 2)
+        IntClassFun4_t(myIntFun2)(i, 3)
+        py_std_function._setCallbackStatisticsEnabled(False)
+        f(i, 1)
+        stats = py_std_function._getCallbackStatistics()
+        self.assertEqual(sorted(stats.keys()), ['IntClassFun0_t', 'IntClassFun4_t'])
+        self.assertEqual(stats['IntClassFun0_t'][0], 2)
+        self.assertEqual(stats['IntClassFun4_t'][0], 1)
+        self.assertGreater(stats['IntClassFun0_t'][1], 0.)
+        py_std_function._clearCallbackStatistics()
+        self.assertEqual(py_std_function._getCallbackStatistics(), {})
 
 
 def suite():
@@ -37,6 +37,7 @@
 # Author: Mark Moll
 
 import unittest
+import subprocess
 import sys
 from os.path import abspath, dirname, join
 sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'py-bindings'))
@@ -71,8 +72,46 @@ class TestRNG(unittest.TestCase):
         for j in c:
             self.assertTrue(j > float(V) / float(N) / 3.)
 
+class TestLazyImport(unittest.TestCase):
+    def loadedModules(self, code):
+        # run in a fresh interpreter, so that no extension module is loaded yet
+        return subprocess.check_output([sys.executable, '-c',
+            'import sys\nsys.path = %r\n%s\n'
+            'print(" ".join(sys.modules))' % (sys.path, code)],
+            universal_newlines=True).split()
+
+    def testImportDoesNotLoadExtensions(self):
+        loaded = self.loadedModules('import ompl.base, ompl.geometric, ompl.control')
+        for module in ('ompl.base._base', 'ompl.geometric._geometric', 'ompl.control._control'):
+            self.assertNotIn(module, loaded)
+        self.assertNotIn('asyncio', loaded)
+
+    def testImportDoesNotLoadPythonHelpers(self):
+        loaded = self.loadedModules('import ompl.tools')
+        self.assertNotIn('ompl.tools.multiplan', loaded)
+        self.assertNotIn('multiprocessing', loaded)
+        loaded = self.loadedModules('import ompl.tools\nompl.tools.ProcessParallelPlan')
+        self.assertIn('ompl.tools.multiplan', loaded)
+        self.assertNotIn('ompl.tools._tools', loaded)
+        loaded = self.loadedModules('import ompl.control')
+        self.assertNotIn('ompl.control.odesolver', loaded)
+        self.assertNotIn('numpy', loaded)
+
+    def testAttributeAccessLoadsExtensions(self):
+        loaded = self.loadedModules('import ompl\nompl.geometric.RRT')
+        for module in ('ompl.util._util', 'ompl.base._base', 'ompl.geometric._geometric'):
+            self.assertIn(module, loaded)
+        self.assertNotIn('ompl.control._control', loaded)
+
+    def testStarImport(self):
+        namespace = {}
+        exec('from ompl.base import *', namespace)
+        self.assertIn('RealVectorStateSpace', namespace)
+        self.assertIn('SpaceInformation', namespace)
+
 def suite():
-    suites = (unittest.makeSuite(TestRNG, 'test'))
+    suites = (unittest.makeSuite(TestRNG, 'test'),
+              unittest.makeSuite(TestLazyImport, 'test'))
     return unittest.TestSuite(suites)
 
 if __name__ == '__main__':